@@ -17,6 +17,9 @@ Date: August 2025
 """
 
 import asyncio
+import gc
+import logging
+import sys
 import time
 
 try:
@@ -38,74 +41,255 @@ except ImportError:
     ENHANCED_CONFIG_AVAILABLE = False
 
 
-import statistics
+import bisect
 import psutil
 import os
+import types
 from collections import deque
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+from itertools import islice
+from dataclasses import dataclass, field, fields, replace
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
+from operator import itemgetter
 
 # Import from our enhanced intelligence layer (conditional)
 try:
     from enhanced_metrics import collect_predictive_metrics
     from resource_monitor import take_quick_resource_snapshot
     from event_loop_monitor import get_event_loop_monitor
+    from advanced_optimization_utils import start_resource_poller
 
     ENHANCED_MODULES_AVAILABLE = True
 except ImportError:
     ENHANCED_MODULES_AVAILABLE = False
 
+# Optional NumPy acceleration for trend analysis (falls back to pure Python)
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Numba JIT for the per-snapshot scoring kernels
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
 
 # Global state for adaptive scaling engine
-_performance_history: deque = deque(maxlen=100)
 _scaling_history: deque = deque(maxlen=50)
 _last_scaling_time: float = 0.0
 _current_worker_count: int = 50  # Start with proactive scaling initial value
-_scaling_config: Dict[str, Any] = {}
+_scaling_config: "ScalingConfig" = None
+_EMPTY_METRICS: Dict[str, Any] = {}  # Shared read-only default for missing sections
+
+# CPU usage is sampled without blocking (interval=None returns the usage since
+# the previous call) and shared by the collectors within one scaling cycle.
+_CPU_SAMPLE_TTL_SECONDS = 1.0
+_cpu_sample_time: float = float("-inf")
+_cpu_sample_percent: float = 0.0
+psutil.cpu_percent(interval=None)  # Prime the counter so the first sample is valid
+
+# System facts that never (cpu_count, disk root) or rarely (disk usage,
+# process count) change are read once or refreshed on a slow TTL.
+_CPU_COUNT: int = psutil.cpu_count() or 1
+_DISK_ROOT = "C:\\" if os.name == "nt" else "/"
+_DISK_USAGE_TTL_SECONDS = 30.0
+_PROCESS_COUNT_TTL_SECONDS = 60.0
+
+# Shorter monitor intervals only burn CPU: a scaling decision needs fresh
+# metrics and is throttled by the cooldown anyway
+MIN_MONITOR_INTERVAL_SECONDS = 1.0
+
+# While consecutive cycles make no change the monitor backs off by this
+# factor per quiet cycle, up to a multiple of its base interval
+_MONITOR_BACKOFF_FACTOR = 1.5
+_MONITOR_MAX_BACKOFF_MULTIPLIER = 8.0
+
+# Garbage collector thresholds for long scraping runs: a larger young
+# generation keeps automatic full sweeps rare, since the page optimizers
+# already schedule their own gated full collections
+_GC_THRESHOLDS = (10000, 50, 50)
+_disk_usage_time: float = float("-inf")
+_disk_usage: Any = None
+_process_count_time: float = float("-inf")
+_process_count: int = 0
+
+# Stand-in disk usage when the disk cannot be queried
+_MOCK_DISK = types.SimpleNamespace(
+    total=1 << 30,  # 1GB fallback
+    free=1 << 29,  # 512MB fallback
+    percent=50.0,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ScalingConfig:
+    """
+    Proactive adaptive scaling configuration.
 
+    Thresholds are read as attributes in the decision loop. Item access,
+    get() and to_dict() keep the older dict-style callers working.
+    """
 
-def initialize_adaptive_scaling() -> Dict[str, Any]:
+    # Proactive Worker Range Configuration (20-200, starting at 50)
+    min_workers: int = 20  # Minimum workers for baseline performance
+    max_workers: int = 200  # Maximum workers for peak load (updated from 100)
+    initial_workers: int = 50  # Starting worker count for immediate capacity
+    # Proactive Performance Thresholds (aggressive scaling up)
+    scale_up_success_rate_threshold: float = 0.90  # Scale up more aggressively
+    scale_down_success_rate_threshold: float = 0.80  # More conservative scale down
+    scale_up_response_time_threshold: float = 1.5  # Scale up faster on slower response
+    scale_down_response_time_threshold: float = 6.0  # More tolerant before scaling down
+    # Safe Resource Thresholds (stay within limits)
+    max_memory_usage_percent: float = 85.0
+    max_cpu_usage_percent: float = 90.0
+    scale_down_memory_threshold: float = 60.0
+    scale_down_cpu_threshold: float = 70.0
+    # Proactive Scaling Behavior (centralized configuration)
+    scale_up_increment: int = 10  # Scale up by 10 workers (matches enhanced config)
+    scale_down_increment: int = 5  # Scale down by 5 workers (matches enhanced config)
+    scaling_cooldown_seconds: float = 45.0  # Shorter cooldown for responsiveness
+    # Monitoring Intervals (more frequent monitoring)
+    monitoring_interval: float = ScraperConfig.SCALING_MONITOR_INTERVAL  # Every 20s
+    optimization_interval: float = 180.0  # Optimize every 3 minutes
+    # Proactive Safety Limits
+    emergency_scale_down_threshold: float = 95.0  # CPU/Memory %
+    max_scale_up_per_interval: int = 10  # Allow larger scale ups
+    max_scale_down_per_interval: int = 5  # Control scale downs
+    # Performance History
+    performance_history_size: int = 100
+    trend_analysis_window_minutes: int = 15
+
+    def __post_init__(self):
+        if self.monitoring_interval < MIN_MONITOR_INTERVAL_SECONDS:
+            raise ValueError(
+                f"monitoring_interval must be at least "
+                f"{MIN_MONITOR_INTERVAL_SECONDS}s, got {self.monitoring_interval}"
+            )
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def keys(self):
+        """Setting names, so dict(config) works as it did for the dict config."""
+        return self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup for callers that still treat the config as a dict."""
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def copy(self) -> Dict[str, Any]:
+        """Return a mutable dictionary copy, as the former dict config did."""
+        return self.to_dict()
+
+
+def initialize_adaptive_scaling() -> ScalingConfig:
     """Initialize the adaptive scaling system. Alias for initialize_scaling_config."""
     return initialize_scaling_config()
 
 
 # Initialize default scaling configuration
-def initialize_scaling_config() -> Dict[str, Any]:
+def initialize_scaling_config() -> ScalingConfig:
     """Initialize proactive adaptive scaling configuration for maximum output."""
-    return {
-        # Proactive Worker Range Configuration (20-200, starting at 50)
-        "min_workers": 20,  # Minimum workers for baseline performance
-        "max_workers": 200,  # Maximum workers for peak load (updated from 100)
-        "initial_workers": 50,  # Starting worker count for immediate capacity
-        # Proactive Performance Thresholds (aggressive scaling up)
-        "scale_up_success_rate_threshold": 0.90,  # Scale up more aggressively
-        "scale_down_success_rate_threshold": 0.80,  # More conservative scale down
-        "scale_up_response_time_threshold": 1.5,  # Scale up faster on slower response
-        "scale_down_response_time_threshold": 6.0,  # More tolerant before scaling down
-        # Safe Resource Thresholds (stay within limits)
-        "max_memory_usage_percent": 85.0,
-        "max_cpu_usage_percent": 90.0,
-        "scale_down_memory_threshold": 60.0,
-        "scale_down_cpu_threshold": 70.0,
-        # Proactive Scaling Behavior (centralized configuration)
-        "scale_up_increment": 10,  # Scale up by 10 workers (matches enhanced config)
-        "scale_down_increment": 5,  # Scale down by 5 workers (matches enhanced config)
-        "scaling_cooldown_seconds": 45.0,  # Shorter cooldown for responsiveness
-        # Monitoring Intervals (more frequent monitoring)
-        "monitoring_interval": ScraperConfig.SCALING_MONITOR_INTERVAL,  # Check every 20 seconds
-        "optimization_interval": 180.0,  # Optimize every 3 minutes
-        # Proactive Safety Limits
-        "emergency_scale_down_threshold": 95.0,  # CPU/Memory %
-        "max_scale_up_per_interval": 10,  # Allow larger scale ups
-        "max_scale_down_per_interval": 5,  # Control scale downs
-        # Performance History
-        "performance_history_size": 100,
-        "trend_analysis_window_minutes": 15,
-    }
+    return ScalingConfig()
+
+
+def _python_score(
+    success_rate: float,
+    avg_page_load_time: float,
+    resource_blocking_efficiency: float,
+    cache_hit_ratio: float,
+    browser_pool_utilization: float,
+    worker_utilization: float,
+    error_rate: float,
+) -> float:
+    """Calculate overall performance score (0-1, higher is better)."""
+    # Weighted scoring components
+    success_weight = 0.3
+    speed_weight = 0.25
+    efficiency_weight = 0.2
+    resource_weight = 0.15
+    stability_weight = 0.1
+
+    # Success score
+    success_score = success_rate
+
+    # Speed score (inverse of page load time, normalized to 0-1)
+    speed_score = max(0.0, min(1.0, 1.0 - (avg_page_load_time / 30.0)))
+
+    # Efficiency score (combination of resource blocking and cache hits)
+    efficiency_score = (resource_blocking_efficiency + cache_hit_ratio) / 2.0
+
+    # Resource utilization score (optimal around 70-80%)
+    optimal_utilization = 0.75
+    utilization_avg = (browser_pool_utilization + worker_utilization) / 2.0
+    resource_score = (
+        1.0 - abs(utilization_avg - optimal_utilization) / optimal_utilization
+    )
+
+    # Stability score (low error rate)
+    stability_score = 1.0 - error_rate
+
+    # Calculate weighted final score
+    final_score = (
+        success_score * success_weight
+        + speed_score * speed_weight
+        + efficiency_score * efficiency_weight
+        + resource_score * resource_weight
+        + stability_score * stability_weight
+    )
+
+    return max(0.0, min(1.0, final_score))
+
+
+def _python_capacity(
+    memory_usage_percent: float, cpu_usage_percent: float, disk_usage_percent: float
+) -> float:
+    """Calculate how much scaling headroom is available (0-1)."""
+    memory_headroom = max(0.0, (100.0 - memory_usage_percent) / 100.0)
+    cpu_headroom = max(0.0, (100.0 - cpu_usage_percent) / 100.0)
+    disk_headroom = max(0.0, (100.0 - disk_usage_percent) / 100.0)
+
+    # Weighted average with memory being most important
+    capacity = memory_headroom * 0.5 + cpu_headroom * 0.3 + disk_headroom * 0.2
+
+    return max(0.0, min(1.0, capacity))
+
+
+# JIT-compile the scoring kernels when Numba is installed
+if NUMBA_AVAILABLE:
+    _score_kernel = njit(cache=True, fastmath=True)(_python_score)
+    _capacity_kernel = njit(cache=True, fastmath=True)(_python_capacity)
+else:
+    _score_kernel = _python_score
+    _capacity_kernel = _python_capacity
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PerformanceMetrics:
     """Comprehensive performance metrics for scaling decisions."""
 
@@ -124,52 +308,58 @@ class PerformanceMetrics:
     disk_io_mb_per_sec: float = 0.0
     resource_blocking_efficiency: float = 0.0
     cache_hit_ratio: float = 0.0
+    # Derived from the fields above once, at construction time
+    performance_score: float = field(default=0.0, init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "performance_score", self._score())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values for status reports, including performance_score."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
     def calculate_performance_score(self) -> float:
+        """Return the overall performance score (0-1, higher is better)."""
+        return self.performance_score
+
+    def _score(self) -> float:
         """Calculate overall performance score (0-1, higher is better)."""
-        # Weighted scoring components
-        success_weight = 0.3
-        speed_weight = 0.25
-        efficiency_weight = 0.2
-        resource_weight = 0.15
-        stability_weight = 0.1
-
-        # Success score
-        success_score = self.success_rate
-
-        # Speed score (inverse of page load time, normalized to 0-1)
-        speed_score = max(0, min(1, 1 - (self.avg_page_load_time / 30.0)))
-
-        # Efficiency score (combination of resource blocking and cache hits)
-        efficiency_score = (
-            self.resource_blocking_efficiency + self.cache_hit_ratio
-        ) / 2.0
-
-        # Resource utilization score (optimal around 70-80%)
-        optimal_utilization = 0.75
-        utilization_avg = (
-            self.browser_pool_utilization + self.worker_utilization
-        ) / 2.0
-        resource_score = (
-            1.0 - abs(utilization_avg - optimal_utilization) / optimal_utilization
+        return _score_kernel(
+            float(self.success_rate),
+            float(self.avg_page_load_time),
+            float(self.resource_blocking_efficiency),
+            float(self.cache_hit_ratio),
+            float(self.browser_pool_utilization),
+            float(self.worker_utilization),
+            float(self.error_rate),
         )
 
-        # Stability score (low error rate)
-        stability_score = 1.0 - self.error_rate
 
-        # Calculate weighted final score
-        final_score = (
-            success_score * success_weight
-            + speed_score * speed_weight
-            + efficiency_score * efficiency_weight
-            + resource_score * resource_weight
-            + stability_score * stability_weight
-        )
+# System load ladder over the busier of memory and CPU usage (percent). The
+# memory limits in ResourceAvailability use the same bounds, so a "high" load
+# level and the scale-up memory ceiling can never disagree.
+_LOAD_LOW_PERCENT = 50.0  # Below this on both: "low"
+_LOAD_HIGH_PERCENT = 80.0  # Above this: "high"
+_LOAD_CRITICAL_PERCENT = 90.0  # Above this: "critical"
+_LOAD_LEVEL_BOUNDS = (_LOAD_HIGH_PERCENT, _LOAD_CRITICAL_PERCENT)
+_LOAD_LEVELS = ("normal", "high", "critical")
+
+# Remaining per-resource limits for scaling safety checks (percent)
+_SCALE_UP_MAX_CPU_PERCENT = 85.0
+_SCALE_UP_MAX_DISK_PERCENT = 90.0
+_SCALE_DOWN_CPU_PERCENT = 95.0
+_SCALE_DOWN_DISK_PERCENT = 95.0
+
 
-        return max(0, min(1, final_score))
+def _classify_system_load(memory_percent: float, cpu_percent: float) -> str:
+    """Bucket system load into low, normal, high or critical."""
+    worst = max(memory_percent, cpu_percent)
+    if worst < _LOAD_LOW_PERCENT:
+        return "low"
+    return _LOAD_LEVELS[bisect.bisect_left(_LOAD_LEVEL_BOUNDS, worst)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceAvailability:
     """System resource availability metrics for scaling decisions."""
 
@@ -185,38 +375,72 @@ class ResourceAvailability:
     network_bandwidth_mbps: float = 0.0
     active_processes: int = 0
     system_load_level: str = "normal"  # low, normal, high, critical
+    # Derived from the fields above once, at construction time
+    scaling_capacity: float = field(default=0.0, init=False, compare=False)
+    safe_to_scale_up: bool = field(default=False, init=False, compare=False)
+    scale_down_required: bool = field(default=False, init=False, compare=False)
 
-    def calculate_scaling_capacity(self) -> float:
-        """Calculate how much scaling headroom is available (0-1)."""
-        memory_headroom = max(0, (100 - self.memory_usage_percent) / 100)
-        cpu_headroom = max(0, (100 - self.cpu_usage_percent) / 100)
-        disk_headroom = max(0, (100 - self.disk_usage_percent) / 100)
+    def __post_init__(self):
+        object.__setattr__(self, "scaling_capacity", self._capacity())
+        object.__setattr__(self, "safe_to_scale_up", self._safe_to_scale_up())
+        object.__setattr__(self, "scale_down_required", self._scale_down_required())
 
-        # Weighted average with memory being most important
-        capacity = memory_headroom * 0.5 + cpu_headroom * 0.3 + disk_headroom * 0.2
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values for status reports, including the derived scaling flags."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
-        return max(0, min(1, capacity))
+    def calculate_scaling_capacity(self) -> float:
+        """Return how much scaling headroom is available (0-1)."""
+        return self.scaling_capacity
 
     def is_safe_to_scale_up(self) -> bool:
         """Determine if it's safe to scale up workers."""
-        return (
-            self.memory_usage_percent < 80
-            and self.cpu_usage_percent < 85
-            and self.disk_usage_percent < 90
-            and self.system_load_level in ["low", "normal"]
-        )
+        return self.safe_to_scale_up
 
     def requires_scale_down(self) -> bool:
         """Determine if we must scale down due to resource pressure."""
+        return self.scale_down_required
+
+    def _capacity(self) -> float:
+        """Calculate how much scaling headroom is available (0-1)."""
+        return _capacity_kernel(
+            float(self.memory_usage_percent),
+            float(self.cpu_usage_percent),
+            float(self.disk_usage_percent),
+        )
+
+    def _safe_to_scale_up(self) -> bool:
+        """Check resource headroom for adding workers."""
+        return (
+            self.memory_usage_percent < _LOAD_HIGH_PERCENT
+            and self.cpu_usage_percent < _SCALE_UP_MAX_CPU_PERCENT
+            and self.disk_usage_percent < _SCALE_UP_MAX_DISK_PERCENT
+            and self.system_load_level in ("low", "normal")
+        )
+
+    def _scale_down_required(self) -> bool:
+        """Check for resource pressure that forces a scale down."""
         return (
-            self.memory_usage_percent > 90
-            or self.cpu_usage_percent > 95
-            or self.disk_usage_percent > 95
+            self.memory_usage_percent > _LOAD_CRITICAL_PERCENT
+            or self.cpu_usage_percent > _SCALE_DOWN_CPU_PERCENT
+            or self.disk_usage_percent > _SCALE_DOWN_DISK_PERCENT
             or self.system_load_level == "critical"
         )
 
 
-@dataclass
+# Minimal resource info reported when system metrics cannot be collected
+_FALLBACK_RESOURCE_AVAILABILITY = ResourceAvailability(
+    timestamp=0.0,
+    total_memory_gb=16.0,  # Reasonable default
+    available_memory_gb=8.0,
+    memory_usage_percent=50.0,
+    cpu_count=4,
+    cpu_usage_percent=25.0,
+    system_load_level="normal",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ScalingDecision:
     """Represents a scaling decision with reasoning."""
 
@@ -230,11 +454,106 @@ class ScalingDecision:
     resource_capacity: float
     safety_override: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain copy of the decision for the recent-decisions status list."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PerformanceHistoryBuffer:
+    """
+    Fixed-size ring buffer holding the numeric columns used by trend analysis.
+
+    Rows are stored structure-of-arrays style (one float64 row per snapshot)
+    in a preallocated NumPy array when available, or in preallocated Python
+    lists otherwise. Once full, each append overwrites the oldest row.
 
-def get_scaling_config() -> Dict[str, Any]:
+    Running sums of the performance score are updated on every append and
+    eviction, so the variance of the whole buffer is available in O(1).
+    """
+
+    COLUMNS = ("timestamp", "performance_score", "success_rate", "avg_page_load_time")
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self._head = 0  # Row the next append writes to
+        self._count = 0
+        self._score_sum = 0.0
+        self._score_sq_sum = 0.0
+        if NUMPY_AVAILABLE:
+            self._rows = np.empty((capacity, len(self.COLUMNS)), dtype=np.float64)
+        else:
+            self._rows = [[0.0] * len(self.COLUMNS) for _ in range(capacity)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, metrics: PerformanceMetrics) -> None:
+        """Record the trend-relevant fields of a performance snapshot."""
+        score = metrics.performance_score
+        if self._count == self.capacity:
+            evicted = float(self._rows[self._head][1])
+            self._score_sum -= evicted
+            self._score_sq_sum -= evicted * evicted
+        else:
+            self._count += 1
+        self._score_sum += score
+        self._score_sq_sum += score * score
+
+        self._rows[self._head] = [
+            metrics.timestamp,
+            score,
+            metrics.success_rate,
+            metrics.avg_page_load_time,
+        ]
+        self._head = (self._head + 1) % self.capacity
+
+    def score_variance(self) -> float:
+        """Sample variance of the performance score over the whole buffer."""
+        count = self._count
+        if count < 2:
+            return 0.0
+        variance = (self._score_sq_sum - self._score_sum * self._score_sum / count) / (
+            count - 1
+        )
+        # Guard against tiny negative values from floating-point cancellation
+        return max(0.0, variance)
+
+    def _ordered_rows(self):
+        """Return the stored rows oldest-first."""
+        if self._count < self.capacity:
+            return self._rows[: self._count]
+        if NUMPY_AVAILABLE:
+            return np.concatenate((self._rows[self._head :], self._rows[: self._head]))
+        return self._rows[self._head :] + self._rows[: self._head]
+
+    def columns_since(self, cutoff_time: float) -> Tuple[Any, Any, Any, Any]:
+        """
+        Get the columns of all rows newer than cutoff_time, oldest-first.
+
+        Returns:
+            Tuple of (timestamps, performance_scores, success_rates,
+            response_times) as NumPy arrays or lists
+        """
+        # Timestamps are appended in increasing order, so the rows newer than
+        # the cutoff form a contiguous tail located by binary search.
+        rows = self._ordered_rows()
+        if NUMPY_AVAILABLE:
+            start = int(np.searchsorted(rows[:, 0], cutoff_time, side="right"))
+            recent = rows[start:]
+            return recent[:, 0], recent[:, 1], recent[:, 2], recent[:, 3]
+        start = bisect.bisect_right(rows, cutoff_time, key=itemgetter(0))
+        recent = rows[start:]
+        return tuple([row[i] for row in recent] for i in range(len(self.COLUMNS)))
+
+
+# Rolling performance history for trend analysis
+_performance_history = PerformanceHistoryBuffer(capacity=100)
+
+
+def get_scaling_config() -> ScalingConfig:
     """Get the current scaling configuration, integrating with enhanced config manager."""
     global _scaling_config
-    if not _scaling_config:
+    if _scaling_config is None:
         _scaling_config = initialize_scaling_config()
 
         # INTEGRATION: Override with enhanced config manager values if available
@@ -243,23 +562,26 @@ def get_scaling_config() -> Dict[str, Any]:
                 enhanced_config = get_dynamic_config()
                 if enhanced_config:
                     # Override scaling increments with centralized config
+                    overrides = {}
                     if "worker_scale_increment" in enhanced_config:
-                        _scaling_config["scale_up_increment"] = enhanced_config[
+                        overrides["scale_up_increment"] = enhanced_config[
                             "worker_scale_increment"
                         ]
                     if "worker_scale_decrement" in enhanced_config:
-                        _scaling_config["scale_down_increment"] = enhanced_config[
+                        overrides["scale_down_increment"] = enhanced_config[
                             "worker_scale_decrement"
                         ]
+                    _scaling_config = replace(_scaling_config, **overrides)
 
-                    print(
-                        f"🔧 ADAPTIVE SCALING: Integrated enhanced config - "
-                        f"scale_up_increment={_scaling_config['scale_up_increment']}, "
-                        f"scale_down_increment={_scaling_config['scale_down_increment']}"
+                    logger.debug(
+                        "Adaptive scaling integrated enhanced config - "
+                        "scale_up_increment=%s, scale_down_increment=%s",
+                        _scaling_config.scale_up_increment,
+                        _scaling_config.scale_down_increment,
                     )
             except Exception as e:
-                print(
-                    f"WARNING: ADAPTIVE SCALING: Failed to integrate enhanced config: {e}"
+                logger.warning(
+                    "Adaptive scaling failed to integrate enhanced config: %s", e
                 )
 
     return _scaling_config
@@ -268,73 +590,93 @@ def get_scaling_config() -> Dict[str, Any]:
 def update_scaling_config(updates: Dict[str, Any]) -> None:
     """Update scaling configuration with new values."""
     global _scaling_config
-    config = get_scaling_config()
-    config.update(updates)
-    _scaling_config = config
+    known = {f.name for f in fields(ScalingConfig)}
+    unknown = updates.keys() - known
+    if unknown:
+        logger.warning("Ignoring unknown scaling config keys: %s", sorted(unknown))
+    _scaling_config = replace(
+        get_scaling_config(),
+        **{key: value for key, value in updates.items() if key in known},
+    )
+
 
+def get_cpu_percent() -> float:
+    """
+    Get system CPU usage without blocking the event loop.
+
+    Uses psutil's non-blocking sampling and reuses the value for
+    _CPU_SAMPLE_TTL_SECONDS so both collectors in a cycle share one reading.
 
-def collect_performance_metrics() -> PerformanceMetrics:
+    Returns:
+        CPU usage percentage since the previous sample
+    """
+    global _cpu_sample_time, _cpu_sample_percent
+    now = time.monotonic()
+    if now - _cpu_sample_time >= _CPU_SAMPLE_TTL_SECONDS:
+        _cpu_sample_percent = psutil.cpu_percent(interval=None)
+        _cpu_sample_time = now
+    return _cpu_sample_percent
+
+
+def get_disk_usage() -> Any:
+    """Get disk usage for the system drive, refreshed every 30 seconds."""
+    global _disk_usage_time, _disk_usage
+    now = time.monotonic()
+    if now - _disk_usage_time >= _DISK_USAGE_TTL_SECONDS:
+        _disk_usage = psutil.disk_usage(_DISK_ROOT)
+        _disk_usage_time = now
+    return _disk_usage
+
+
+def get_process_count() -> int:
+    """Get the number of running processes, refreshed every 60 seconds."""
+    global _process_count_time, _process_count
+    now = time.monotonic()
+    if now - _process_count_time >= _PROCESS_COUNT_TTL_SECONDS:
+        _process_count = len(psutil.pids())
+        _process_count_time = now
+    return _process_count
+
+
+def collect_performance_metrics(tick_time: float = None) -> PerformanceMetrics:
     """
     Collect comprehensive performance metrics from enhanced intelligence layer.
 
+    Args:
+        tick_time: Timestamp of the current scaling cycle (defaults to now)
+
     Returns:
         PerformanceMetrics object with current system performance
     """
-    current_time = time.time()
+    current_time = time.time() if tick_time is None else tick_time
 
     # Get enhanced metrics from Step 1
     try:
-        enhanced_metrics = collect_predictive_metrics()
+        em = collect_predictive_metrics()
+        em_get = em.get
 
         # Extract performance data
-        pages_per_second = enhanced_metrics.get("performance_efficiency", {}).get(
-            "pages_per_second", 0.0
-        )
-        success_rate = enhanced_metrics.get("success_count", 0) / max(
-            1, enhanced_metrics.get("pages_processed", 1)
-        )
-        error_rate = enhanced_metrics.get("error_count", 0) / max(
-            1, enhanced_metrics.get("pages_processed", 1)
-        )
-        memory_usage_mb = enhanced_metrics.get("memory_usage_mb", 0.0)
-
-        # Get additional system metrics
-        cpu_percent = psutil.cpu_percent(
-            interval=1.0
-        )  # Use 1 second for accurate reading
-
-        # Calculate derived metrics
-        avg_page_load_time = enhanced_metrics.get("processing_time_ms", 0) / 1000.0
-        browser_pool_utilization = min(
-            1.0, enhanced_metrics.get("browser_pool_size", 0) / 10.0
-        )
-        worker_utilization = min(
-            1.0,
-            enhanced_metrics.get("active_workers", 0)
-            / max(1, get_current_worker_count()),
-        )
+        pages_processed = max(1, em_get("pages_processed", 1))
+        cache_hits = em_get("cache_hits", 0)
+        cache_misses = em_get("cache_misses", 1)
+        efficiency = em_get("performance_efficiency") or _EMPTY_METRICS
 
         return PerformanceMetrics(
             timestamp=current_time,
-            pages_per_second=pages_per_second,
-            avg_page_load_time=avg_page_load_time,
-            success_rate=success_rate,
-            error_rate=error_rate,
-            memory_usage_mb=memory_usage_mb,
-            cpu_usage_percent=cpu_percent,
-            browser_pool_utilization=browser_pool_utilization,
-            worker_utilization=worker_utilization,
-            queue_depth=enhanced_metrics.get("queue_size", 0),
-            active_connections=enhanced_metrics.get("browser_instances", 0),
-            resource_blocking_efficiency=enhanced_metrics.get(
-                "resource_block_rate", 0.0
-            ),
-            cache_hit_ratio=enhanced_metrics.get("cache_hits", 0)
-            / max(
-                1,
-                enhanced_metrics.get("cache_hits", 0)
-                + enhanced_metrics.get("cache_misses", 1),
+            pages_per_second=efficiency.get("pages_per_second", 0.0),
+            avg_page_load_time=em_get("processing_time_ms", 0) / 1000.0,
+            success_rate=em_get("success_count", 0) / pages_processed,
+            error_rate=em_get("error_count", 0) / pages_processed,
+            memory_usage_mb=em_get("memory_usage_mb", 0.0),
+            cpu_usage_percent=get_cpu_percent(),
+            browser_pool_utilization=min(1.0, em_get("browser_pool_size", 0) / 10.0),
+            worker_utilization=min(
+                1.0, em_get("active_workers", 0) / max(1, get_current_worker_count())
             ),
+            queue_depth=em_get("queue_size", 0),
+            active_connections=em_get("browser_instances", 0),
+            resource_blocking_efficiency=em_get("resource_block_rate", 0.0),
+            cache_hit_ratio=cache_hits / max(1, cache_hits + cache_misses),
         )
 
     except Exception:
@@ -344,44 +686,33 @@ def collect_performance_metrics() -> PerformanceMetrics:
             pages_per_second=0.0,
             avg_page_load_time=1.0,
             success_rate=0.9,
-            cpu_usage_percent=psutil.cpu_percent(
-                interval=1.0
-            ),  # Use 1 second for accurate reading
+            cpu_usage_percent=get_cpu_percent(),
             memory_usage_mb=psutil.virtual_memory().used / 1024 / 1024,
         )
 
 
-def collect_resource_availability() -> ResourceAvailability:
+def collect_resource_availability(tick_time: float = None) -> ResourceAvailability:
     """
     Collect system resource availability metrics.
 
+    Args:
+        tick_time: Timestamp of the current scaling cycle (defaults to now)
+
     Returns:
         ResourceAvailability object with current system resources
     """
-    current_time = time.time()
+    current_time = time.time() if tick_time is None else tick_time
 
     try:
         # Get system resource information
         memory = psutil.virtual_memory()
-        cpu_count = psutil.cpu_count()
-        cpu_percent = psutil.cpu_percent(
-            interval=1.0
-        )  # Use 1 second for accurate reading
+        cpu_percent = get_cpu_percent()
 
         # Disk usage (cross-platform)
         try:
-            if os.name == "nt":  # Windows
-                disk = psutil.disk_usage("C:\\")
-            else:  # Unix-like systems
-                disk = psutil.disk_usage("/")
+            disk = get_disk_usage()
         except Exception:
-
-            class MockDisk:
-                total = 1024**3  # 1GB fallback
-                free = 512**3  # 512MB fallback
-                percent = 50.0
-
-            disk = MockDisk()
+            disk = _MOCK_DISK
 
         # Load average (Unix-like systems)
         try:
@@ -393,51 +724,141 @@ def collect_resource_availability() -> ResourceAvailability:
         except Exception:
             load_avg = cpu_percent / 100.0
 
-        # Determine system load level
-        system_load_level = "normal"
-        if memory.percent > 90 or cpu_percent > 90:
-            system_load_level = "critical"
-        elif memory.percent > 80 or cpu_percent > 80:
-            system_load_level = "high"
-        elif memory.percent < 50 and cpu_percent < 50:
-            system_load_level = "low"
-
         return ResourceAvailability(
             timestamp=current_time,
             total_memory_gb=memory.total / 1024**3,
             available_memory_gb=memory.available / 1024**3,
             memory_usage_percent=memory.percent,
-            cpu_count=cpu_count,
+            cpu_count=_CPU_COUNT,
             cpu_usage_percent=cpu_percent,
             cpu_load_avg=load_avg,
             disk_free_gb=disk.free / 1024**3,
             disk_usage_percent=disk.percent,
             network_bandwidth_mbps=100.0,  # Default assumption
-            active_processes=len(psutil.pids()),
-            system_load_level=system_load_level,
+            active_processes=get_process_count(),
+            system_load_level=_classify_system_load(memory.percent, cpu_percent),
         )
 
     except Exception:
         # Fallback minimal resource info
-        return ResourceAvailability(
-            timestamp=current_time,
-            total_memory_gb=16.0,  # Reasonable default
-            available_memory_gb=8.0,
-            memory_usage_percent=50.0,
-            cpu_count=4,
-            cpu_usage_percent=25.0,
-            system_load_level="normal",
+        return replace(_FALLBACK_RESOURCE_AVAILABILITY, timestamp=current_time)
+
+
+def calculate_trend_slopes(
+    performance_scores: List[float],
+    success_rates: List[float],
+    response_times: List[float],
+    performance_variance: float = None,
+) -> Tuple[float, float, float, float]:
+    """
+    Calculate least-squares trend slopes for the three scaling series at once.
+
+    The x axis is the sample index, so the closed forms x_mean = (n-1)/2 and
+    sum((x - x_mean)**2) = n*(n**2 - 1)/12 are used instead of summing them.
+
+    Args:
+        performance_scores: Performance score per sample
+        success_rates: Success rate per sample
+        response_times: Average page load time per sample
+        performance_variance: Precomputed variance of performance_scores, if
+            the caller already has it
+
+    Returns:
+        Tuple of (performance_trend, success_trend, response_time_trend,
+        performance_variance)
+    """
+    n = len(performance_scores)
+    if n < 2:
+        return 0.0, 0.0, 0.0, 0.0
+
+    x_mean = (n - 1) / 2.0
+    denominator = n * (n * n - 1) / 12.0
+
+    if NUMPY_AVAILABLE:
+        series = np.array(
+            (performance_scores, success_rates, response_times), dtype=np.float64
+        )
+        centered = series - series.mean(axis=1, keepdims=True)
+        slopes = (centered * (np.arange(n) - x_mean)).sum(axis=1) / denominator
+        if performance_variance is None:
+            performance_variance = float((centered[0] ** 2).sum() / (n - 1))
+        return (
+            float(slopes[0]),
+            float(slopes[1]),
+            float(slopes[2]),
+            performance_variance,
+        )
+
+    # Scalar fallback when NumPy is unavailable
+    def slope(values):
+        y_mean = sum(values) / n
+        return sum((i - x_mean) * (values[i] - y_mean) for i in range(n)) / denominator
+
+    if performance_variance is None:
+        score_mean = sum(performance_scores) / n
+        performance_variance = sum(
+            (score - score_mean) ** 2 for score in performance_scores
+        ) / (n - 1)
+
+    return (
+        slope(performance_scores),
+        slope(success_rates),
+        slope(response_times),
+        performance_variance,
+    )
+
+
+# Savitzky-Golay first-derivative filter (window 11, polyorder 2). For a
+# quadratic fit the derivative at the window centre only depends on the linear
+# term, so the kernel reduces to k / sum(k**2) for k = -5..5.
+SAVGOL_WINDOW_LENGTH = 11
+_SAVGOL_HALF_WINDOW = SAVGOL_WINDOW_LENGTH // 2
+_SAVGOL_DERIVATIVE_KERNEL = tuple(
+    k / sum(j * j for j in range(-_SAVGOL_HALF_WINDOW, _SAVGOL_HALF_WINDOW + 1))
+    for k in range(-_SAVGOL_HALF_WINDOW, _SAVGOL_HALF_WINDOW + 1)
+)
+
+
+def smoothed_trend_slope(values: List[float]) -> float:
+    """
+    Average Savitzky-Golay smoothed first derivative of a series.
+
+    Damps sample-to-sample noise that would otherwise flip the sign of a raw
+    least-squares slope. Series shorter than SAVGOL_WINDOW_LENGTH fit in a
+    single window, where the filter equals the least-squares slope, so
+    callers should use calculate_trend_slopes for those.
+
+    Args:
+        values: Samples ordered oldest-first
+
+    Returns:
+        Mean smoothed slope per sample
+    """
+    if NUMPY_AVAILABLE:
+        derivatives = np.correlate(
+            np.asarray(values, dtype=np.float64), _SAVGOL_DERIVATIVE_KERNEL, "valid"
+        )
+        return float(derivatives.mean())
+
+    windows = len(values) - SAVGOL_WINDOW_LENGTH + 1
+    total = 0.0
+    for start in range(windows):
+        total += sum(
+            c * values[start + k] for k, c in enumerate(_SAVGOL_DERIVATIVE_KERNEL)
         )
+    return total / windows
 
 
 def analyze_performance_trends_for_scaling(
     lookback_minutes: int = 15,
+    tick_time: float = None,
 ) -> Dict[str, Any]:
     """
     Analyze performance trends from history to inform scaling decisions.
 
     Args:
         lookback_minutes: How far back to look for trend analysis
+        tick_time: Timestamp of the current scaling cycle (defaults to now)
 
     Returns:
         Dictionary with trend analysis results
@@ -451,10 +872,17 @@ def analyze_performance_trends_for_scaling(
         }
 
     # Get recent performance data
-    cutoff_time = time.time() - (lookback_minutes * 60)
-    recent_metrics = [m for m in _performance_history if m.timestamp > cutoff_time]
-
-    if len(recent_metrics) < 2:
+    if tick_time is None:
+        tick_time = time.time()
+    cutoff_time = tick_time - (lookback_minutes * 60)
+    (
+        timestamps,
+        performance_scores,
+        success_rates,
+        response_times,
+    ) = _performance_history.columns_since(cutoff_time)
+
+    if len(timestamps) < 2:
         return {
             "status": "insufficient_recent_data",
             "trend_direction": "stable",
@@ -462,31 +890,47 @@ def analyze_performance_trends_for_scaling(
             "recommendation": "no_change",
         }
 
-    # Calculate trends
-    performance_scores = [m.calculate_performance_score() for m in recent_metrics]
-    success_rates = [m.success_rate for m in recent_metrics]
-    response_times = [m.avg_page_load_time for m in recent_metrics]
-
-    # Linear trend analysis
-    def calculate_trend(values):
-        if len(values) < 2:
-            return 0.0
-        n = len(values)
-        x = list(range(n))
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
-
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
+    # When the window covers the whole buffer its running variance applies
+    window_variance = (
+        _performance_history.score_variance()
+        if len(timestamps) == len(_performance_history)
+        else None
+    )
 
-        if denominator == 0:
-            return 0.0
+    # Calculate trends
+    (
+        performance_trend,
+        success_trend,
+        response_time_trend,
+        performance_variance,
+    ) = calculate_trend_slopes(
+        performance_scores, success_rates, response_times, window_variance
+    )
 
-        return numerator / denominator
+    # Confidence compares the least-squares rise over the window with the
+    # residual spread around that same line: a clear slope through tight
+    # data scores near 1. Two points always fit exactly, so at least three
+    # are needed before the fit says anything.
+    n = len(timestamps)
+    confidence = 0.0
+    if n > 2:
+        residual_variance = max(
+            0.0,
+            (
+                performance_variance * (n - 1)
+                - performance_trend**2 * n * (n * n - 1) / 12.0
+            )
+            / (n - 2),
+        )
+        rise = abs(performance_trend) * (n - 1)
+        if rise > 0:
+            confidence = rise / (rise + residual_variance**0.5)
 
-    performance_trend = calculate_trend(performance_scores)
-    success_trend = calculate_trend(success_rates)
-    response_time_trend = calculate_trend(response_times)
+    # Smooth the slopes once there is more than one filter window of data
+    if n >= SAVGOL_WINDOW_LENGTH:
+        performance_trend = smoothed_trend_slope(performance_scores)
+        success_trend = smoothed_trend_slope(success_rates)
+        response_time_trend = smoothed_trend_slope(response_times)
 
     # Determine overall trend direction
     if performance_trend > 0.05 and success_trend > 0.02:
@@ -499,12 +943,6 @@ def analyze_performance_trends_for_scaling(
         trend_direction = "stable"
         recommendation = "maintain"
 
-    # Calculate confidence based on data consistency
-    performance_variance = (
-        statistics.variance(performance_scores) if len(performance_scores) > 1 else 0.0
-    )
-    confidence = max(0.0, min(1.0, 1.0 - performance_variance))
-
     return {
         "status": "analyzed",
         "trend_direction": trend_direction,
@@ -513,7 +951,7 @@ def analyze_performance_trends_for_scaling(
         "response_time_trend": response_time_trend,
         "confidence": confidence,
         "recommendation": recommendation,
-        "data_points": len(recent_metrics),
+        "data_points": len(timestamps),
         "analysis_window_minutes": lookback_minutes,
     }
 
@@ -529,9 +967,11 @@ def make_scaling_decision_simple(metrics_dict: Dict[str, Any]) -> Dict[str, Any]
         Dictionary with scaling decision
     """
     try:
+        tick_time = time.time()
+
         # Convert simple metrics to structured format
         performance_metrics = PerformanceMetrics(
-            timestamp=time.time(),
+            timestamp=tick_time,
             success_rate=metrics_dict.get("success_rate", 1.0),
             avg_page_load_time=metrics_dict.get(
                 "avg_processing_time", 2.0
@@ -545,7 +985,7 @@ def make_scaling_decision_simple(metrics_dict: Dict[str, Any]) -> Dict[str, Any]
         )
 
         resource_availability = ResourceAvailability(
-            timestamp=time.time(),
+            timestamp=tick_time,
             cpu_usage_percent=metrics_dict.get("cpu_usage_percent", 50.0),
             memory_usage_percent=metrics_dict.get("memory_usage_percent", 50.0),
             available_memory_gb=2.0,  # Convert MB to GB approximation
@@ -553,17 +993,13 @@ def make_scaling_decision_simple(metrics_dict: Dict[str, Any]) -> Dict[str, Any]
             network_bandwidth_mbps=30.0,
         )
 
-        trend_analysis = {
-            "performance_trend": "stable",
-            "resource_trend": "stable",
-            "recommendation": "no_change",  # Required field
-            "confidence": 0.8,
-            "trend_direction": "stable",
-        }
+        # Record the sample so trend analysis has history to work with
+        _performance_history.append(performance_metrics)
+        trend_analysis = analyze_performance_trends_for_scaling(tick_time=tick_time)
 
         # Make the actual scaling decision
         decision = make_scaling_decision(
-            performance_metrics, resource_availability, trend_analysis
+            performance_metrics, resource_availability, trend_analysis, tick_time
         )
 
         # Convert to simple dictionary format
@@ -588,6 +1024,7 @@ def make_scaling_decision(
     performance_metrics: PerformanceMetrics,
     resource_availability: ResourceAvailability,
     trend_analysis: Dict[str, Any],
+    tick_time: float = None,
 ) -> ScalingDecision:
     """
     Make an intelligent scaling decision based on all available data.
@@ -596,17 +1033,20 @@ def make_scaling_decision(
         performance_metrics: Current performance metrics
         resource_availability: Current resource availability
         trend_analysis: Performance trend analysis results
+        tick_time: Timestamp of the current scaling cycle (defaults to now)
 
     Returns:
         ScalingDecision with recommended action
     """
     config = get_scaling_config()
+    min_workers = config.min_workers
+    max_workers = config.max_workers
     current_workers = get_current_worker_count()
-    current_time = time.time()
+    current_time = time.time() if tick_time is None else tick_time
 
     # Check cooldown period
     time_since_last_scaling = current_time - _last_scaling_time
-    if time_since_last_scaling < config["scaling_cooldown_seconds"]:
+    if time_since_last_scaling < config.scaling_cooldown_seconds:
         return ScalingDecision(
             timestamp=current_time,
             action="no_change",
@@ -621,8 +1061,8 @@ def make_scaling_decision(
     # Emergency scale down check
     if resource_availability.requires_scale_down():
         target_workers = max(
-            config["min_workers"],
-            current_workers - config["max_scale_down_per_interval"],
+            min_workers,
+            current_workers - config.max_scale_down_per_interval,
         )
         return ScalingDecision(
             timestamp=current_time,
@@ -640,91 +1080,61 @@ def make_scaling_decision(
     performance_score = performance_metrics.calculate_performance_score()
     resource_capacity = resource_availability.calculate_scaling_capacity()
 
-    # Determine scaling action based on multiple factors
-    scale_up_signals = 0
-    scale_down_signals = 0
-    reasoning_parts = []
-
-    # Performance-based signals
-    if performance_metrics.success_rate >= config["scale_up_success_rate_threshold"]:
-        scale_up_signals += 1
-        reasoning_parts.append(
-            f"High success rate ({performance_metrics.success_rate:.2f})"
-        )
-    elif (
-        performance_metrics.success_rate <= config["scale_down_success_rate_threshold"]
-    ):
-        scale_down_signals += 1
-        reasoning_parts.append(
-            f"Low success rate ({performance_metrics.success_rate:.2f})"
-        )
+    # Evaluate every signal up front as 0/1 ints and sum them, so the common
+    # stable cycle runs without branching or building reasoning strings.
+    success_rate = performance_metrics.success_rate
+    response_time = performance_metrics.avg_page_load_time
+    trend_confident = trend_analysis["confidence"] > 0.6
+    trend_recommendation = trend_analysis["recommendation"]
 
-    # Response time signals
-    if (
-        performance_metrics.avg_page_load_time
-        <= config["scale_up_response_time_threshold"]
-    ):
-        scale_up_signals += 1
-        reasoning_parts.append(
-            f"Fast response time ({performance_metrics.avg_page_load_time:.1f}s)"
-        )
-    elif (
-        performance_metrics.avg_page_load_time
-        >= config["scale_down_response_time_threshold"]
-    ):
-        scale_down_signals += 1
-        reasoning_parts.append(
-            f"Slow response time ({performance_metrics.avg_page_load_time:.1f}s)"
-        )
+    up_success = int(success_rate >= config.scale_up_success_rate_threshold)
+    down_success = int(
+        not up_success and success_rate <= config.scale_down_success_rate_threshold
+    )
+    up_response = int(response_time <= config.scale_up_response_time_threshold)
+    down_response = int(
+        not up_response and response_time >= config.scale_down_response_time_threshold
+    )
+    up_resource = int(
+        resource_availability.is_safe_to_scale_up() and resource_capacity > 0.3
+    )
+    down_resource = int(not up_resource and resource_capacity < 0.2)
+    up_trend = int(trend_confident and trend_recommendation == "scale_up")
+    down_trend = int(trend_confident and trend_recommendation == "scale_down")
 
-    # Resource availability signals
-    if resource_availability.is_safe_to_scale_up() and resource_capacity > 0.3:
-        scale_up_signals += 1
-        reasoning_parts.append(f"Resources available ({resource_capacity:.1%})")
-    elif resource_capacity < 0.2:
-        scale_down_signals += 1
-        reasoning_parts.append(f"Low resource availability ({resource_capacity:.1%})")
-
-    # Trend analysis signals
-    if (
-        trend_analysis["recommendation"] == "scale_up"
-        and trend_analysis["confidence"] > 0.6
-    ):
-        scale_up_signals += 1
-        reasoning_parts.append(
-            f"Positive performance trend ({trend_analysis['trend_direction']})"
-        )
-    elif (
-        trend_analysis["recommendation"] == "scale_down"
-        and trend_analysis["confidence"] > 0.6
-    ):
-        scale_down_signals += 1
-        reasoning_parts.append(
-            f"Negative performance trend ({trend_analysis['trend_direction']})"
-        )
+    scale_up_signals = up_success + up_response + up_resource + up_trend
+    scale_down_signals = down_success + down_response + down_resource + down_trend
 
     # Make final decision
     if scale_up_signals > scale_down_signals and scale_up_signals >= 2:
         action = "scale_up"
-        target_workers = min(
-            config["max_workers"], current_workers + config["scale_up_increment"]
-        )
+        target_workers = min(max_workers, current_workers + config.scale_up_increment)
         confidence = min(1.0, scale_up_signals / 4.0)
     elif scale_down_signals > scale_up_signals and scale_down_signals >= 2:
         action = "scale_down"
-        target_workers = max(
-            config["min_workers"], current_workers - config["scale_down_increment"]
-        )
+        target_workers = max(min_workers, current_workers - config.scale_down_increment)
         confidence = min(1.0, scale_down_signals / 4.0)
     else:
         action = "no_change"
         target_workers = current_workers
         confidence = 0.8
-        reasoning_parts.append("Balanced signals - maintaining current level")
 
-    reasoning = (
-        "; ".join(reasoning_parts) if reasoning_parts else "No clear scaling signals"
-    )
+    if action == "no_change":
+        reasoning = "Balanced signals - maintaining current level"
+    else:
+        # Only a scaling action needs the human-readable explanation
+        trend_direction = trend_analysis.get("trend_direction")
+        signal_messages = (
+            (up_success, f"High success rate ({success_rate:.2f})"),
+            (down_success, f"Low success rate ({success_rate:.2f})"),
+            (up_response, f"Fast response time ({response_time:.1f}s)"),
+            (down_response, f"Slow response time ({response_time:.1f}s)"),
+            (up_resource, f"Resources available ({resource_capacity:.1%})"),
+            (down_resource, f"Low resource availability ({resource_capacity:.1%})"),
+            (up_trend, f"Positive performance trend ({trend_direction})"),
+            (down_trend, f"Negative performance trend ({trend_direction})"),
+        )
+        reasoning = "; ".join(message for flag, message in signal_messages if flag)
 
     return ScalingDecision(
         timestamp=current_time,
@@ -755,7 +1165,7 @@ def execute_scaling_decision(decision: ScalingDecision) -> bool:
 
     # Validate target worker count
     config = get_scaling_config()
-    if not (config["min_workers"] <= decision.target_workers <= config["max_workers"]):
+    if not (config.min_workers <= decision.target_workers <= config.max_workers):
         return False
 
     # Update global state
@@ -767,11 +1177,14 @@ def execute_scaling_decision(decision: ScalingDecision) -> bool:
     _scaling_history.append(decision)
 
     # Log the scaling action
-    print(
-        f"🔄 Scaling {decision.action}: {old_count} → {decision.target_workers} workers"
+    logger.info(
+        "Scaling %s: %d -> %d workers (confidence %.2f) - %s",
+        decision.action,
+        old_count,
+        decision.target_workers,
+        decision.confidence,
+        decision.reasoning,
     )
-    print(f"   Reason: {decision.reasoning}")
-    print(f"   Confidence: {decision.confidence:.2f}")
 
     return True
 
@@ -780,7 +1193,7 @@ def get_current_worker_count() -> int:
     """Get the current worker count."""
     global _current_worker_count
     if _current_worker_count <= 0:
-        _current_worker_count = get_scaling_config()["initial_workers"]
+        _current_worker_count = get_scaling_config().initial_workers
     return _current_worker_count
 
 
@@ -788,9 +1201,7 @@ def set_current_worker_count(count: int) -> None:
     """Set the current worker count."""
     global _current_worker_count
     config = get_scaling_config()
-    _current_worker_count = max(
-        config["min_workers"], min(config["max_workers"], count)
-    )
+    _current_worker_count = max(config.min_workers, min(config.max_workers, count))
 
 
 def get_scaling_status() -> Dict[str, Any]:
@@ -823,14 +1234,14 @@ def get_scaling_status() -> Dict[str, Any]:
         "runtime_formatted": f"{runtime_seconds/60:.1f} minutes",
         # Current state
         "current_workers": get_current_worker_count(),
-        "min_workers": config["min_workers"],
-        "max_workers": config["max_workers"],
+        "min_workers": config.min_workers,
+        "max_workers": config.max_workers,
         "scaling_active": True,
         # Recent performance
         "latest_performance": (
-            asdict(latest_performance) if latest_performance else None
+            latest_performance.to_dict() if latest_performance else None
         ),
-        "latest_resources": asdict(latest_resources) if latest_resources else None,
+        "latest_resources": (latest_resources.to_dict() if latest_resources else None),
         # History stats
         "performance_history_size": len(_performance_history),
         "scaling_decisions_made": len(_scaling_history),
@@ -839,18 +1250,27 @@ def get_scaling_status() -> Dict[str, Any]:
             current_time - _last_scaling_time if _last_scaling_time > 0 else 0
         ),
         # Configuration
-        "config": config.copy(),
+        "config": config.to_dict(),
     }
 
     # Add recent scaling decisions
     if _scaling_history:
-        status["recent_scaling_decisions"] = [
-            asdict(decision) for decision in list(_scaling_history)[-5:]
-        ]
+        recent = islice(_scaling_history, max(0, len(_scaling_history) - 5), None)
+        status["recent_scaling_decisions"] = [decision.to_dict() for decision in recent]
 
     return status
 
 
+def is_in_cooldown(current_time: float = None) -> bool:
+    """Check whether the last scaling action is still within its cooldown period."""
+    if current_time is None:
+        current_time = time.time()
+    return (
+        current_time - _last_scaling_time
+        < get_scaling_config().scaling_cooldown_seconds
+    )
+
+
 def run_adaptive_scaling_cycle() -> ScalingDecision:
     """
     Run a complete adaptive scaling cycle.
@@ -858,19 +1278,48 @@ def run_adaptive_scaling_cycle() -> ScalingDecision:
     Returns:
         ScalingDecision made in this cycle
     """
-    # Collect current metrics
-    performance_metrics = collect_performance_metrics()
-    resource_availability = collect_resource_availability()
+    # One timestamp for the whole cycle keeps the cooldown check, metric
+    # timestamps and the decision consistent with each other
+    current_time = time.time()
 
-    # Store performance metrics in history
+    # Store performance metrics in history; samples taken during the
+    # cooldown are the ones that show the last scaling action's effect
+    performance_metrics = collect_performance_metrics(current_time)
     _performance_history.append(performance_metrics)
 
+    # Nothing can change during the cooldown, so skip the resource
+    # collection, trend analysis and decision logic
+    if is_in_cooldown(current_time):
+        current_workers = get_current_worker_count()
+        remaining = get_scaling_config().scaling_cooldown_seconds - (
+            current_time - _last_scaling_time
+        )
+        if _scaling_history:
+            # Capacity measured by the scaling action that started the cooldown
+            resource_capacity = _scaling_history[-1].resource_capacity
+        else:
+            resource_capacity = collect_resource_availability(
+                current_time
+            ).calculate_scaling_capacity()
+        return ScalingDecision(
+            timestamp=current_time,
+            action="no_change",
+            current_workers=current_workers,
+            target_workers=current_workers,
+            reasoning=f"Cooldown period active ({remaining:.1f}s remaining)",
+            confidence=1.0,
+            performance_score=performance_metrics.calculate_performance_score(),
+            resource_capacity=resource_capacity,
+        )
+
+    resource_availability = collect_resource_availability(current_time)
+
     # Analyze trends
-    trend_analysis = analyze_performance_trends_for_scaling()
+    trend_analysis = analyze_performance_trends_for_scaling(tick_time=current_time)
 
     # Make scaling decision
     decision = make_scaling_decision(
-        performance_metrics, resource_availability, trend_analysis
+        performance_metrics, resource_availability, trend_analysis, current_time
     )
 
     # Execute the decision
@@ -883,36 +1332,88 @@ async def start_adaptive_scaling_monitor(interval_seconds: float = None) -> None
     """
     Start the adaptive scaling monitor that runs scaling cycles continuously.
 
+    Cycles are scheduled against time.monotonic(): the time a cycle takes
+    is subtracted from the following sleep, so the cadence does not drift,
+    and an overrunning cycle starts the next one immediately instead of
+    stacking missed ticks. Callers that poll the scaler themselves should
+    likewise sleep for the real interval, never a busy-wait
+    asyncio.sleep(0.001) loop.
+
+    While the system is quiet the interval backs off exponentially (1.5x
+    per consecutive no_change decision, capped at 8x the base) and snaps
+    back to the base interval after any scaling action or failed cycle.
+
     Args:
-        interval_seconds: How often to run scaling cycles
+        interval_seconds: Base interval between scaling cycles (at least
+            MIN_MONITOR_INTERVAL_SECONDS)
+
+    Raises:
+        ValueError: If interval_seconds is below MIN_MONITOR_INTERVAL_SECONDS
     """
     if interval_seconds is None:
         interval_seconds = ScraperConfig.ADAPTIVE_SCALING_INTERVAL
+    if interval_seconds < MIN_MONITOR_INTERVAL_SECONDS:
+        raise ValueError(
+            f"interval_seconds must be at least {MIN_MONITOR_INTERVAL_SECONDS}s, "
+            f"got {interval_seconds}"
+        )
 
     print(f"🚀 Starting adaptive scaling monitor (interval: {interval_seconds}s)")
 
+    max_interval = interval_seconds * _MONITOR_MAX_BACKOFF_MULTIPLIER
+    current_interval = interval_seconds
+    consecutive_no_change = 0
     cycle_count = 0
     try:
         while True:
+            cycle_start = time.monotonic()
             cycle_count += 1
-            print(f"\n📊 Scaling Cycle #{cycle_count}")
+            lines = ["", f"📊 Scaling Cycle #{cycle_count}"]
 
+            quiet = False
             try:
                 decision = run_adaptive_scaling_cycle()
+                quiet = decision.action == "no_change"
 
                 if decision.action != "no_change":
-                    print(
-                        f"   🔄 Action: {decision.action} ({decision.confidence:.2f} confidence)"
-                    )
-                    print(f"   📈 Performance Score: {decision.performance_score:.3f}")
-                    print(f"   💾 Resource Capacity: {decision.resource_capacity:.1%}")
+                    lines += [
+                        f"   🔄 Action: {decision.action} ({decision.confidence:.2f} confidence)",
+                        f"   📈 Performance Score: {decision.performance_score:.3f}",
+                        f"   💾 Resource Capacity: {decision.resource_capacity:.1%}",
+                    ]
                 else:
-                    print(f"   ✅ Maintaining {decision.current_workers} workers")
+                    lines.append(
+                        f"   ✅ Maintaining {decision.current_workers} workers"
+                    )
 
             except Exception as e:
-                print(f"   ❌ Scaling cycle failed: {e}")
+                lines.append(f"   ❌ Scaling cycle failed: {e}")
 
-            await asyncio.sleep(interval_seconds)
+            # One write per cycle instead of one per line
+            sys.stdout.write("\n".join(lines) + "\n")
+
+            # Back off while nothing changes, snap back on any action
+            if quiet:
+                consecutive_no_change += 1
+                next_interval = min(
+                    interval_seconds * _MONITOR_BACKOFF_FACTOR**consecutive_no_change,
+                    max_interval,
+                )
+            else:
+                consecutive_no_change = 0
+                next_interval = interval_seconds
+            if next_interval != current_interval:
+                logger.debug(
+                    "Scaling monitor interval %.1fs -> %.1fs after %d quiet cycles",
+                    current_interval,
+                    next_interval,
+                    consecutive_no_change,
+                )
+                current_interval = next_interval
+
+            await asyncio.sleep(
+                max(0.0, cycle_start + current_interval - time.monotonic())
+            )
 
     except KeyboardInterrupt:
         print(f"\n🛑 Adaptive scaling monitor stopped after {cycle_count} cycles")
@@ -924,43 +1425,51 @@ def print_scaling_status() -> None:
     """Print current adaptive scaling status to console."""
     status = get_scaling_status()
 
-    print("\n" + "=" * 80)
-    print("ADAPTIVE SCALING ENGINE STATUS")
-    print("=" * 80)
-
-    print(f"Runtime: {status['runtime_formatted']}")
-    print(
-        f"Current Workers: {status['current_workers']} (range: {status['min_workers']}-{status['max_workers']})"
-    )
-    print(f"Scaling Decisions Made: {status['scaling_decisions_made']}")
-    print(f"Performance History: {status['performance_history_size']} entries")
+    lines = [
+        "",
+        "=" * 80,
+        "ADAPTIVE SCALING ENGINE STATUS",
+        "=" * 80,
+        f"Runtime: {status['runtime_formatted']}",
+        f"Current Workers: {status['current_workers']} (range: {status['min_workers']}-{status['max_workers']})",
+        f"Scaling Decisions Made: {status['scaling_decisions_made']}",
+        f"Performance History: {status['performance_history_size']} entries",
+    ]
 
     # Show latest performance if available
     if status["latest_performance"]:
         perf = status["latest_performance"]
-        print("\nLatest Performance:")
-        print(f"  Success Rate: {perf['success_rate']:.1%}")
-        print(f"  Avg Response Time: {perf['avg_page_load_time']:.2f}s")
-        print(f"  Performance Score: {perf.get('performance_score', 'N/A')}")
+        lines += [
+            "",
+            "Latest Performance:",
+            f"  Success Rate: {perf['success_rate']:.1%}",
+            f"  Avg Response Time: {perf['avg_page_load_time']:.2f}s",
+            f"  Performance Score: {perf.get('performance_score', 'N/A')}",
+        ]
 
     # Show latest resources if available
     if status["latest_resources"]:
         res = status["latest_resources"]
-        print("\nSystem Resources:")
-        print(f"  Memory Usage: {res['memory_usage_percent']:.1f}%")
-        print(f"  CPU Usage: {res['cpu_usage_percent']:.1f}%")
-        print(f"  System Load: {res['system_load_level']}")
+        lines += [
+            "",
+            "System Resources:",
+            f"  Memory Usage: {res['memory_usage_percent']:.1f}%",
+            f"  CPU Usage: {res['cpu_usage_percent']:.1f}%",
+            f"  System Load: {res['system_load_level']}",
+        ]
 
     # Show recent decisions
     if status.get("recent_scaling_decisions"):
-        print("\nRecent Scaling Decisions:")
+        lines += ["", "Recent Scaling Decisions:"]
+        action_emoji = {"scale_up": "⬆️", "scale_down": "⬇️", "no_change": "➡️"}
         for decision in status["recent_scaling_decisions"][-3:]:
-            action_emoji = {"scale_up": "⬆️", "scale_down": "⬇️", "no_change": "➡️"}
             emoji = action_emoji.get(decision["action"], "❓")
             action = decision["action"]
             confidence = decision["confidence"]
             reasoning = decision["reasoning"][:60]
-            print(f"  {emoji} {action} ({confidence:.2f}) - {reasoning}...")
+            lines.append(f"  {emoji} {action} ({confidence:.2f}) - {reasoning}...")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Initialize the scaling engine
@@ -968,20 +1477,26 @@ def initialize_adaptive_scaling_engine() -> Dict[str, Any]:
     """Initialize the adaptive scaling engine with default configuration."""
     global _scaling_config, _current_worker_count
 
-    if not _scaling_config:
+    if _scaling_config is None:
         _scaling_config = initialize_scaling_config()
 
     if _current_worker_count <= 0:
-        _current_worker_count = _scaling_config["initial_workers"]
+        _current_worker_count = _scaling_config.initial_workers
+
+    gc.set_threshold(*_GC_THRESHOLDS)
+
+    # Share one background RSS reading across workers (needs a running loop)
+    if ENHANCED_MODULES_AVAILABLE:
+        start_resource_poller()
 
-    print("🎯 Adaptive Scaling Engine initialized")
-    print(
-        f"   Workers: {_current_worker_count} (range: {_scaling_config['min_workers']}-{_scaling_config['max_workers']})"
+    sys.stdout.write(
+        "🎯 Adaptive Scaling Engine initialized\n"
+        f"   Workers: {_current_worker_count} (range: {_scaling_config.min_workers}-{_scaling_config.max_workers})\n"
+        f"   Monitoring interval: {_scaling_config.monitoring_interval}s\n"
     )
-    print(f"   Monitoring interval: {_scaling_config['monitoring_interval']}s")
 
     return {
         "status": "initialized",
         "initial_workers": _current_worker_count,
-        "config": _scaling_config.copy(),
+        "config": _scaling_config.to_dict(),
     }
@@ -19,27 +19,154 @@ Design Principles:
 - Direct integration with existing worker.py and main_complete.py patterns
 """
 
+import asyncio
 import logging
+import threading
 import time
 import gc
 import psutil
-import statistics
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from collections import deque, defaultdict
+from dataclasses import dataclass, replace
+from collections import OrderedDict, deque
+from types import MappingProxyType
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Monotonic clock for durations; wall-clock time.time() is only used for
+# timestamps that are reported externally
+_now = time.monotonic
+
 # Global state for metrics tracking (minimal state needed)
 _metrics_history = deque(maxlen=100)
 _baseline_metrics = None
-_session_start_time = time.time()
+_session_start_time = _now()
 _extraction_patterns_cache = {}
 _memory_cleanup_intervals = {}
+_EMPTY_SETTINGS = MappingProxyType({})  # Shared read-only default mapping
+
+# Running aggregates for calculate_optimization_impact. Each sample is
+# (processing_time_ms, memory_usage_mb, success_ratio); sums are updated as
+# samples enter and leave the window instead of rescanning the history.
+_RECENT_WINDOW_SIZE = 5
+_BASELINE_SAMPLE_COUNT = 3
+_recent_window = deque(maxlen=_RECENT_WINDOW_SIZE)
+_recent_sums = [0.0, 0.0, 0.0]
+_recent_timed_count = 0  # Samples in the window with a processing time
+_baseline_sums = [0.0, 0.0, 0.0]
+_baseline_sample_count = 0
+
+# Collected metrics are submitted lock-free (deque.append is atomic) and folded
+# into the history and running aggregates by one drainer at a time, in
+# batches, so concurrent collectors never interleave aggregate updates
+_metric_submissions = deque()
+_METRIC_DRAIN_BATCH_SIZE = 32
+_metric_drain_lock = threading.Lock()
+
+# Pages optimized since the last full (generation 2) garbage collection
+_pages_since_full_gc = 0
+
+# Process handle and throttled RSS reading (each memory_info() is a syscall)
+_PROC = psutil.Process()
+_BYTES_TO_MB = 1.0 / 1048576
+_RSS_TTL_SECONDS = 0.25
+_last_rss_mb = 0.0
+_last_rss_ts = float("-inf")
+
+# Optional background poller that refreshes the RSS reading for all callers;
+# while it runs, readers accept readings up to two poll intervals old
+_RESOURCE_POLL_INTERVAL_SECONDS = 0.5
+_resource_poller_task: Optional[asyncio.Task] = None
+_rss_default_ttl = _RSS_TTL_SECONDS
+
+
+def _get_rss_mb_cached(ttl: Optional[float] = None) -> float:
+    """
+    Get this process's resident memory in MB, re-reading at most once per ttl.
+
+    Args:
+        ttl: Maximum age in seconds of a cached reading (0 forces a fresh read,
+            None uses the default, which is longer while the poller runs)
+
+    Returns:
+        Resident set size in MB
+    """
+    global _last_rss_mb, _last_rss_ts
+
+    if ttl is None:
+        ttl = _rss_default_ttl
+    now = time.monotonic()
+    if now - _last_rss_ts >= ttl:
+        _last_rss_mb = _PROC.memory_info().rss * _BYTES_TO_MB
+        _last_rss_ts = now
+    return _last_rss_mb
+
+
+async def _resource_poller(interval: float) -> None:
+    """Refresh the shared RSS reading every interval seconds until cancelled."""
+    global _last_rss_mb, _last_rss_ts
+
+    while True:
+        try:
+            _last_rss_mb = _PROC.memory_info().rss * _BYTES_TO_MB
+            _last_rss_ts = time.monotonic()
+        except (psutil.Error, OSError) as e:
+            logger.debug(f"Resource poll failed: {e}")
+        await asyncio.sleep(interval)
+
+
+def _on_resource_poller_done(task: asyncio.Task) -> None:
+    """Fall back to on-demand RSS reads once the poller stops."""
+    global _rss_default_ttl
+
+    if task is _resource_poller_task:
+        _rss_default_ttl = _RSS_TTL_SECONDS
+
+
+def start_resource_poller(
+    interval: float = _RESOURCE_POLL_INTERVAL_SECONDS,
+) -> Optional[asyncio.Task]:
+    """
+    Start the background RSS poller on the running event loop.
+
+    With many workers optimizing pages concurrently, one poller keeps the
+    memory_info() syscall rate fixed instead of scaling with worker count.
+
+    Args:
+        interval: Seconds between readings
+
+    Returns:
+        The poller task, or None if no event loop is running (readings are
+        then taken on demand)
+    """
+    global _resource_poller_task, _rss_default_ttl
+
+    if _resource_poller_task is not None and not _resource_poller_task.done():
+        return _resource_poller_task
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug("No running event loop, RSS will be read on demand")
+        return None
 
+    _resource_poller_task = loop.create_task(_resource_poller(interval))
+    _resource_poller_task.add_done_callback(_on_resource_poller_done)
+    _rss_default_ttl = 2 * interval
+    return _resource_poller_task
 
-@dataclass
+
+def stop_resource_poller() -> None:
+    """Cancel the background RSS poller if it is running."""
+    global _resource_poller_task, _rss_default_ttl
+
+    if _resource_poller_task is not None:
+        _resource_poller_task.cancel()
+        _resource_poller_task = None
+    _rss_default_ttl = _RSS_TTL_SECONDS
+
+
+@dataclass(slots=True)
 class AdvancedMetrics:
     """Advanced performance metrics for optimization tracking."""
 
@@ -55,6 +182,128 @@ class AdvancedMetrics:
     gc_triggers: int
     session_duration_seconds: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Sample as a dict for the orchestration result's performance metrics."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Reported (with fresh timing fields) when system metrics cannot be read
+_FALLBACK_METRICS = AdvancedMetrics(
+    timestamp=0.0,
+    processing_time_ms=0,
+    memory_usage_mb=0,
+    pages_processed=0,
+    success_count=0,
+    error_count=1,
+    cache_hits=0,
+    cache_misses=0,
+    cleanup_cycles=0,
+    gc_triggers=0,
+    session_duration_seconds=0.0,
+)
+
+
+def _record_impact_sample(metrics: AdvancedMetrics) -> None:
+    """Fold a new metrics sample into the baseline and recent-window sums."""
+    global _recent_timed_count, _baseline_sample_count
+
+    sample = (
+        metrics.processing_time_ms,
+        metrics.memory_usage_mb,
+        metrics.success_count / max(1, metrics.pages_processed),
+    )
+
+    if len(_recent_window) == _RECENT_WINDOW_SIZE:
+        evicted = _recent_window[0]
+        for i in range(3):
+            _recent_sums[i] -= evicted[i]
+        if evicted[0] > 0:
+            _recent_timed_count -= 1
+    _recent_window.append(sample)
+    for i in range(3):
+        _recent_sums[i] += sample[i]
+    if sample[0] > 0:
+        _recent_timed_count += 1
+
+    if _baseline_sample_count < _BASELINE_SAMPLE_COUNT:
+        for i in range(3):
+            _baseline_sums[i] += sample[i]
+        _baseline_sample_count += 1
+
+
+def drain_metric_submissions(blocking: bool = True) -> int:
+    """
+    Fold submitted metrics into the history and impact aggregates.
+
+    Args:
+        blocking: Wait for a drain already in progress instead of skipping
+
+    Returns:
+        Number of metrics drained
+    """
+    if not _metric_drain_lock.acquire(blocking=blocking):
+        return 0
+
+    drained = 0
+    try:
+        while _metric_submissions:
+            metrics = _metric_submissions.popleft()
+            _metrics_history.append(metrics)
+            _record_impact_sample(metrics)
+            drained += 1
+    finally:
+        _metric_drain_lock.release()
+    return drained
+
+
+# Page-side cleanup: clears the JS heap and Cache Storage in one round-trip and
+# reports whether the Cache Storage API exists. Sessions install it once as
+# window.__optCleanup so later calls ship only the short invocation string.
+_HEAP_CLEANUP_JS = """
+async (skipCaches) => {
+    const hasCaches = typeof caches !== 'undefined';
+    const result = { heap: false, caches: false, hasCaches };
+
+    try {
+        // Clear JavaScript heap
+        if (window.gc) {
+            window.gc();
+        }
+
+        // Clear performance entries
+        if (performance.clearResourceTimings) {
+            performance.clearResourceTimings();
+        }
+
+        // Clear console history
+        if (console.clear) {
+            console.clear();
+        }
+
+        // Remove event listeners on window
+        ['scroll', 'resize', 'load', 'beforeunload'].forEach(event => {
+            window.removeEventListener(event, function() {});
+        });
+        result.heap = true;
+    } catch (e) {}
+
+    // Clear browser cache for this page
+    if (hasCaches && !skipCaches) {
+        try {
+            const names = await caches.keys();
+            await Promise.all(names.map(name => caches.delete(name)));
+            result.caches = true;
+        } catch (e) {}
+    }
+
+    return result;
+}
+"""
+_OPT_CLEANUP_DEFINITION = f"window.__optCleanup = {_HEAP_CLEANUP_JS.strip()};"
+_OPT_CLEANUP_CALL = (
+    "(skipCaches) => window.__optCleanup ? window.__optCleanup(skipCaches) : null"
+)
+
 
 # ====================
 # MEMORY MANAGEMENT FUNCTIONS
@@ -82,18 +331,25 @@ async def create_memory_optimized_session(
         # Store cleanup interval for this session
         _memory_cleanup_intervals[session_id] = cleanup_interval
 
-        # Initial memory optimization
-        await optimize_page_memory_advanced(page)
+        # Install the cleanup function for every document this page loads
+        try:
+            await page.add_init_script(script=_OPT_CLEANUP_DEFINITION)
+        except Exception as e:
+            logger.debug(f"Could not install page cleanup script: {e}")
 
-        # Create session context
+        # Create session context (monotonic times, for measuring intervals)
+        created_at = _now()
         session_context = {
             "session_id": session_id,
-            "created_at": time.time(),
+            "created_at": created_at,
             "page": page,
             "cleanup_count": 0,
-            "last_cleanup": time.time(),
+            "last_cleanup": created_at,
         }
 
+        # Initial memory optimization (also detects the Cache Storage API)
+        await optimize_page_memory_advanced(page, session_context)
+
         logger.info(f"Memory optimized session created: {session_id}")
         return session_context
 
@@ -102,7 +358,9 @@ async def create_memory_optimized_session(
         return {"session_id": "fallback", "page": page, "cleanup_count": 0}
 
 
-async def optimize_page_memory_advanced(page) -> Dict[str, Any]:
+async def optimize_page_memory_advanced(
+    page, session_context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Advanced page memory optimization with comprehensive cleanup.
 
@@ -110,6 +368,8 @@ async def optimize_page_memory_advanced(page) -> Dict[str, Any]:
 
     Args:
         page: Playwright page instance
+        session_context: Optional session context; remembers whether the page
+            has a Cache Storage API so later calls skip the cache clear
 
     Returns:
         Dict with optimization results
@@ -124,56 +384,36 @@ async def optimize_page_memory_advanced(page) -> Dict[str, Any]:
 
     try:
         # Get initial memory usage
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / (1024 * 1024)
+        initial_memory = _get_rss_mb_cached()
         results["memory_before_mb"] = initial_memory
 
-        # Clear JavaScript heap
+        # Clear JavaScript heap and the page's Cache Storage in one round-trip
         try:
-            await page.evaluate(
-                """
-                // Clear JavaScript heap
-                if (window.gc) {
-                    window.gc();
-                }
-                
-                // Clear performance entries
-                if (performance.clearResourceTimings) {
-                    performance.clearResourceTimings();
-                }
-                
-                // Clear console history
-                if (console.clear) {
-                    console.clear();
-                }
-                
-                // Remove event listeners on window
-                ['scroll', 'resize', 'load', 'beforeunload'].forEach(event => {
-                    window.removeEventListener(event, function() {});
-                });
-            """
+            skip_caches = (
+                session_context is not None
+                and session_context.get("has_caches") is False
             )
-            results["cleanup_actions"].append("js_heap_cleanup")
+            cleanup = await page.evaluate(_OPT_CLEANUP_CALL, skip_caches)
+            if cleanup is None:
+                # Cleanup function not installed on this document yet
+                cleanup = await page.evaluate(_HEAP_CLEANUP_JS, skip_caches)
+            if session_context is not None and "has_caches" not in session_context:
+                session_context["has_caches"] = bool(cleanup.get("hasCaches"))
+            if cleanup.get("heap"):
+                results["cleanup_actions"].append("js_heap_cleanup")
+            if cleanup.get("caches"):
+                results["cleanup_actions"].append("browser_cache_cleanup")
         except Exception as e:
-            logger.debug(f"JS heap cleanup failed: {e}")
+            logger.debug(f"Page memory cleanup failed: {e}")
 
-        # Clear browser cache for this page
-        try:
-            await page.evaluate(
-                "caches.keys().then(names => names.forEach(name => caches.delete(name)))"
-            )
-            results["cleanup_actions"].append("browser_cache_cleanup")
-        except Exception as e:
-            logger.debug(f"Browser cache cleanup failed: {e}")
-
-        # Force Python garbage collection
-        collected = gc.collect()
+        # Collect the young generation only; full sweeps are gated by page count
+        collected = gc.collect(0)
         if collected > 0:
             results["gc_triggered"] = True
             results["cleanup_actions"].append(f"gc_collected_{collected}")
 
-        # Get final memory usage
-        final_memory = process.memory_info().rss / (1024 * 1024)
+        # Get final memory usage (fresh read, the cleanup just ran)
+        final_memory = _get_rss_mb_cached(ttl=0.0)
         results["memory_after_mb"] = final_memory
         results["memory_saved_mb"] = max(0, initial_memory - final_memory)
 
@@ -202,10 +442,14 @@ def setup_extraction_pattern_cache(
         max_memory_mb: Maximum memory usage for cache
 
     Returns:
-        Cache configuration dict
+        Cache configuration dict (the live one if the cache already exists)
     """
     global _extraction_patterns_cache
 
+    # Already initialized: nothing to allocate or log
+    if _extraction_patterns_cache:
+        return _extraction_patterns_cache["config"]
+
     cache_config = {
         "max_patterns": max_patterns,
         "max_memory_bytes": max_memory_mb * 1024 * 1024,
@@ -214,14 +458,11 @@ def setup_extraction_pattern_cache(
         "misses": 0,
     }
 
-    # Initialize cache if not exists
-    if not _extraction_patterns_cache:
-        _extraction_patterns_cache = {
-            "patterns": {},
-            "usage_count": defaultdict(int),
-            "last_used": {},
-            "config": cache_config,
-        }
+    # Pattern order is recency, oldest first
+    _extraction_patterns_cache = {
+        "patterns": OrderedDict(),
+        "config": cache_config,
+    }
 
     logger.info(
         f"Extraction pattern cache configured: {max_patterns} patterns, {max_memory_mb}MB limit"
@@ -250,24 +491,23 @@ def cache_extraction_pattern(
             setup_extraction_pattern_cache()
 
         cache = _extraction_patterns_cache
+        patterns = cache["patterns"]
 
         # Check cache size limits
-        if len(cache["patterns"]) >= cache["config"]["max_patterns"]:
+        if url_pattern in patterns:
+            patterns.move_to_end(url_pattern)
+        elif len(patterns) >= cache["config"]["max_patterns"]:
             # Remove least recently used pattern
-            lru_pattern = min(cache["last_used"].items(), key=lambda x: x[1])[0]
-            del cache["patterns"][lru_pattern]
-            del cache["last_used"][lru_pattern]
-            del cache["usage_count"][lru_pattern]
+            patterns.popitem(last=False)
 
         # Store pattern
-        cache["patterns"][url_pattern] = {
+        patterns[url_pattern] = {
             "selectors": dom_selectors,
             "success_rate": success_rate,
             "created_at": time.time(),
-            "size_bytes": len(str(dom_selectors).encode("utf-8")),
+            # Selector characters approximate the encoded size (CSS is ASCII)
+            "size_bytes": sum(map(len, dom_selectors)),
         }
-        cache["last_used"][url_pattern] = time.time()
-        cache["usage_count"][url_pattern] = 1
 
         logger.debug(
             f"Cached extraction pattern for {url_pattern}: {len(dom_selectors)} selectors"
@@ -303,8 +543,7 @@ def get_cached_extraction_pattern(url_pattern: str) -> Optional[Dict[str, Any]]:
         pattern = cache["patterns"][url_pattern]
 
         # Update usage tracking
-        cache["last_used"][url_pattern] = time.time()
-        cache["usage_count"][url_pattern] += 1
+        cache["patterns"].move_to_end(url_pattern)
         cache["config"]["hits"] += 1
 
         logger.debug(f"Cache hit for pattern {url_pattern}")
@@ -334,66 +573,53 @@ def collect_advanced_metrics(worker_stats: Dict[str, Any] = None) -> AdvancedMet
     """
     global _metrics_history, _session_start_time
 
+    # Get system metrics (psutil is the only expected failure source)
     try:
-        # Get system metrics
-        process = psutil.Process()
-        memory_usage_mb = process.memory_info().rss / (1024 * 1024)
-
-        # Extract stats from worker or use defaults
-        if worker_stats:
-            pages_processed = worker_stats.get("pages_processed", 0)
-            success_count = worker_stats.get("successful_pages", 0)
-            error_count = worker_stats.get("failed_pages", 0)
-            processing_time_ms = worker_stats.get("avg_processing_time_ms", 0)
-        else:
-            pages_processed = len(_metrics_history)
-            success_count = pages_processed
-            error_count = 0
-            processing_time_ms = 0
-
-        # Get cache stats
-        cache_stats = _extraction_patterns_cache.get("config", {})
-        cache_hits = cache_stats.get("hits", 0)
-        cache_misses = cache_stats.get("misses", 0)
-
-        # Calculate session duration
-        session_duration = time.time() - _session_start_time
-
-        # Create metrics
-        metrics = AdvancedMetrics(
+        memory_usage_mb = _get_rss_mb_cached()
+    except (psutil.Error, OSError) as e:
+        logger.error(f"Error collecting advanced metrics: {e}")
+        return replace(
+            _FALLBACK_METRICS,
             timestamp=time.time(),
-            processing_time_ms=processing_time_ms,
-            memory_usage_mb=memory_usage_mb,
-            pages_processed=pages_processed,
-            success_count=success_count,
-            error_count=error_count,
-            cache_hits=cache_hits,
-            cache_misses=cache_misses,
-            cleanup_cycles=len(_memory_cleanup_intervals),
-            gc_triggers=0,  # Would need to track this separately
-            session_duration_seconds=session_duration,
+            session_duration_seconds=_now() - _session_start_time,
         )
 
-        # Store in history
-        _metrics_history.append(metrics)
+    # Extract stats from worker or use defaults
+    if worker_stats:
+        pages_processed = worker_stats.get("pages_processed", 0)
+        success_count = worker_stats.get("successful_pages", 0)
+        error_count = worker_stats.get("failed_pages", 0)
+        processing_time_ms = worker_stats.get("avg_processing_time_ms", 0)
+    else:
+        pages_processed = len(_metrics_history) + len(_metric_submissions)
+        success_count = pages_processed
+        error_count = 0
+        processing_time_ms = 0
+
+    # Get cache stats
+    cache_stats = _extraction_patterns_cache.get("config", _EMPTY_SETTINGS)
+
+    # Create metrics
+    metrics = AdvancedMetrics(
+        timestamp=time.time(),
+        processing_time_ms=processing_time_ms,
+        memory_usage_mb=memory_usage_mb,
+        pages_processed=pages_processed,
+        success_count=success_count,
+        error_count=error_count,
+        cache_hits=cache_stats.get("hits", 0),
+        cache_misses=cache_stats.get("misses", 0),
+        cleanup_cycles=len(_memory_cleanup_intervals),
+        gc_triggers=0,  # Would need to track this separately
+        session_duration_seconds=_now() - _session_start_time,
+    )
 
-        return metrics
+    # Submit for the history, folding in batches (skipped if a drain is running)
+    _metric_submissions.append(metrics)
+    if len(_metric_submissions) >= _METRIC_DRAIN_BATCH_SIZE:
+        drain_metric_submissions(blocking=False)
 
-    except Exception as e:
-        logger.error(f"Error collecting advanced metrics: {e}")
-        return AdvancedMetrics(
-            timestamp=time.time(),
-            processing_time_ms=0,
-            memory_usage_mb=0,
-            pages_processed=0,
-            success_count=0,
-            error_count=1,
-            cache_hits=0,
-            cache_misses=0,
-            cleanup_cycles=0,
-            gc_triggers=0,
-            session_duration_seconds=time.time() - _session_start_time,
-        )
+    return metrics
 
 
 def calculate_optimization_impact() -> Dict[str, Any]:
@@ -406,48 +632,35 @@ def calculate_optimization_impact() -> Dict[str, Any]:
     global _metrics_history, _baseline_metrics
 
     try:
+        drain_metric_submissions()
         if len(_metrics_history) < 5:
             return {"status": "insufficient_data", "samples": len(_metrics_history)}
 
-        # Establish baseline if not set
+        # Establish baseline from the first samples of the session
         if _baseline_metrics is None:
-            baseline_samples = list(_metrics_history)[:3]
             _baseline_metrics = {
-                "avg_processing_time_ms": statistics.mean(
-                    [m.processing_time_ms for m in baseline_samples]
-                ),
-                "avg_memory_mb": statistics.mean(
-                    [m.memory_usage_mb for m in baseline_samples]
-                ),
-                "avg_success_rate": statistics.mean(
-                    [
-                        m.success_count / max(1, m.pages_processed)
-                        for m in baseline_samples
-                    ]
-                ),
+                "avg_processing_time_ms": _baseline_sums[0] / _baseline_sample_count,
+                "avg_memory_mb": _baseline_sums[1] / _baseline_sample_count,
+                "avg_success_rate": _baseline_sums[2] / _baseline_sample_count,
             }
 
-        # Calculate current performance
-        recent_samples = list(_metrics_history)[-5:]
+        # Calculate current performance (processing time over timed samples)
+        window_size = len(_recent_window)
         current_metrics = {
-            "avg_processing_time_ms": statistics.mean(
-                [
-                    m.processing_time_ms
-                    for m in recent_samples
-                    if m.processing_time_ms > 0
-                ]
-            ),
-            "avg_memory_mb": statistics.mean(
-                [m.memory_usage_mb for m in recent_samples]
-            ),
-            "avg_success_rate": statistics.mean(
-                [m.success_count / max(1, m.pages_processed) for m in recent_samples]
+            "avg_processing_time_ms": (
+                _recent_sums[0] / _recent_timed_count if _recent_timed_count else 0.0
             ),
+            "avg_memory_mb": _recent_sums[1] / window_size,
+            "avg_success_rate": _recent_sums[2] / window_size,
         }
+        latest = _metrics_history[-1]
 
         # Calculate improvements
         time_improvement = 0
-        if _baseline_metrics["avg_processing_time_ms"] > 0:
+        if (
+            _baseline_metrics["avg_processing_time_ms"] > 0
+            and current_metrics["avg_processing_time_ms"] > 0
+        ):
             time_improvement = (
                 (
                     _baseline_metrics["avg_processing_time_ms"]
@@ -464,10 +677,8 @@ def calculate_optimization_impact() -> Dict[str, Any]:
             ) * 100
 
         # Cache efficiency
-        total_cache_ops = (
-            recent_samples[-1].cache_hits + recent_samples[-1].cache_misses
-        )
-        cache_hit_rate = (recent_samples[-1].cache_hits / max(1, total_cache_ops)) * 100
+        total_cache_ops = latest.cache_hits + latest.cache_misses
+        cache_hit_rate = (latest.cache_hits / max(1, total_cache_ops)) * 100
 
         return {
             "status": "calculated",
@@ -475,10 +686,8 @@ def calculate_optimization_impact() -> Dict[str, Any]:
             "memory_improvement_percent": round(memory_improvement, 2),
             "success_rate_percent": round(current_metrics["avg_success_rate"] * 100, 2),
             "cache_hit_rate_percent": round(cache_hit_rate, 2),
-            "total_pages_processed": recent_samples[-1].pages_processed,
-            "session_duration_minutes": round(
-                recent_samples[-1].session_duration_seconds / 60, 2
-            ),
+            "total_pages_processed": latest.pages_processed,
+            "session_duration_minutes": round(latest.session_duration_seconds / 60, 2),
             "baseline_metrics": _baseline_metrics,
             "current_metrics": current_metrics,
         }
@@ -488,6 +697,31 @@ def calculate_optimization_impact() -> Dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
+_REPORT_TEMPLATE = "\n".join(
+    [
+        "🚀 Advanced Optimization Report",
+        "=" * 40,
+        "📊 Performance Improvements:",
+        "   ⏱️  Processing Time: {time_improvement_percent:+.1f}%",
+        "   💾 Memory Usage: {memory_improvement_percent:+.1f}%",
+        "   ✅ Success Rate: {success_rate_percent:.1f}%",
+        "   🎯 Cache Hit Rate: {cache_hit_rate_percent:.1f}%",
+        "",
+        "📈 Session Statistics:",
+        "   📄 Pages Processed: {total_pages_processed}",
+        "   ⏰ Session Duration: {session_duration_minutes:.1f} minutes",
+        "   🧠 Current Memory: {current_memory_mb:.1f} MB",
+        "",
+        "🔧 Optimization Features Active:",
+        "   🌐 Browser Reuse: ✅",
+        "   🚫 Resource Filtering: ✅",
+        "   💾 Memory Management: ✅",
+        "   📋 Pattern Caching: ✅",
+        "   📊 Advanced Monitoring: ✅",
+    ]
+)
+
+
 def generate_optimization_report() -> str:
     """
     Generate human-readable optimization report.
@@ -502,33 +736,9 @@ def generate_optimization_report() -> str:
         if impact["status"] != "calculated":
             return f"⚠️ Optimization Report: {impact['status']}"
 
-        report_lines = [
-            "🚀 Advanced Optimization Report",
-            "=" * 40,
-            "📊 Performance Improvements:",
-            f"   ⏱️  Processing Time: {impact['time_improvement_percent']:+.1f}%",
-            f"   💾 Memory Usage: {impact['memory_improvement_percent']:+.1f}%",
-            f"   ✅ Success Rate: {impact['success_rate_percent']:.1f}%",
-            f"   🎯 Cache Hit Rate: {impact['cache_hit_rate_percent']:.1f}%",
-            "",
-            "📈 Session Statistics:",
-            f"   📄 Pages Processed: {impact['total_pages_processed']}",
-            f"   ⏰ Session Duration: {impact['session_duration_minutes']:.1f} minutes",
-            (
-                f"   🧠 Current Memory: {latest_metrics.memory_usage_mb:.1f} MB"
-                if latest_metrics
-                else ""
-            ),
-            "",
-            "🔧 Optimization Features Active:",
-            "   🌐 Browser Reuse: ✅",
-            "   🚫 Resource Filtering: ✅",
-            "   💾 Memory Management: ✅",
-            "   📋 Pattern Caching: ✅",
-            "   📊 Advanced Monitoring: ✅",
-        ]
-
-        return "\n".join(report_lines)
+        return _REPORT_TEMPLATE.format_map(
+            {**impact, "current_memory_mb": latest_metrics.memory_usage_mb}
+        )
 
     except Exception as e:
         logger.error(f"Error generating optimization report: {e}")
@@ -566,35 +776,44 @@ def create_optimized_orchestration_config(
         cleanup_interval_seconds: Automatic cleanup interval
 
     Returns:
-        Configuration dict for optimized orchestration
+        Configuration dict for optimized orchestration (settings sections are
+        read-only views)
     """
     config = {
-        "optimization_settings": {
-            "browser_reuse": enable_browser_reuse,
-            "resource_filtering": enable_resource_filtering,
-            "memory_optimization": enable_memory_optimization,
-            "pattern_caching": enable_pattern_caching,
-            "advanced_monitoring": enable_advanced_monitoring,
-        },
-        "performance_settings": {
-            "max_concurrent_workers": max_concurrent_workers,
-            "memory_threshold_mb": memory_threshold_mb,
-            "cleanup_interval_seconds": cleanup_interval_seconds,
-            "gc_threshold_pages": 100,
-            "browser_reuse_threshold": 10,
-        },
-        "monitoring_settings": {
-            "metrics_history_size": 100,
-            "report_interval_seconds": 60,
-            "enable_detailed_logging": True,
-            "performance_baseline_samples": 5,
-        },
-        "fallback_settings": {
-            "enable_fallback_on_error": True,
-            "max_retry_attempts": 3,
-            "fallback_timeout_seconds": 30,
-            "error_threshold_percent": 10,
-        },
+        "optimization_settings": MappingProxyType(
+            {
+                "browser_reuse": enable_browser_reuse,
+                "resource_filtering": enable_resource_filtering,
+                "memory_optimization": enable_memory_optimization,
+                "pattern_caching": enable_pattern_caching,
+                "advanced_monitoring": enable_advanced_monitoring,
+            }
+        ),
+        "performance_settings": MappingProxyType(
+            {
+                "max_concurrent_workers": max_concurrent_workers,
+                "memory_threshold_mb": memory_threshold_mb,
+                "cleanup_interval_seconds": cleanup_interval_seconds,
+                "gc_threshold_pages": 100,
+                "browser_reuse_threshold": 10,
+            }
+        ),
+        "monitoring_settings": MappingProxyType(
+            {
+                "metrics_history_size": 100,
+                "report_interval_seconds": 60,
+                "enable_detailed_logging": True,
+                "performance_baseline_samples": 5,
+            }
+        ),
+        "fallback_settings": MappingProxyType(
+            {
+                "enable_fallback_on_error": True,
+                "max_retry_attempts": 3,
+                "fallback_timeout_seconds": 30,
+                "error_threshold_percent": 10,
+            }
+        ),
         "created_at": time.time(),
         "version": "3.0.0",
     }
@@ -605,6 +824,16 @@ def create_optimized_orchestration_config(
     return config
 
 
+def _empty_optimization_result() -> Dict[str, Any]:
+    """Fresh result dict with nothing applied yet."""
+    return {
+        "optimizations_applied": [],
+        "metrics": {},
+        "errors": [],
+        "fallback_used": False,
+    }
+
+
 async def apply_orchestrated_optimization(
     page, session_context: Dict[str, Any], config: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -619,27 +848,31 @@ async def apply_orchestrated_optimization(
     Returns:
         Dict with optimization results
     """
-    results = {
-        "optimizations_applied": [],
-        "metrics": {},
-        "errors": [],
-        "fallback_used": False,
-    }
+    global _pages_since_full_gc
 
-    try:
-        optimization_settings = config.get("optimization_settings", {})
+    optimization_settings = config.get("optimization_settings", _EMPTY_SETTINGS)
+    memory_optimization = optimization_settings.get("memory_optimization", False)
+    pattern_caching = optimization_settings.get("pattern_caching", False)
+    advanced_monitoring = optimization_settings.get("advanced_monitoring", False)
+    if not (memory_optimization or pattern_caching or advanced_monitoring):
+        return _empty_optimization_result()
 
+    results = _empty_optimization_result()
+
+    try:
         # Apply memory optimization
-        if optimization_settings.get("memory_optimization", False):
+        if memory_optimization:
             try:
-                memory_result = await optimize_page_memory_advanced(page)
+                memory_result = await optimize_page_memory_advanced(
+                    page, session_context
+                )
                 results["optimizations_applied"].append("memory_optimization")
                 results["metrics"]["memory"] = memory_result
             except Exception as e:
                 results["errors"].append(f"Memory optimization failed: {e}")
 
         # Setup pattern caching
-        if optimization_settings.get("pattern_caching", False):
+        if pattern_caching:
             try:
                 cache_config = setup_extraction_pattern_cache()
                 results["optimizations_applied"].append("pattern_caching")
@@ -648,24 +881,24 @@ async def apply_orchestrated_optimization(
                 results["errors"].append(f"Pattern caching failed: {e}")
 
         # Collect advanced monitoring metrics
-        if optimization_settings.get("advanced_monitoring", False):
+        if advanced_monitoring:
             try:
                 metrics = collect_advanced_metrics()
                 results["optimizations_applied"].append("advanced_monitoring")
-                results["metrics"]["performance"] = asdict(metrics)
+                results["metrics"]["performance"] = metrics.to_dict()
             except Exception as e:
                 results["errors"].append(f"Advanced monitoring failed: {e}")
 
-        # Check for cleanup triggers
-        performance_settings = config.get("performance_settings", {})
-        if (
-            session_context.get("cleanup_count", 0)
-            % performance_settings.get("gc_threshold_pages", 100)
-            == 0
-        ):
-            gc_collected = gc.collect()
-            if gc_collected > 0:
-                results["optimizations_applied"].append(f"gc_cleanup_{gc_collected}")
+        # Young-generation collection per page, full sweep every N pages
+        performance_settings = config.get("performance_settings", _EMPTY_SETTINGS)
+        if _pages_since_full_gc >= performance_settings.get("gc_threshold_pages", 100):
+            gc_collected = gc.collect(2)
+            _pages_since_full_gc = 0
+        else:
+            gc_collected = gc.collect(0)
+            _pages_since_full_gc += 1
+        if gc_collected > 0:
+            results["optimizations_applied"].append(f"gc_cleanup_{gc_collected}")
 
         logger.debug(
             f"Orchestrated optimization applied: {len(results['optimizations_applied'])} optimizations"
@@ -686,12 +919,22 @@ def cleanup_optimization_state():
     Should be called when the scraping session ends to clean up resources.
     """
     global _metrics_history, _baseline_metrics, _session_start_time, _extraction_patterns_cache, _memory_cleanup_intervals
+    global _recent_timed_count, _baseline_sample_count, _pages_since_full_gc
 
     try:
         # Reset metrics
+        with _metric_drain_lock:
+            _metric_submissions.clear()
         _metrics_history.clear()
         _baseline_metrics = None
-        _session_start_time = time.time()
+        _session_start_time = _now()
+        _recent_window.clear()
+        _recent_sums[:] = [0.0, 0.0, 0.0]
+        _recent_timed_count = 0
+        _baseline_sums[:] = [0.0, 0.0, 0.0]
+        _baseline_sample_count = 0
+        _pages_since_full_gc = 0
+        stop_resource_poller()
 
         # Clear caches
         _extraction_patterns_cache.clear()
@@ -714,11 +957,14 @@ __all__ = [
     "cache_extraction_pattern",
     "get_cached_extraction_pattern",
     "collect_advanced_metrics",
+    "drain_metric_submissions",
     "calculate_optimization_impact",
     "generate_optimization_report",
     "create_optimized_orchestration_config",
     "apply_orchestrated_optimization",
     "cleanup_optimization_state",
+    "start_resource_poller",
+    "stop_resource_poller",
 ]
 
 if __name__ == "__main__":
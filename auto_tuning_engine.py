@@ -7,18 +7,68 @@ system conditions, and historical data. It continuously learns from scraping pat
 to optimize configuration parameters automatically.
 """
 
+import math
 import time
-import statistics
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from collections import defaultdict, deque
+from enum import IntEnum
+from operator import attrgetter
 import logging
 
+# Optional NumPy acceleration for pattern detection (falls back to pure Python)
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Numba JIT for the window-stats kernel
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Pattern-detection window: detectors look at the newest 20 samples, and
+# "recent" averages at the newest 5; samples arrive every 30 seconds
+_DETECTION_WINDOW_SIZE = 20
+_RECENT_SAMPLE_COUNT = 5
+_SAMPLE_INTERVAL_MINUTES = 0.5
+
+# Peak load (more lenient thresholds for testing)
+_PEAK_RESPONSE_TIME_SECONDS = 10.0
+_PEAK_CPU_PERCENT = 70.0
+_PEAK_ERROR_RATE = 0.1
+
+# Performance degradation (trend slopes per sample)
+_DEGRADING_RESPONSE_TREND = 0.1
+_DEGRADING_SUCCESS_TREND = -0.01
+
+# Low activity
+_LOW_ACTIVITY_CPU_PERCENT = 30.0
+_LOW_ACTIVITY_QUEUE_LENGTH = 2.0
+_LOW_ACTIVITY_WORKER_MARGIN = 2
+
+# Steady state (maximum coefficients of variation)
+_STEADY_RESPONSE_CV = 0.2
+_STEADY_SUCCESS_CV = 0.1
+_STEADY_CPU_CV = 0.3
+
+# Confidence cut-offs for acting on patterns and applying recommendations
+_MIN_PATTERN_CONFIDENCE = 0.5
+_MIN_APPLY_CONFIDENCE = 0.6
 
-@dataclass
+# Recommendations recycled per engine; each cycle produces at most ~6
+_REC_POOL_SIZE = 16
+
+
+@dataclass(slots=True)
 class TuningParameters:
     """Configuration parameters that can be auto-tuned"""
 
@@ -52,7 +102,18 @@ class TuningParameters:
     pattern_cache_max_size: int = 1000
 
 
-@dataclass
+# Dense ids for the tunable parameters, in TuningParameters field order
+_ParamIdx = IntEnum("_ParamIdx", [f.name for f in fields(TuningParameters)], start=0)
+
+# Per-parameter accessors indexed by _ParamIdx: C-level attrgetters and the
+# slot descriptors' setters, avoiding name-based getattr/setattr lookups
+_PARAM_GETTERS = tuple(attrgetter(param.name) for param in _ParamIdx)
+_PARAM_SETTERS = tuple(
+    getattr(TuningParameters, param.name).__set__ for param in _ParamIdx
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PerformancePattern:
     """Represents a detected performance pattern"""
 
@@ -63,9 +124,13 @@ class PerformancePattern:
     recommended_action: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TuningRecommendation:
-    """A recommendation for parameter tuning"""
+    """
+    A recommendation for parameter tuning.
+
+    Mutable so the engine can recycle instances between tuning cycles.
+    """
 
     parameter_name: str
     current_value: Any
@@ -73,6 +138,337 @@ class TuningRecommendation:
     confidence: float
     reason: str
     expected_improvement: str
+    param_idx: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.param_idx = _ParamIdx[self.parameter_name]
+
+
+def _safe_float(metrics: Dict[str, Any], key: str, default: float) -> float:
+    """Get a metric as a float, falling back to default for missing or bad values."""
+    value = metrics.get(key, default)
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None or (type(value) is str and value == "invalid"):
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_int(metrics: Dict[str, Any], key: str, default: int) -> int:
+    """Get a metric as an int, falling back to default for missing or bad values."""
+    value = metrics.get(key, default)
+    if type(value) is int:
+        return value
+    if value is None or (type(value) is str and value == "invalid"):
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _trend_slope(values) -> float:
+    """
+    Least-squares slope of a NumPy array over its sample index.
+
+    The x values are always 0..n-1, so their sums have closed forms.
+    """
+    n = len(values)
+    if n < 2:
+        return 0.0
+    sum_x = n * (n - 1) / 2
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+    sum_y = float(values.sum())
+    sum_xy = float(np.arange(n) @ values)
+    return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+
+
+# Statistics produced by the window-stats kernel, in return order
+_WINDOW_STAT_KEYS = (
+    "recent_response_mean",
+    "recent_cpu_mean",
+    "recent_error_mean",
+    "recent_worker_mean",
+    "recent_queue_mean",
+    "response_mean",
+    "response_std",
+    "success_mean",
+    "success_std",
+    "cpu_mean",
+    "cpu_std",
+    "response_trend",
+    "success_trend",
+)
+
+
+def _python_window_stats(response, success, cpu, error, workers, queue):
+    """
+    Single-pass kernel computing every detector statistic for a window.
+
+    Sums over the full window are taken relative to the first sample so the
+    one-pass variance stays accurate for steady, low-variance metrics. The
+    columns must be non-empty and of equal length.
+
+    Returns:
+        Tuple of statistics in _WINDOW_STAT_KEYS order
+    """
+    n = len(response)
+    recent_start = max(0, n - _RECENT_SAMPLE_COUNT)
+    response0 = response[0]
+    success0 = success[0]
+    cpu0 = cpu[0]
+
+    response_sum = response_sq = response_xy = 0.0
+    success_sum = success_sq = success_xy = 0.0
+    cpu_sum = cpu_sq = 0.0
+    recent_response = recent_cpu = recent_error = 0.0
+    recent_workers = recent_queue = 0.0
+    for i in range(n):
+        d_response = response[i] - response0
+        d_success = success[i] - success0
+        d_cpu = cpu[i] - cpu0
+        response_sum += d_response
+        response_sq += d_response * d_response
+        response_xy += i * d_response
+        success_sum += d_success
+        success_sq += d_success * d_success
+        success_xy += i * d_success
+        cpu_sum += d_cpu
+        cpu_sq += d_cpu * d_cpu
+        if i >= recent_start:
+            recent_response += response[i]
+            recent_cpu += cpu[i]
+            recent_error += error[i]
+            recent_workers += workers[i]
+            recent_queue += queue[i]
+
+    recent_count = n - recent_start
+    if n > 1:
+        response_std = math.sqrt(
+            max(0.0, response_sq - response_sum * response_sum / n) / (n - 1)
+        )
+        success_std = math.sqrt(
+            max(0.0, success_sq - success_sum * success_sum / n) / (n - 1)
+        )
+        cpu_std = math.sqrt(max(0.0, cpu_sq - cpu_sum * cpu_sum / n) / (n - 1))
+
+        # Slopes are unaffected by the per-column offset
+        sum_x = n * (n - 1) / 2
+        denominator = n * ((n - 1) * n * (2 * n - 1) / 6) - sum_x * sum_x
+        response_trend = (n * response_xy - sum_x * response_sum) / denominator
+        success_trend = (n * success_xy - sum_x * success_sum) / denominator
+    else:
+        response_std = success_std = cpu_std = 0.0
+        response_trend = success_trend = 0.0
+
+    return (
+        recent_response / recent_count,
+        recent_cpu / recent_count,
+        recent_error / recent_count,
+        recent_workers / recent_count,
+        recent_queue / recent_count,
+        response0 + response_sum / n,
+        response_std,
+        success0 + success_sum / n,
+        success_std,
+        cpu0 + cpu_sum / n,
+        cpu_std,
+        response_trend,
+        success_trend,
+    )
+
+
+# JIT-compile the window-stats kernel when Numba is installed
+if NUMBA_AVAILABLE:
+    _window_stats_kernel = njit(cache=True, fastmath=True)(_python_window_stats)
+else:
+    _window_stats_kernel = None
+
+
+def _compute_window_stats(window: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Reduce a performance-history window to the statistics all detectors use.
+
+    Recent means cover the newest 5 samples; means, standard deviations and
+    trends cover the whole window.
+
+    Args:
+        window: Per-metric columns from _MetricRing.window, oldest-first
+
+    Returns:
+        Dict of window statistics keyed by name
+    """
+    sample_count = len(window["timestamp"])
+    stats = {"sample_count": sample_count}
+    if sample_count == 0:
+        return stats
+
+    # One fused loop, compiled with Numba or run as plain Python without NumPy
+    if not NUMPY_AVAILABLE or _window_stats_kernel is not None:
+        kernel = _window_stats_kernel if NUMPY_AVAILABLE else _python_window_stats
+        values = kernel(
+            window["avg_response_time"],
+            window["success_rate"],
+            window["cpu_usage"],
+            window["error_rate"],
+            window["active_workers"],
+            window["queue_length"],
+        )
+        stats.update(zip(_WINDOW_STAT_KEYS, map(float, values)))
+        return stats
+
+    # Vectorized NumPy reductions otherwise: one stacked reduction for the
+    # recent means and one per statistic for the whole-window metrics
+    recent = np.stack(
+        [
+            window[name][-_RECENT_SAMPLE_COUNT:]
+            for name in (
+                "avg_response_time",
+                "cpu_usage",
+                "error_rate",
+                "active_workers",
+                "queue_length",
+            )
+        ]
+    )
+    stats.update(zip(_WINDOW_STAT_KEYS[:5], recent.mean(axis=1).tolist()))
+
+    metrics = np.stack(
+        (window["avg_response_time"], window["success_rate"], window["cpu_usage"]),
+        axis=1,
+    )
+    means = metrics.mean(axis=0).tolist()
+    stds = metrics.std(axis=0, ddof=1).tolist() if sample_count > 1 else [0.0] * 3
+    for key, mean, std in zip(("response", "success", "cpu"), means, stds):
+        stats[f"{key}_mean"] = mean
+        stats[f"{key}_std"] = std
+
+    stats["response_trend"] = _trend_slope(window["avg_response_time"])
+    stats["success_trend"] = _trend_slope(window["success_rate"])
+    return stats
+
+
+_SIGNATURE_FIELDS = (
+    "avg_response_time",
+    "success_rate",
+    "cpu_usage",
+    "error_rate",
+    "active_workers",
+    "queue_length",
+)
+
+
+def _window_signature(window: Dict[str, Any], min_workers: int) -> int:
+    """
+    Fingerprint the metric columns pattern detection reads.
+
+    Timestamps are left out: they change with every sample but never affect
+    the detected patterns.
+    """
+    if NUMPY_AVAILABLE:
+        columns = tuple(window[name].tobytes() for name in _SIGNATURE_FIELDS)
+    else:
+        columns = tuple(tuple(window[name]) for name in _SIGNATURE_FIELDS)
+    return hash((columns, min_workers))
+
+
+class _MetricRing:
+    """
+    Fixed-size ring buffer of performance samples stored column-wise.
+
+    Each metric lives in its own preallocated float64 NumPy array (or Python
+    list without NumPy), so detectors reduce contiguous columns instead of
+    rebuilding lists from per-sample dicts. Once full, each append overwrites
+    the oldest sample.
+    """
+
+    FIELDS = (
+        "timestamp",
+        "success_rate",
+        "avg_response_time",
+        "cpu_usage",
+        "memory_usage",
+        "active_workers",
+        "queue_length",
+        "error_rate",
+    )
+    INT_FIELDS = frozenset(("active_workers", "queue_length"))
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._head = 0  # Slot the next append writes to
+        self._count = 0
+        if NUMPY_AVAILABLE:
+            self._columns = {name: np.zeros(capacity) for name in self.FIELDS}
+        else:
+            self._columns = {name: [0.0] * capacity for name in self.FIELDS}
+        self._column_list = tuple(self._columns.values())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        """Get a sample (or list of samples for a slice) as a dict, oldest-first."""
+        if isinstance(index, slice):
+            return [self._sample(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("performance history index out of range")
+        return self._sample(index)
+
+    def _sample(self, index: int) -> Dict[str, Any]:
+        slot = (self._head - self._count + index) % self.capacity
+        return {
+            name: (
+                int(column[slot]) if name in self.INT_FIELDS else float(column[slot])
+            )
+            for name, column in self._columns.items()
+        }
+
+    def append(self, *values: float) -> None:
+        """Record a sample in FIELDS order, overwriting the oldest when full."""
+        head = self._head
+        for column, value in zip(self._column_list, values):
+            column[head] = value
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Drop all samples (storage is kept for reuse)."""
+        self._head = 0
+        self._count = 0
+
+    def window(self, size: int) -> Dict[str, Any]:
+        """
+        Get the newest samples as per-metric columns, oldest-first.
+
+        Columns are views into the buffer unless the window wraps around its
+        end, in which case the two halves are joined into a copy.
+        """
+        size = min(size, self._count)
+        start = (self._head - size) % self.capacity
+        end = start + size
+        if end <= self.capacity:
+            return {name: column[start:end] for name, column in self._columns.items()}
+
+        end -= self.capacity
+        if NUMPY_AVAILABLE:
+            return {
+                name: np.concatenate((column[start:], column[:end]))
+                for name, column in self._columns.items()
+            }
+        return {
+            name: column[start:] + column[:end]
+            for name, column in self._columns.items()
+        }
 
 
 class AutoTuningEngine:
@@ -86,7 +482,7 @@ class AutoTuningEngine:
         self.tuning_params = TuningParameters()
 
         # Performance history tracking
-        self.performance_history = deque(maxlen=1000)
+        self.performance_history = _MetricRing(capacity=1000)
         self.parameter_effectiveness = defaultdict(list)
         self.pattern_history = deque(maxlen=100)
 
@@ -100,10 +496,37 @@ class AutoTuningEngine:
         self.successful_tunings = 0
         self.failed_tunings = 0
         self.total_improvements = 0.0
+        self._stats_dirty = True  # Set whenever the tracked counters change
+        self._stats_cache: Optional[Dict[str, Any]] = None
+
+        # Tuning cycles rerun pattern detection only every few samples, since
+        # the 20-sample window barely moves between adjacent cycles
+        self._detect_every = 5
+        self._samples_since_detect = 0
+        self._last_patterns: List[PerformancePattern] = []
+
+        # Fingerprint of the last detection window; an unchanged window
+        # (e.g. a plateau of identical samples) reuses the detected patterns
+        self._last_detect_sig: Optional[int] = None
+        self._last_detect_patterns: List[PerformancePattern] = []
+
+        # Recommendations are recycled between cycles: the first
+        # _rec_pool_in_use entries belong to the current cycle
+        self._rec_pool: List[TuningRecommendation] = []
+        self._rec_pool_in_use: int = 0
+
+        # Recommendation builders keyed by pattern type
+        self._pattern_dispatch = {
+            "peak_load": self._rec_peak_load,
+            "low_activity": self._rec_low_activity,
+            "degrading": self._rec_degrading,
+            "steady_state": self._rec_steady_state,
+        }
 
-        logger.info("Auto-Tuning Engine initialized")
-        logger.info(f"   Learning rate: {learning_rate}")
-        logger.info(f"   Parameter count: {len(asdict(self.tuning_params))}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Auto-Tuning Engine initialized")
+            logger.info("   Learning rate: %s", learning_rate)
+            logger.info("   Parameter count: %d", len(_ParamIdx))
 
     def collect_performance_sample(self, metrics: Dict[str, Any]) -> None:
         """
@@ -112,44 +535,24 @@ class AutoTuningEngine:
         Args:
             metrics: Performance metrics from the scraping system
         """
-        timestamp = time.time()
-
-        # Helper function to safely get numeric values
-        def safe_get(key: str, default: float) -> float:
-            value = metrics.get(key, default)
-            if value is None or (isinstance(value, str) and value == "invalid"):
-                return default
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default
-
-        def safe_get_int(key: str, default: int) -> int:
-            value = metrics.get(key, default)
-            if value is None or (isinstance(value, str) and value == "invalid"):
-                return default
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return default
-
-        # Create performance sample with safe value extraction
-        sample = {
-            "timestamp": timestamp,
-            "success_rate": safe_get("success_rate", 0.0),
-            "avg_response_time": safe_get("avg_processing_time", 0.0),
-            "cpu_usage": safe_get("cpu_usage_percent", 0.0),
-            "memory_usage": safe_get("memory_usage_mb", 0.0),
-            "active_workers": safe_get_int("active_workers", 0),
-            "queue_length": safe_get_int("queue_length", 0),
-            "error_rate": safe_get("error_rate", 0.0),
-        }
+        # Write the sample straight into the history columns (in FIELDS order)
+        self.performance_history.append(
+            time.time(),
+            _safe_float(metrics, "success_rate", 0.0),
+            _safe_float(metrics, "avg_processing_time", 0.0),
+            _safe_float(metrics, "cpu_usage_percent", 0.0),
+            _safe_float(metrics, "memory_usage_mb", 0.0),
+            _safe_int(metrics, "active_workers", 0),
+            _safe_int(metrics, "queue_length", 0),
+            _safe_float(metrics, "error_rate", 0.0),
+        )
 
-        self.performance_history.append(sample)
+        self._stats_dirty = True
+        self._samples_since_detect += 1
 
         # Set baseline if this is the first sample
         if self.baseline_performance is None:
-            self.baseline_performance = sample.copy()
+            self.baseline_performance = self.performance_history[-1]
             logger.info("📊 Baseline performance established")
 
     def detect_performance_patterns(self) -> List[PerformancePattern]:
@@ -162,55 +565,69 @@ class AutoTuningEngine:
         if len(self.performance_history) < 3:
             return []
 
+        window = self.performance_history.window(_DETECTION_WINDOW_SIZE)
+        sig = _window_signature(window, self.tuning_params.min_workers)
+        if sig == self._last_detect_sig:
+            patterns = list(self._last_detect_patterns)
+            self._record_patterns(patterns)
+            return patterns
+
         patterns = []
-        recent_data = list(self.performance_history)[-20:]  # Last 20 samples
+        # Reduce the window once and share the results with all detectors
+        stats = _compute_window_stats(window)
 
         # Pattern 1: Peak Load Detection
-        peak_pattern = self._detect_peak_load_pattern(recent_data)
+        peak_pattern = self._detect_peak_load_pattern(stats)
         if peak_pattern:
             patterns.append(peak_pattern)
 
         # Pattern 2: Performance Degradation
-        degradation_pattern = self._detect_degradation_pattern(recent_data)
+        degradation_pattern = self._detect_degradation_pattern(stats)
         if degradation_pattern:
             patterns.append(degradation_pattern)
 
         # Pattern 3: Low Activity Period
-        low_activity_pattern = self._detect_low_activity_pattern(recent_data)
+        low_activity_pattern = self._detect_low_activity_pattern(stats)
         if low_activity_pattern:
             patterns.append(low_activity_pattern)
 
         # Pattern 4: Steady State
-        steady_state_pattern = self._detect_steady_state_pattern(recent_data)
+        steady_state_pattern = self._detect_steady_state_pattern(stats)
         if steady_state_pattern:
             patterns.append(steady_state_pattern)
 
-        # Store patterns for historical analysis
-        for pattern in patterns:
-            self.pattern_history.append({"timestamp": time.time(), "pattern": pattern})
-
-        return patterns
+        self._last_detect_sig = sig
+        self._last_detect_patterns = patterns
+        self._record_patterns(patterns)
+        return list(patterns)
+
+    def _record_patterns(self, patterns: List[PerformancePattern]) -> None:
+        """Store patterns for historical analysis"""
+        if patterns:
+            detected_at = time.time()
+            for pattern in patterns:
+                self.pattern_history.append(
+                    {"timestamp": detected_at, "pattern": pattern}
+                )
+            self._stats_dirty = True
 
     def _detect_peak_load_pattern(
-        self, data: List[Dict]
+        self, stats: Dict[str, float]
     ) -> Optional[PerformancePattern]:
         """Detect if system is under peak load"""
-        if len(data) < 3:
+        sample_count = stats["sample_count"]
+        if sample_count < 3:
             return None
 
-        # Calculate recent averages
-        recent_response_times = [d["avg_response_time"] for d in data[-5:]]
-        recent_cpu = [d["cpu_usage"] for d in data[-5:]]
-        recent_errors = [d["error_rate"] for d in data[-5:]]
-
-        avg_response_time = statistics.mean(recent_response_times)
-        avg_cpu = statistics.mean(recent_cpu)
-        avg_error_rate = statistics.mean(recent_errors)
+        # Recent averages
+        avg_response_time = stats["recent_response_mean"]
+        avg_cpu = stats["recent_cpu_mean"]
+        avg_error_rate = stats["recent_error_mean"]
 
-        # Peak load indicators - more lenient thresholds for testing
-        high_response_time = avg_response_time > 10.0  # 10 seconds threshold
-        high_cpu = avg_cpu > 70.0  # 70% CPU threshold
-        increasing_errors = avg_error_rate > 0.1  # 10% error rate
+        # Peak load indicators
+        high_response_time = avg_response_time > _PEAK_RESPONSE_TIME_SECONDS
+        high_cpu = avg_cpu > _PEAK_CPU_PERCENT
+        increasing_errors = avg_error_rate > _PEAK_ERROR_RATE
 
         if high_response_time or high_cpu or increasing_errors:
             confidence = min(
@@ -222,7 +639,7 @@ class AutoTuningEngine:
             return PerformancePattern(
                 pattern_type="peak_load",
                 confidence=confidence,
-                duration_minutes=len(data) * 0.5,  # Assuming 30-second intervals
+                duration_minutes=sample_count * _SAMPLE_INTERVAL_MINUTES,
                 characteristics={
                     "avg_response_time": avg_response_time,
                     "avg_cpu_usage": avg_cpu,
@@ -234,27 +651,20 @@ class AutoTuningEngine:
         return None
 
     def _detect_degradation_pattern(
-        self, data: List[Dict]
+        self, stats: Dict[str, float]
     ) -> Optional[PerformancePattern]:
         """Detect if performance is degrading over time"""
-        if len(data) < 5:
+        sample_count = stats["sample_count"]
+        if sample_count < 5:
             return None
 
-        # Check for declining performance trends
-        response_times = [d["avg_response_time"] for d in data]
-        success_rates = [d["success_rate"] for d in data]
-
         # Simple trend detection (slope analysis)
-        n = len(response_times)
-        x_vals = list(range(n))
-
-        # Calculate response time trend
-        response_trend = self._calculate_trend_slope(x_vals, response_times)
-        success_trend = self._calculate_trend_slope(x_vals, success_rates)
+        response_trend = stats["response_trend"]
+        success_trend = stats["success_trend"]
 
         # Degradation indicators
-        increasing_response_time = response_trend > 0.1
-        decreasing_success_rate = success_trend < -0.01
+        increasing_response_time = response_trend > _DEGRADING_RESPONSE_TREND
+        decreasing_success_rate = success_trend < _DEGRADING_SUCCESS_TREND
 
         if increasing_response_time or decreasing_success_rate:
             confidence = min(1.0, abs(response_trend) + abs(success_trend))
@@ -262,7 +672,7 @@ class AutoTuningEngine:
             return PerformancePattern(
                 pattern_type="degrading",
                 confidence=confidence,
-                duration_minutes=len(data) * 0.5,
+                duration_minutes=sample_count * _SAMPLE_INTERVAL_MINUTES,
                 characteristics={
                     "response_time_trend": response_trend,
                     "success_rate_trend": success_trend,
@@ -273,32 +683,34 @@ class AutoTuningEngine:
         return None
 
     def _detect_low_activity_pattern(
-        self, data: List[Dict]
+        self, stats: Dict[str, float]
     ) -> Optional[PerformancePattern]:
         """Detect periods of low activity"""
-        if len(data) < 3:
+        sample_count = stats["sample_count"]
+        if sample_count < 3:
             return None
 
-        recent_workers = [d["active_workers"] for d in data[-5:]]
-        recent_queue = [d["queue_length"] for d in data[-5:]]
-        recent_cpu = [d["cpu_usage"] for d in data[-5:]]
-
-        avg_workers = statistics.mean(recent_workers)
-        avg_queue = statistics.mean(recent_queue)
-        avg_cpu = statistics.mean(recent_cpu)
+        avg_workers = stats["recent_worker_mean"]
+        avg_queue = stats["recent_queue_mean"]
+        avg_cpu = stats["recent_cpu_mean"]
 
         # Low activity indicators
-        low_utilization = avg_cpu < 30.0
-        small_queue = avg_queue < 2.0
-        moderate_workers = avg_workers > self.tuning_params.min_workers + 2
+        low_utilization = avg_cpu < _LOW_ACTIVITY_CPU_PERCENT
+        small_queue = avg_queue < _LOW_ACTIVITY_QUEUE_LENGTH
+        moderate_workers = (
+            avg_workers > self.tuning_params.min_workers + _LOW_ACTIVITY_WORKER_MARGIN
+        )
 
         if low_utilization and small_queue and moderate_workers:
-            confidence = (30.0 - avg_cpu) / 30.0  # Higher confidence with lower CPU
+            # Higher confidence with lower CPU
+            confidence = (
+                _LOW_ACTIVITY_CPU_PERCENT - avg_cpu
+            ) / _LOW_ACTIVITY_CPU_PERCENT
 
             return PerformancePattern(
                 pattern_type="low_activity",
                 confidence=confidence,
-                duration_minutes=len(data) * 0.5,
+                duration_minutes=sample_count * _SAMPLE_INTERVAL_MINUTES,
                 characteristics={
                     "avg_cpu_usage": avg_cpu,
                     "avg_queue_length": avg_queue,
@@ -310,38 +722,28 @@ class AutoTuningEngine:
         return None
 
     def _detect_steady_state_pattern(
-        self, data: List[Dict]
+        self, stats: Dict[str, float]
     ) -> Optional[PerformancePattern]:
         """Detect steady state operation"""
-        if len(data) < 10:
+        sample_count = stats["sample_count"]
+        if sample_count < 10:
             return None
 
-        # Check for stability in key metrics
-        response_times = [d["avg_response_time"] for d in data]
-        success_rates = [d["success_rate"] for d in data]
-        cpu_usage = [d["cpu_usage"] for d in data]
-
-        # Calculate coefficient of variation (std dev / mean)
-        response_cv = (
-            statistics.stdev(response_times) / statistics.mean(response_times)
-            if statistics.mean(response_times) > 0
-            else 1.0
-        )
-        success_cv = (
-            statistics.stdev(success_rates) / statistics.mean(success_rates)
-            if statistics.mean(success_rates) > 0
-            else 1.0
-        )
-        cpu_cv = (
-            statistics.stdev(cpu_usage) / statistics.mean(cpu_usage)
-            if statistics.mean(cpu_usage) > 0
-            else 1.0
+        # Check for stability in key metrics via the coefficient of
+        # variation (std dev / mean)
+        response_cv, success_cv, cpu_cv = (
+            (
+                stats[f"{name}_std"] / stats[f"{name}_mean"]
+                if stats[f"{name}_mean"] > 0
+                else 1.0
+            )
+            for name in ("response", "success", "cpu")
         )
 
         # Steady state indicators (low variation)
-        stable_response = response_cv < 0.2
-        stable_success = success_cv < 0.1
-        stable_cpu = cpu_cv < 0.3
+        stable_response = response_cv < _STEADY_RESPONSE_CV
+        stable_success = success_cv < _STEADY_SUCCESS_CV
+        stable_cpu = cpu_cv < _STEADY_CPU_CV
 
         if stable_response and stable_success and stable_cpu:
             confidence = 1.0 - (response_cv + success_cv + cpu_cv) / 3.0
@@ -349,7 +751,7 @@ class AutoTuningEngine:
             return PerformancePattern(
                 pattern_type="steady_state",
                 confidence=confidence,
-                duration_minutes=len(data) * 0.5,
+                duration_minutes=sample_count * _SAMPLE_INTERVAL_MINUTES,
                 characteristics={
                     "response_time_stability": response_cv,
                     "success_rate_stability": success_cv,
@@ -360,24 +762,6 @@ class AutoTuningEngine:
 
         return None
 
-    def _calculate_trend_slope(self, x_vals: List[float], y_vals: List[float]) -> float:
-        """Calculate the slope of a trend line"""
-        if len(x_vals) != len(y_vals) or len(x_vals) < 2:
-            return 0.0
-
-        n = len(x_vals)
-        sum_x = sum(x_vals)
-        sum_y = sum(y_vals)
-        sum_xy = sum(x * y for x, y in zip(x_vals, y_vals))
-        sum_x2 = sum(x * x for x in x_vals)
-
-        # Calculate slope using least squares method
-        if n * sum_x2 - sum_x * sum_x == 0:
-            return 0.0
-
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        return slope
-
     def generate_tuning_recommendations(
         self, patterns: List[PerformancePattern]
     ) -> List[TuningRecommendation]:
@@ -393,7 +777,8 @@ class AutoTuningEngine:
         recommendations = []
 
         for pattern in patterns:
-            if pattern.confidence < 0.5:  # Skip low-confidence patterns
+            # Skip low-confidence patterns
+            if pattern.confidence < _MIN_PATTERN_CONFIDENCE:
                 continue
 
             pattern_recommendations = self._get_pattern_recommendations(pattern)
@@ -406,139 +791,215 @@ class AutoTuningEngine:
         self, pattern: PerformancePattern
     ) -> List[TuningRecommendation]:
         """Get recommendations for a specific pattern"""
+        handler = self._pattern_dispatch.get(pattern.pattern_type)
+        if handler is None:
+            return []
+        return handler(pattern)
+
+    def _rec_peak_load(self, pattern: PerformancePattern) -> List[TuningRecommendation]:
+        """Recommendations for a system under peak load"""
+        params = self.tuning_params
         recommendations = []
 
-        if pattern.pattern_type == "peak_load":
-            # FIXED: Recommend scaling DOWN and reducing load when system is overloaded
-            if self.tuning_params.max_workers > 5:
-                recommendations.append(
-                    TuningRecommendation(
-                        parameter_name="max_workers",
-                        current_value=self.tuning_params.max_workers,
-                        recommended_value=max(5, self.tuning_params.max_workers - 3),
-                        confidence=pattern.confidence,
-                        reason=f"Peak load detected - reducing workers (confidence: {pattern.confidence:.2f})",
-                        expected_improvement="Reduced system stress and improved stability",
-                    )
+        # FIXED: Recommend scaling DOWN and reducing load when system is overloaded
+        if params.max_workers > 5:
+            recommendations.append(
+                self._acquire_rec(
+                    parameter_name="max_workers",
+                    current_value=params.max_workers,
+                    recommended_value=max(5, params.max_workers - 3),
+                    confidence=pattern.confidence,
+                    reason=f"Peak load detected - reducing workers (confidence: {pattern.confidence:.2f})",
+                    expected_improvement="Reduced system stress and improved stability",
                 )
+            )
 
-            # Increase timeouts to handle slower responses under load
-            if self.tuning_params.page_timeout_ms < 45000:
-                recommendations.append(
-                    TuningRecommendation(
-                        parameter_name="page_timeout_ms",
-                        current_value=self.tuning_params.page_timeout_ms,
-                        recommended_value=min(
-                            45000, self.tuning_params.page_timeout_ms + 10000
-                        ),
-                        confidence=pattern.confidence * 0.8,
-                        reason="Peak load - increase timeout tolerance",
-                        expected_improvement="Reduced timeout errors",
-                    )
+        # Increase timeouts to handle slower responses under load
+        if params.page_timeout_ms < 45000:
+            recommendations.append(
+                self._acquire_rec(
+                    parameter_name="page_timeout_ms",
+                    current_value=params.page_timeout_ms,
+                    recommended_value=min(45000, params.page_timeout_ms + 10000),
+                    confidence=pattern.confidence * 0.8,
+                    reason="Peak load - increase timeout tolerance",
+                    expected_improvement="Reduced timeout errors",
                 )
+            )
 
-        elif pattern.pattern_type == "low_activity":
-            # FIXED: Recommend scaling UP to utilize available resources and increase output
-            if self.tuning_params.max_workers < 25:
-                recommendations.append(
-                    TuningRecommendation(
-                        parameter_name="max_workers",
-                        current_value=self.tuning_params.max_workers,
-                        recommended_value=min(25, self.tuning_params.max_workers + 3),
-                        confidence=pattern.confidence,
-                        reason=f"Low activity - scaling up to utilize resources (confidence: {pattern.confidence:.2f})",
-                        expected_improvement="Increased throughput with available resources",
-                    )
-                )
+        return recommendations
 
-            # Optimize timeouts for faster operation
-            if self.tuning_params.page_timeout_ms > 20000:
-                recommendations.append(
-                    TuningRecommendation(
-                        parameter_name="page_timeout_ms",
-                        current_value=self.tuning_params.page_timeout_ms,
-                        recommended_value=max(
-                            20000, self.tuning_params.page_timeout_ms - 5000
-                        ),
-                        confidence=pattern.confidence * 0.7,
-                        reason="Low activity - optimize for speed",
-                        expected_improvement="Faster response times",
-                    )
-                )
+    def _rec_low_activity(
+        self, pattern: PerformancePattern
+    ) -> List[TuningRecommendation]:
+        """Recommendations for a period of low activity"""
+        params = self.tuning_params
+        recommendations = []
 
-        elif pattern.pattern_type == "degrading":
-            # Recommend conservative adjustments and cleanup
+        # FIXED: Recommend scaling UP to utilize available resources and increase output
+        if params.max_workers < 25:
             recommendations.append(
-                TuningRecommendation(
-                    parameter_name="memory_cleanup_interval",
-                    current_value=self.tuning_params.memory_cleanup_interval,
-                    recommended_value=max(
-                        50, self.tuning_params.memory_cleanup_interval - 20
-                    ),
+                self._acquire_rec(
+                    parameter_name="max_workers",
+                    current_value=params.max_workers,
+                    recommended_value=min(25, params.max_workers + 3),
                     confidence=pattern.confidence,
-                    reason="Performance degradation - increase cleanup frequency",
-                    expected_improvement="Better memory management",
+                    reason=f"Low activity - scaling up to utilize resources (confidence: {pattern.confidence:.2f})",
+                    expected_improvement="Increased throughput with available resources",
                 )
             )
 
+        # Optimize timeouts for faster operation
+        if params.page_timeout_ms > 20000:
             recommendations.append(
-                TuningRecommendation(
-                    parameter_name="gc_threshold",
-                    current_value=self.tuning_params.gc_threshold,
-                    recommended_value=max(20, self.tuning_params.gc_threshold - 10),
-                    confidence=pattern.confidence * 0.8,
-                    reason="Performance degradation - more aggressive garbage collection",
-                    expected_improvement="Reduced memory pressure",
+                self._acquire_rec(
+                    parameter_name="page_timeout_ms",
+                    current_value=params.page_timeout_ms,
+                    recommended_value=max(20000, params.page_timeout_ms - 5000),
+                    confidence=pattern.confidence * 0.7,
+                    reason="Low activity - optimize for speed",
+                    expected_improvement="Faster response times",
                 )
             )
 
-        elif pattern.pattern_type == "steady_state":
-            # Fine-tune for optimal performance
-            characteristics = pattern.characteristics
-
-            # If response times are good, we can be more aggressive
-            if characteristics.get("response_time_stability", 1.0) < 0.1:
-                recommendations.append(
-                    TuningRecommendation(
-                        parameter_name="scale_up_threshold",
-                        current_value=self.tuning_params.scale_up_threshold,
-                        recommended_value=min(
-                            0.98, self.tuning_params.scale_up_threshold + 0.01
-                        ),
-                        confidence=pattern.confidence * 0.6,
-                        reason="Steady high performance - optimize scaling threshold",
-                        expected_improvement="More precise scaling decisions",
-                    )
+        return recommendations
+
+    def _rec_degrading(self, pattern: PerformancePattern) -> List[TuningRecommendation]:
+        """Recommendations for degrading performance"""
+        params = self.tuning_params
+        recommendations = []
+
+        # Recommend conservative adjustments and cleanup
+        recommendations.append(
+            self._acquire_rec(
+                parameter_name="memory_cleanup_interval",
+                current_value=params.memory_cleanup_interval,
+                recommended_value=max(50, params.memory_cleanup_interval - 20),
+                confidence=pattern.confidence,
+                reason="Performance degradation - increase cleanup frequency",
+                expected_improvement="Better memory management",
+            )
+        )
+
+        recommendations.append(
+            self._acquire_rec(
+                parameter_name="gc_threshold",
+                current_value=params.gc_threshold,
+                recommended_value=max(20, params.gc_threshold - 10),
+                confidence=pattern.confidence * 0.8,
+                reason="Performance degradation - more aggressive garbage collection",
+                expected_improvement="Reduced memory pressure",
+            )
+        )
+
+        return recommendations
+
+    def _rec_steady_state(
+        self, pattern: PerformancePattern
+    ) -> List[TuningRecommendation]:
+        """Recommendations for steady-state operation"""
+        params = self.tuning_params
+        recommendations = []
+
+        # Fine-tune for optimal performance
+        characteristics = pattern.characteristics
+
+        # If response times are good, we can be more aggressive
+        if characteristics.get("response_time_stability", 1.0) < 0.1:
+            recommendations.append(
+                self._acquire_rec(
+                    parameter_name="scale_up_threshold",
+                    current_value=params.scale_up_threshold,
+                    recommended_value=min(0.98, params.scale_up_threshold + 0.01),
+                    confidence=pattern.confidence * 0.6,
+                    reason="Steady high performance - optimize scaling threshold",
+                    expected_improvement="More precise scaling decisions",
                 )
+            )
 
         return recommendations
 
+    def _acquire_rec(
+        self,
+        parameter_name: str,
+        current_value: Any,
+        recommended_value: Any,
+        confidence: float,
+        reason: str,
+        expected_improvement: str,
+    ) -> TuningRecommendation:
+        """Take a recommendation from the pool, allocating when it is exhausted"""
+        in_use = self._rec_pool_in_use
+        if in_use >= _REC_POOL_SIZE:
+            # Unusually many recommendations this cycle: don't grow the pool
+            return TuningRecommendation(
+                parameter_name,
+                current_value,
+                recommended_value,
+                confidence,
+                reason,
+                expected_improvement,
+            )
+
+        self._rec_pool_in_use = in_use + 1
+        if in_use == len(self._rec_pool):
+            rec = TuningRecommendation(
+                parameter_name,
+                current_value,
+                recommended_value,
+                confidence,
+                reason,
+                expected_improvement,
+            )
+            self._rec_pool.append(rec)
+            return rec
+
+        rec = self._rec_pool[in_use]
+        rec.parameter_name = parameter_name
+        rec.current_value = current_value
+        rec.recommended_value = recommended_value
+        rec.confidence = confidence
+        rec.reason = reason
+        rec.expected_improvement = expected_improvement
+        rec.param_idx = _ParamIdx[parameter_name]
+        return rec
+
+    def _release_recs(self) -> None:
+        """Return every pooled recommendation for reuse by the next cycle"""
+        self._rec_pool_in_use = 0
+
     def _prioritize_recommendations(
         self, recommendations: List[TuningRecommendation]
     ) -> List[TuningRecommendation]:
         """Sort and deduplicate recommendations by priority"""
-        # Remove duplicates by parameter name (keep highest confidence)
-        param_recommendations = {}
+        # Remove duplicates by parameter (keep highest confidence), remembering
+        # first-seen order so equal confidences keep their original order
+        best: List[Optional[TuningRecommendation]] = [None] * len(_ParamIdx)
+        first_seen = []
         for rec in recommendations:
-            if (
-                rec.parameter_name not in param_recommendations
-                or rec.confidence > param_recommendations[rec.parameter_name].confidence
-            ):
-                param_recommendations[rec.parameter_name] = rec
+            current = best[rec.param_idx]
+            if current is None:
+                first_seen.append(rec.param_idx)
+                best[rec.param_idx] = rec
+            elif rec.confidence > current.confidence:
+                best[rec.param_idx] = rec
 
         # Sort by confidence (highest first)
-        sorted_recommendations = sorted(
-            param_recommendations.values(), key=lambda x: x.confidence, reverse=True
+        return sorted(
+            (best[param_idx] for param_idx in first_seen),
+            key=attrgetter("confidence"),
+            reverse=True,
         )
 
-        return sorted_recommendations
-
     def apply_tuning_recommendations(
         self, recommendations: List[TuningRecommendation]
     ) -> Dict[str, Any]:
         """
         Apply tuning recommendations to the configuration.
 
+        Pooled recommendations are released afterwards, so callers must not
+        hold on to them past this call.
+
         Args:
             recommendations: List of tuning recommendations to apply
 
@@ -549,13 +1010,14 @@ class AutoTuningEngine:
         successful_changes = 0
 
         for rec in recommendations:
-            if rec.confidence < 0.6:  # Only apply high-confidence recommendations
+            # Only apply high-confidence recommendations
+            if rec.confidence < _MIN_APPLY_CONFIDENCE:
                 continue
 
             try:
                 # Apply the recommendation
-                old_value = getattr(self.tuning_params, rec.parameter_name)
-                setattr(self.tuning_params, rec.parameter_name, rec.recommended_value)
+                old_value = _PARAM_GETTERS[rec.param_idx](self.tuning_params)
+                self._set_param(rec.param_idx, rec.recommended_value)
 
                 applied_changes[rec.parameter_name] = {
                     "old_value": old_value,
@@ -567,17 +1029,24 @@ class AutoTuningEngine:
 
                 successful_changes += 1
 
-                logger.info(
-                    f"🔧 Applied tuning: {rec.parameter_name} = {rec.recommended_value} (was {old_value})"
-                )
-                logger.info(f"   Reason: {rec.reason}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "🔧 Applied tuning: %s = %s (was %s)",
+                        rec.parameter_name,
+                        rec.recommended_value,
+                        old_value,
+                    )
+                    logger.info("   Reason: %s", rec.reason)
 
             except Exception as e:
-                logger.error(f"❌ Failed to apply tuning for {rec.parameter_name}: {e}")
+                logger.error(
+                    "❌ Failed to apply tuning for %s: %s", rec.parameter_name, e
+                )
 
         self.successful_tunings += successful_changes
         self.optimization_cycles += 1
         self.last_tuning_time = time.time()
+        self._stats_dirty = True
 
         result = {
             "applied_changes": applied_changes,
@@ -585,20 +1054,26 @@ class AutoTuningEngine:
             "total_recommendations": len(recommendations),
             "optimization_cycle": self.optimization_cycles,
         }
+        self._release_recs()
 
         if successful_changes > 0:
             logger.info(
-                f"🎯 Auto-tuning cycle {self.optimization_cycles} completed: {successful_changes} changes applied"
+                "🎯 Auto-tuning cycle %d completed: %d changes applied",
+                self.optimization_cycles,
+                successful_changes,
             )
 
         return result
 
-    def run_auto_tuning_cycle(self, current_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def run_auto_tuning_cycle(
+        self, current_metrics: Dict[str, Any], include_stats: bool = True
+    ) -> Dict[str, Any]:
         """
         Run a complete auto-tuning cycle.
 
         Args:
             current_metrics: Current performance metrics
+            include_stats: Add the tuning statistics snapshot to the results
 
         Returns:
             Results of the tuning cycle
@@ -606,8 +1081,11 @@ class AutoTuningEngine:
         # Collect performance sample
         self.collect_performance_sample(current_metrics)
 
-        # Detect patterns
-        patterns = self.detect_performance_patterns()
+        # Detect patterns (reusing the last result between detection runs)
+        if self._samples_since_detect >= self._detect_every:
+            self._last_patterns = self.detect_performance_patterns()
+            self._samples_since_detect = 0
+        patterns = self._last_patterns
 
         # Generate recommendations
         recommendations = self.generate_tuning_recommendations(patterns)
@@ -616,20 +1094,28 @@ class AutoTuningEngine:
         results = self.apply_tuning_recommendations(recommendations)
 
         # Update results with pattern information
-        results.update(
-            {
-                "patterns_detected": [p.pattern_type for p in patterns],
-                "pattern_count": len(patterns),
-                "performance_samples": len(self.performance_history),
-                "tuning_statistics": self.get_tuning_statistics(),
-            }
-        )
+        results["patterns_detected"] = [p.pattern_type for p in patterns]
+        results["pattern_count"] = len(patterns)
+        results["performance_samples"] = len(self.performance_history)
+        if include_stats:
+            results["tuning_statistics"] = self.get_tuning_statistics()
 
         return results
 
     def get_tuning_statistics(self) -> Dict[str, Any]:
-        """Get auto-tuning performance statistics"""
-        return {
+        """
+        Get auto-tuning performance statistics.
+
+        The cached statistics are recomputed only after samples, patterns or
+        tuning cycles have been recorded (or the history was cleared); each
+        call returns its own copy.
+        """
+        if not self._stats_dirty and self._stats_cache[
+            "performance_history_size"
+        ] == len(self.performance_history):
+            return dict(self._stats_cache)
+
+        stats = {
             "optimization_cycles": self.optimization_cycles,
             "successful_tunings": self.successful_tunings,
             "failed_tunings": self.failed_tunings,
@@ -639,10 +1125,18 @@ class AutoTuningEngine:
             "patterns_detected_count": len(self.pattern_history),
             "performance_history_size": len(self.performance_history),
         }
+        self._stats_cache = stats
+        self._stats_dirty = False
+        return dict(stats)
+
+    def _set_param(self, param_idx: int, value: Any) -> None:
+        """Set a tuning parameter by its _ParamIdx position."""
+        _PARAM_SETTERS[param_idx](self.tuning_params, value)
 
     def get_current_parameters(self) -> Dict[str, Any]:
         """Get current tuning parameters as dictionary"""
-        return asdict(self.tuning_params)
+        params = self.tuning_params
+        return {param.name: _PARAM_GETTERS[param](params) for param in _ParamIdx}
 
 
 # Global auto-tuning engine instance
@@ -650,9 +1144,23 @@ _auto_tuning_engine = None
 
 
 def initialize_auto_tuning(learning_rate: float = 0.1) -> AutoTuningEngine:
-    """Initialize the global auto-tuning engine"""
-    global _auto_tuning_engine
+    """
+    Initialize the global auto-tuning engine.
+
+    Also rebinds the module-level run_auto_tuning_cycle and
+    get_tuned_parameters to the engine's bound methods, so module attribute
+    calls skip the initialization check. Names imported before this call
+    keep the checked wrappers, which delegate to the same engine.
+    """
+    global _auto_tuning_engine, run_auto_tuning_cycle, get_tuned_parameters
     _auto_tuning_engine = AutoTuningEngine(learning_rate=learning_rate)
+    run_auto_tuning_cycle = _auto_tuning_engine.run_auto_tuning_cycle
+    get_tuned_parameters = _auto_tuning_engine.get_current_parameters
+
+    # Compile the Numba kernel now rather than on the first tuning cycle
+    if NUMPY_AVAILABLE and NUMBA_AVAILABLE:
+        warmup = np.zeros(10)
+        _window_stats_kernel(warmup, warmup, warmup, warmup, warmup, warmup)
     return _auto_tuning_engine
 
 
@@ -661,19 +1169,26 @@ def get_auto_tuning_engine() -> Optional[AutoTuningEngine]:
     return _auto_tuning_engine
 
 
-def run_auto_tuning_cycle(metrics: Dict[str, Any]) -> Dict[str, Any]:
+def _run_auto_tuning_cycle_checked(
+    metrics: Dict[str, Any], include_stats: bool = True
+) -> Dict[str, Any]:
     """Run an auto-tuning cycle with the global engine"""
     if _auto_tuning_engine is None:
         raise RuntimeError(
             "Auto-tuning engine not initialized. Call initialize_auto_tuning() first."
         )
 
-    return _auto_tuning_engine.run_auto_tuning_cycle(metrics)
+    return _auto_tuning_engine.run_auto_tuning_cycle(metrics, include_stats)
 
 
-def get_tuned_parameters() -> Dict[str, Any]:
+def _get_tuned_parameters_checked() -> Dict[str, Any]:
     """Get current auto-tuned parameters"""
     if _auto_tuning_engine is None:
         return {}
 
     return _auto_tuning_engine.get_current_parameters()
+
+
+# Checked entry points until initialize_auto_tuning rebinds them
+run_auto_tuning_cycle = _run_auto_tuning_cycle_checked
+get_tuned_parameters = _get_tuned_parameters_checked
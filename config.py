@@ -6,13 +6,71 @@ in a completely self-contained way, with no external dependencies.
 Consolidates scraper and optimization settings into a single, well-organized structure.
 """
 
+import functools
 import os
+import sys
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+# ============================================================================
+# ENVIRONMENT SNAPSHOT
+# All settings below are read from one copy of the environment taken at
+# import time. Each helper does a single dict lookup and only parses values
+# that are actually set; defaults are already typed.
+# ============================================================================
+# Keys are interned so lookups with the (compiler-interned) literal setting
+# names below match by identity instead of comparing string contents
+_ENV = {sys.intern(key): value for key, value in os.environ.items()}
+_env_get = _ENV.get  # Bound once; the snapshot is only ever updated in place
+
+
+def _env_str(key: str, default: str) -> str:
+    """Get a string setting from the environment snapshot."""
+    return _env_get(key, default)
+
+
+def _env_int(key: str, default: int) -> int:
+    """Get an integer setting from the environment snapshot."""
+    value = _env_get(key)
+    return default if value is None else int(value)
+
+
+def _env_float(key: str, default: float) -> float:
+    """Get a float setting from the environment snapshot."""
+    value = _env_get(key)
+    return default if value is None else float(value)
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    """Get a boolean setting ("true" in any case) from the environment snapshot."""
+    value = _env_get(key)
+    return default if value is None else value.lower() == "true"
+
+
+@functools.lru_cache(maxsize=1)
+def _json_dumps():
+    """
+    Get the JSON serializer for the config summary.
+
+    Imported on first use so that importing config stays cheap; orjson is
+    preferred when installed, with stdlib json as the fallback.
+    """
+    try:
+        import orjson
+
+        return orjson.dumps
+    except ImportError:
+        import json
+
+        return lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 class ScraperConfig:
     """Configuration settings for the parallel web scraper."""
 
+    # Settings live on the class; instances carry no per-instance dict
+    __slots__ = ()
+
     # ============================================================================
     # TARGET DOCUMENTATION CONFIGURATION
     # Defines the starting point and scope of the scraping operation.
@@ -44,53 +102,51 @@ class ScraperConfig:
     # PARALLEL PROCESSING CONFIGURATION
     # Controls the concurrency and scaling behavior of the scraper.
     # ============================================================================
-    MAX_CONCURRENT_PAGES = int(os.getenv("SCRAPER_MAX_CONCURRENT_PAGES", "500"))
+    MAX_CONCURRENT_PAGES = _env_int("SCRAPER_MAX_CONCURRENT_PAGES", 500)
     """The absolute maximum number of concurrent browser pages allowed."""
 
-    MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", "500"))
+    MAX_WORKERS = _env_int("SCRAPER_MAX_WORKERS", 500)
     """The upper limit for the adaptive scaling engine."""
 
-    MIN_WORKERS = int(os.getenv("SCRAPER_MIN_WORKERS", "20"))
+    MIN_WORKERS = _env_int("SCRAPER_MIN_WORKERS", 20)
     """The lower limit for the adaptive scaling engine."""
 
-    INITIAL_WORKERS = int(os.getenv("SCRAPER_INITIAL_WORKERS", "50"))
+    INITIAL_WORKERS = _env_int("SCRAPER_INITIAL_WORKERS", 50)
     """The number of workers to start with, for proactive scaling."""
 
-    MAX_DEPTH = int(os.getenv("SCRAPER_MAX_DEPTH", "999"))
+    MAX_DEPTH = _env_int("SCRAPER_MAX_DEPTH", 999)
     """The maximum depth to traverse in the documentation tree."""
 
-    MAX_SUBFOLDERS_TO_SPAWN = int(os.getenv("SCRAPER_MAX_SUBFOLDERS", "999"))
+    MAX_SUBFOLDERS_TO_SPAWN = _env_int("SCRAPER_MAX_SUBFOLDERS", 999)
     """The maximum number of subfolders a single worker can spawn tasks for."""
 
     # ============================================================================
     # TIMING CONFIGURATION
     # Fine-tunes the delays and timeouts for various operations.
     # ============================================================================
-    WORKER_STARTUP_DELAY = float(os.getenv("SCRAPER_STARTUP_DELAY", "0.05"))
+    WORKER_STARTUP_DELAY = _env_float("SCRAPER_STARTUP_DELAY", 0.05)
     """Delay between starting each worker to prevent overwhelming the system."""
 
-    PAGE_LOAD_TIMEOUT = float(os.getenv("SCRAPER_PAGE_TIMEOUT", "30.0"))
+    PAGE_LOAD_TIMEOUT = _env_float("SCRAPER_PAGE_TIMEOUT", 30.0)
     """Maximum time to wait for a page to load, in seconds."""
 
-    DOM_OPERATION_TIMEOUT = float(os.getenv("SCRAPER_DOM_TIMEOUT", "15.0"))
+    DOM_OPERATION_TIMEOUT = _env_float("SCRAPER_DOM_TIMEOUT", 15.0)
     """Maximum time to wait for a single DOM operation to complete, in seconds."""
 
-    WORKER_SHUTDOWN_TIMEOUT = float(os.getenv("SCRAPER_SHUTDOWN_TIMEOUT", "5.0"))
+    WORKER_SHUTDOWN_TIMEOUT = _env_float("SCRAPER_SHUTDOWN_TIMEOUT", 5.0)
     """Maximum time to wait for a worker to shut down gracefully, in seconds."""
 
-    PAGE_WAIT_AFTER_EXPAND = int(os.getenv("SCRAPER_EXPAND_WAIT", "500"))
+    PAGE_WAIT_AFTER_EXPAND = _env_int("SCRAPER_EXPAND_WAIT", 500)
     """Time to wait after expanding a node to allow content to load, in milliseconds."""
 
     # ============================================================================
     # MONITORING AND SCALING INTERVALS
     # Configures how frequently the system monitors performance and makes scaling decisions.
     # ============================================================================
-    REAL_TIME_MONITOR_ENABLED = (
-        os.getenv("SCRAPER_MONITOR_ENABLED", "false").lower() == "true"
-    )
+    REAL_TIME_MONITOR_ENABLED = _env_bool("SCRAPER_MONITOR_ENABLED", False)
     """Whether to enable the real-time monitoring dashboard."""
 
-    REAL_TIME_MONITOR_INTERVAL = int(os.getenv("SCRAPER_MONITOR_INTERVAL", "20"))
+    REAL_TIME_MONITOR_INTERVAL = _env_int("SCRAPER_MONITOR_INTERVAL", 20)
     """Update interval for the real-time monitor, in seconds."""
 
     # Legacy dashboard settings (deprecated - use REAL_TIME_MONITOR_* instead)
@@ -101,43 +157,43 @@ class ScraperConfig:
         REAL_TIME_MONITOR_ENABLED  # Use real-time monitor enabled setting
     )
 
-    DASHBOARD_DEMO_INTERVAL = float(os.getenv("SCRAPER_DASHBOARD_DEMO", "5.0"))
+    DASHBOARD_DEMO_INTERVAL = _env_float("SCRAPER_DASHBOARD_DEMO", 5.0)
     """Update interval for the dashboard's demo mode, in seconds."""
 
-    TREND_ANALYSIS_MIN_SAMPLES = int(os.getenv("SCRAPER_TREND_MIN_SAMPLES", "5"))
+    TREND_ANALYSIS_MIN_SAMPLES = _env_int("SCRAPER_TREND_MIN_SAMPLES", 5)
     """Minimum number of data points required to perform trend analysis."""
 
-    TREND_ANALYSIS_HISTORY_SIZE = int(os.getenv("SCRAPER_TREND_HISTORY_SIZE", "10"))
+    TREND_ANALYSIS_HISTORY_SIZE = _env_int("SCRAPER_TREND_HISTORY_SIZE", 10)
     """Maximum number of historical data points to store for trend analysis."""
 
-    TREND_COLLECTION_INTERVAL = float(os.getenv("SCRAPER_TREND_COLLECTION", "2.0"))
+    TREND_COLLECTION_INTERVAL = _env_float("SCRAPER_TREND_COLLECTION", 2.0)
     """Frequency of collecting data for trend analysis, in seconds."""
 
-    SCALING_CHECK_INTERVAL = float(os.getenv("SCRAPER_SCALING_CHECK", "2.0"))
+    SCALING_CHECK_INTERVAL = _env_float("SCRAPER_SCALING_CHECK", 2.0)
     """Frequency of checking if a scaling decision should be made, in seconds."""
 
-    SCALING_MONITOR_INTERVAL = float(os.getenv("SCRAPER_SCALING_MONITOR", "6.0"))
+    SCALING_MONITOR_INTERVAL = _env_float("SCRAPER_SCALING_MONITOR", 6.0)
     """Frequency of monitoring system performance for scaling purposes, in seconds."""
 
-    ADAPTIVE_SCALING_INTERVAL = float(os.getenv("SCRAPER_ADAPTIVE_SCALING", "10.0"))
+    ADAPTIVE_SCALING_INTERVAL = _env_float("SCRAPER_ADAPTIVE_SCALING", 10.0)
     """The main interval for the adaptive scaling engine to make decisions, in seconds."""
 
-    WORKER_STARTUP_BATCH_DELAY = float(os.getenv("SCRAPER_WORKER_BATCH_DELAY", "1.0"))
+    WORKER_STARTUP_BATCH_DELAY = _env_float("SCRAPER_WORKER_BATCH_DELAY", 1.0)
     """Delay between starting batches of workers, in seconds."""
 
-    WORKER_STATUS_CHECK_DELAY = float(os.getenv("SCRAPER_WORKER_STATUS_DELAY", "1.0"))
+    WORKER_STATUS_CHECK_DELAY = _env_float("SCRAPER_WORKER_STATUS_DELAY", 1.0)
     """Delay between checking the status of workers, in seconds."""
 
-    WORKER_COORDINATION_DELAY = float(os.getenv("SCRAPER_WORKER_COORD_DELAY", "0.05"))
+    WORKER_COORDINATION_DELAY = _env_float("SCRAPER_WORKER_COORD_DELAY", 0.05)
     """Small delay for coordinating actions between workers, in seconds."""
 
-    WORKER_TASK_YIELD_DELAY = float(os.getenv("SCRAPER_TASK_YIELD_DELAY", "0.0"))
+    WORKER_TASK_YIELD_DELAY = _env_float("SCRAPER_TASK_YIELD_DELAY", 0.0)
     """Delay to allow other asyncio tasks to run, in seconds."""
 
-    DOM_RETRY_DELAY = float(os.getenv("SCRAPER_DOM_RETRY_DELAY", "0.5"))
+    DOM_RETRY_DELAY = _env_float("SCRAPER_DOM_RETRY_DELAY", 0.5)
     """Delay between retrying a failed DOM operation, in seconds."""
 
-    TERMINAL_OUTPUT_SUPPRESSION = float(os.getenv("SCRAPER_TERMINAL_SUPPRESS", "2.0"))
+    TERMINAL_OUTPUT_SUPPRESSION = _env_float("SCRAPER_TERMINAL_SUPPRESS", 2.0)
     """Delay to suppress terminal output to avoid flickering, in seconds."""
 
     # ============================================================================
@@ -146,105 +202,85 @@ class ScraperConfig:
     # ============================================================================
 
     # Worker tracking display options
-    SHOW_SCALING = os.getenv("SCRAPER_SHOW_SCALING", "true").lower() == "true"
+    SHOW_SCALING = _env_bool("SCRAPER_SHOW_SCALING", True)
     """Whether to show scaling decisions in terminal output."""
 
-    SHOW_WORKER_CREATED = os.getenv("SCRAPER_SHOW_CREATED", "false").lower() == "true"
+    SHOW_WORKER_CREATED = _env_bool("SCRAPER_SHOW_CREATED", False)
     """Whether to show worker creation events."""
 
-    SHOW_WORKER_STATE = os.getenv("SCRAPER_SHOW_STATE", "true").lower() == "true"
+    SHOW_WORKER_STATE = _env_bool("SCRAPER_SHOW_STATE", True)
     """Whether to show worker state transitions."""
 
-    SHOW_WORKER_COMPLETED = (
-        os.getenv("SCRAPER_SHOW_COMPLETED", "true").lower() == "true"
-    )
+    SHOW_WORKER_COMPLETED = _env_bool("SCRAPER_SHOW_COMPLETED", True)
     """Whether to show worker completion events."""
 
-    SHOW_WORKER_ERRORS = os.getenv("SCRAPER_SHOW_ERRORS", "true").lower() == "true"
+    SHOW_WORKER_ERRORS = _env_bool("SCRAPER_SHOW_ERRORS", True)
     """Whether to show worker error events."""
 
-    SHOW_WORKER_STATUS = os.getenv("SCRAPER_SHOW_STATUS", "true").lower() == "true"
+    SHOW_WORKER_STATUS = _env_bool("SCRAPER_SHOW_STATUS", True)
     """Whether to show periodic worker status summaries."""
 
-    SHOW_WORKER_HIERARCHY = (
-        os.getenv("SCRAPER_SHOW_HIERARCHY", "false").lower() == "true"
-    )
+    SHOW_WORKER_HIERARCHY = _env_bool("SCRAPER_SHOW_HIERARCHY", False)
     """Whether to show hierarchical worker relationships."""
 
-    SHOW_BROWSER_POOL = os.getenv("SCRAPER_SHOW_BROWSER_POOL", "true").lower() == "true"
+    SHOW_BROWSER_POOL = _env_bool("SCRAPER_SHOW_BROWSER_POOL", True)
     """Whether to show browser pool utilization status."""
 
-    SHOW_QUEUE_ANALYSIS = (
-        os.getenv("SCRAPER_SHOW_QUEUE_ANALYSIS", "true").lower() == "true"
-    )
+    SHOW_QUEUE_ANALYSIS = _env_bool("SCRAPER_SHOW_QUEUE_ANALYSIS", True)
     """Whether to show detailed queue analysis with depth and processing rates."""
 
-    MAX_RECENT_COMPLETIONS = int(os.getenv("SCRAPER_MAX_RECENT", "10"))
+    MAX_RECENT_COMPLETIONS = _env_int("SCRAPER_MAX_RECENT", 10)
     """Maximum number of recent completions to track and display."""
 
     # ============================================================================
     # RETRY CONFIGURATION
     # Defines the behavior for retrying failed operations.
     # ============================================================================
-    MAX_RETRIES = int(os.getenv("SCRAPER_MAX_RETRIES", "3"))
+    MAX_RETRIES = _env_int("SCRAPER_MAX_RETRIES", 3)
     """Maximum number of times to retry a failed task."""
 
-    RETRY_DELAY_BASE = float(os.getenv("SCRAPER_RETRY_DELAY", "1.0"))
+    RETRY_DELAY_BASE = _env_float("SCRAPER_RETRY_DELAY", 1.0)
     """The base delay for retries, in seconds. Used with exponential backoff."""
 
-    EXPONENTIAL_BACKOFF_MULTIPLIER = float(
-        os.getenv("SCRAPER_BACKOFF_MULTIPLIER", "2.0")
-    )
+    EXPONENTIAL_BACKOFF_MULTIPLIER = _env_float("SCRAPER_BACKOFF_MULTIPLIER", 2.0)
     """Multiplier for exponential backoff between retries."""
 
     # ============================================================================
     # BROWSER CONFIGURATION
     # Configures the behavior of the Playwright browser instances.
     # ============================================================================
-    BROWSER_HEADLESS = os.getenv("SCRAPER_HEADLESS", "true").lower() == "true"
+    BROWSER_HEADLESS = _env_bool("SCRAPER_HEADLESS", True)
     """Whether to run the browser in headless mode (no GUI)."""
 
-    BROWSER_SLOW_MO = int(os.getenv("SCRAPER_SLOW_MO", "0"))
+    BROWSER_SLOW_MO = _env_int("SCRAPER_SLOW_MO", 0)
     """Slows down Playwright operations by the specified amount in milliseconds. Useful for debugging."""
 
-    BROWSER_TIMEOUT = int(os.getenv("SCRAPER_BROWSER_TIMEOUT", "30000"))
+    BROWSER_TIMEOUT = _env_int("SCRAPER_BROWSER_TIMEOUT", 30000)
     """Default timeout for browser operations, in milliseconds."""
 
     # ============================================================================
     # LOGGING CONFIGURATION
     # Defines the settings for logging application events.
     # ============================================================================
-    LOG_LEVEL = os.getenv("SCRAPER_LOG_LEVEL", "INFO")
+    LOG_LEVEL = _env_str("SCRAPER_LOG_LEVEL", "INFO")
     """The minimum level of log messages to record."""
 
-    LOG_FORMAT = os.getenv(
+    LOG_FORMAT = _env_str(
         "SCRAPER_LOG_FORMAT",
         "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s",
     )
     """The format string for log messages."""
 
-    LOG_DATE_FORMAT = os.getenv("SCRAPER_LOG_DATE_FORMAT", "%Y-%m-%d %H:%M:%S")
+    LOG_DATE_FORMAT = _env_str("SCRAPER_LOG_DATE_FORMAT", "%Y-%m-%d %H:%M:%S")
     """The format string for dates in log messages."""
 
     # ============================================================================
     # PERFORMANCE MONITORING
     # Configures how frequently progress is reported.
     # ============================================================================
-    PROGRESS_REPORT_INTERVAL = int(os.getenv("SCRAPER_PROGRESS_INTERVAL", "10"))
+    PROGRESS_REPORT_INTERVAL = _env_int("SCRAPER_PROGRESS_INTERVAL", 10)
     """Interval for reporting progress to the console, in seconds."""
 
-    # ============================================================================
-    # REAL-TIME MONITORING DASHBOARD
-    # Configures the real-time terminal dashboard.
-    # ============================================================================
-    REAL_TIME_MONITOR_ENABLED = (
-        os.getenv("SCRAPER_MONITOR_ENABLED", "false").lower() == "true"
-    )
-    """Whether to enable the real-time monitoring dashboard."""
-
-    REAL_TIME_MONITOR_INTERVAL = int(os.getenv("SCRAPER_MONITOR_INTERVAL", "20"))
-    """Update interval for the real-time monitor, in seconds."""
-
     # ============================================================================
     # DASHBOARD CONTROL (Phase 1 Implementation)
     # Controls the dashboard display behavior for terminal output separation.
@@ -256,91 +292,94 @@ class ScraperConfig:
 class OptimizationConfig:
     """Configuration settings for the optimization framework."""
 
+    # Settings live on the class; instances carry no per-instance dict
+    __slots__ = ()
+
     # ============================================================================
     # BROWSER OPTIMIZATION SETTINGS
     # Controls browser reuse, pooling, and launch options.
     # ============================================================================
-    BROWSER_REUSE_ENABLED = os.getenv("OPT_BROWSER_REUSE", "true").lower() == "true"
+    BROWSER_REUSE_ENABLED = _env_bool("OPT_BROWSER_REUSE", True)
     """Whether to reuse browser instances to reduce startup overhead."""
 
-    BROWSER_POOL_SIZE = int(os.getenv("OPT_BROWSER_POOL_SIZE", "1"))
+    BROWSER_POOL_SIZE = _env_int("OPT_BROWSER_POOL_SIZE", 1)
     """The number of browser instances to maintain in the pool. Set to 1 for minimal resource usage."""
 
-    BROWSER_LAUNCH_OPTIONS = {
-        "headless": os.getenv("OPT_BROWSER_HEADLESS", "true").lower() == "true",
-        "args": [
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--disable-features=VizDisplayCompositor",
-        ],
-    }
-    """Command-line arguments for launching browser instances."""
+    BROWSER_LAUNCH_OPTIONS = MappingProxyType(
+        {
+            "headless": _env_bool("OPT_BROWSER_HEADLESS", True),
+            "args": (
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+                "--disable-features=VizDisplayCompositor",
+            ),
+        }
+    )
+    """Read-only options for launching browser instances; presets override them."""
 
     # ============================================================================
     # RESOURCE FILTERING SETTINGS
     # Configures which network resources to block for faster page loads.
     # ============================================================================
-    RESOURCE_FILTERING_ENABLED = (
-        os.getenv("OPT_RESOURCE_FILTERING", "true").lower() == "true"
-    )
+    RESOURCE_FILTERING_ENABLED = _env_bool("OPT_RESOURCE_FILTERING", True)
     """Whether to enable resource filtering."""
 
-    BLOCKED_RESOURCE_TYPES = ["image", "media", "font", "stylesheet", "other"]
-    """A list of resource types to block."""
+    BLOCKED_RESOURCE_TYPES = frozenset(
+        {"image", "media", "font", "stylesheet", "other"}
+    )
+    """The set of resource types to block."""
 
-    ALLOWED_DOMAINS = ["help.autodesk.com"]
-    """A list of domains from which resources are allowed."""
+    ALLOWED_DOMAINS = frozenset({"help.autodesk.com"})
+    """The set of domains from which resources are allowed."""
 
     # ============================================================================
     # MEMORY MANAGEMENT SETTINGS
     # Controls how the application manages memory to prevent leaks.
     # ============================================================================
-    MEMORY_MANAGEMENT_ENABLED = (
-        os.getenv("OPT_MEMORY_MANAGEMENT", "true").lower() == "true"
-    )
+    MEMORY_MANAGEMENT_ENABLED = _env_bool("OPT_MEMORY_MANAGEMENT", True)
     """Whether to enable memory management features."""
 
-    MAX_MEMORY_MB = int(os.getenv("OPT_MAX_MEMORY_MB", "512"))
+    MAX_MEMORY_MB = _env_int("OPT_MAX_MEMORY_MB", 512)
     """The maximum memory usage allowed before triggering cleanup, in megabytes."""
 
-    GARBAGE_COLLECTION_INTERVAL = int(os.getenv("OPT_GC_INTERVAL", "100"))
+    GARBAGE_COLLECTION_INTERVAL = _env_int("OPT_GC_INTERVAL", 100)
     """The interval (in number of operations) for running garbage collection."""
 
     # ============================================================================
     # ORCHESTRATOR SETTINGS
     # Configures the high-level orchestration of workers and tasks.
     # ============================================================================
-    ORCHESTRATOR_ENABLED = os.getenv("OPT_ORCHESTRATOR", "false").lower() == "true"
+    ORCHESTRATOR_ENABLED = _env_bool("OPT_ORCHESTRATOR", False)
     """Whether to enable the advanced orchestrator."""
 
-    MAX_WORKERS = int(os.getenv("OPT_MAX_WORKERS", "10"))
+    MAX_WORKERS = _env_int("OPT_MAX_WORKERS", 10)
     """The maximum number of workers for the orchestrator."""
 
-    WORKER_QUEUE_SIZE = int(os.getenv("OPT_QUEUE_SIZE", "100"))
+    WORKER_QUEUE_SIZE = _env_int("OPT_QUEUE_SIZE", 100)
     """The size of the queue for the orchestrator's workers."""
 
     # ============================================================================
     # MONITORING SETTINGS
     # Configures the collection and logging of performance metrics.
     # ============================================================================
-    MONITORING_ENABLED = os.getenv("OPT_MONITORING", "true").lower() == "true"
+    MONITORING_ENABLED = _env_bool("OPT_MONITORING", True)
     """Whether to enable performance monitoring."""
 
-    METRICS_COLLECTION_INTERVAL = int(os.getenv("OPT_METRICS_INTERVAL", "30"))
+    METRICS_COLLECTION_INTERVAL = _env_int("OPT_METRICS_INTERVAL", 30)
     """The interval for collecting performance metrics, in seconds."""
 
-    PERFORMANCE_LOGGING = os.getenv("OPT_PERFORMANCE_LOG", "true").lower() == "true"
+    PERFORMANCE_LOGGING = _env_bool("OPT_PERFORMANCE_LOG", True)
     """Whether to log performance metrics."""
 
     # ============================================================================
     # FALLBACK SETTINGS
     # Defines behavior for handling errors in the optimization framework.
     # ============================================================================
-    FALLBACK_ON_ERROR = os.getenv("OPT_FALLBACK", "true").lower() == "true"
+    FALLBACK_ON_ERROR = _env_bool("OPT_FALLBACK", True)
     """Whether to fall back to a basic mode on optimization errors."""
 
-    OPTIMIZATION_TIMEOUT = int(os.getenv("OPT_TIMEOUT", "10"))
+    OPTIMIZATION_TIMEOUT = _env_int("OPT_TIMEOUT", 10)
     """Timeout for optimization operations, in seconds."""
 
     # ============================================================================
@@ -348,81 +387,113 @@ class OptimizationConfig:
     # Provides predefined configurations for different environments.
     # ============================================================================
     @classmethod
+    def _preset(cls, **settings):
+        """Create a preset instance whose class overrides the given settings."""
+        preset_class = type(cls.__name__, (cls,), {"__slots__": (), **settings})
+        return preset_class()
+
+    @classmethod
+    def _launch_options(cls, **overrides):
+        """Create read-only browser launch options with the given overrides."""
+        return MappingProxyType({**cls.BROWSER_LAUNCH_OPTIONS, **overrides})
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
     def create_minimal_config(cls):
-        """Create minimal optimization configuration for testing."""
-        config = cls()
-        config.BROWSER_REUSE_ENABLED = True
-        config.RESOURCE_FILTERING_ENABLED = False
-        config.MEMORY_MANAGEMENT_ENABLED = False
-        config.ORCHESTRATOR_ENABLED = False
-        config.MONITORING_ENABLED = False
-        return config
+        """Create minimal optimization configuration for testing (built once)."""
+        return cls._preset(
+            BROWSER_REUSE_ENABLED=True,
+            RESOURCE_FILTERING_ENABLED=False,
+            MEMORY_MANAGEMENT_ENABLED=False,
+            ORCHESTRATOR_ENABLED=False,
+            MONITORING_ENABLED=False,
+        )
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def create_development_config(cls):
-        """Create development optimization configuration."""
-        config = cls()
-        config.BROWSER_REUSE_ENABLED = True
-        config.RESOURCE_FILTERING_ENABLED = True
-        config.MEMORY_MANAGEMENT_ENABLED = True
-        config.ORCHESTRATOR_ENABLED = False
-        config.MONITORING_ENABLED = True
-        config.BROWSER_LAUNCH_OPTIONS["headless"] = False  # Visible for debugging
-        return config
+        """Create development optimization configuration (built once)."""
+        return cls._preset(
+            BROWSER_REUSE_ENABLED=True,
+            RESOURCE_FILTERING_ENABLED=True,
+            MEMORY_MANAGEMENT_ENABLED=True,
+            ORCHESTRATOR_ENABLED=False,
+            MONITORING_ENABLED=True,
+            BROWSER_LAUNCH_OPTIONS=cls._launch_options(
+                headless=False  # Visible for debugging
+            ),
+        )
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def create_production_config(cls):
-        """Create production optimization configuration."""
-        config = cls()
-        config.BROWSER_REUSE_ENABLED = True
-        config.RESOURCE_FILTERING_ENABLED = True
-        config.MEMORY_MANAGEMENT_ENABLED = True
-        config.ORCHESTRATOR_ENABLED = True
-        config.MONITORING_ENABLED = True
-        config.BROWSER_LAUNCH_OPTIONS["headless"] = True
-        return config
+        """Create production optimization configuration (built once)."""
+        return cls._preset(
+            BROWSER_REUSE_ENABLED=True,
+            RESOURCE_FILTERING_ENABLED=True,
+            MEMORY_MANAGEMENT_ENABLED=True,
+            ORCHESTRATOR_ENABLED=True,
+            MONITORING_ENABLED=True,
+            BROWSER_LAUNCH_OPTIONS=cls._launch_options(headless=True),
+        )
 
 
 class TestingConfig:
     """Configuration settings for testing and validation."""
 
+    # Settings live on the class; instances carry no per-instance dict
+    __slots__ = ()
+
     # ============================================================================
     # TEST EXECUTION SETTINGS
     # Controls how tests are executed.
     # ============================================================================
-    TEST_TIMEOUT = int(os.getenv("TEST_TIMEOUT", "30"))
+    TEST_TIMEOUT = _env_int("TEST_TIMEOUT", 30)
     """Timeout for test execution, in seconds."""
 
-    INTEGRATION_TEST_ENABLED = os.getenv("INTEGRATION_TEST", "true").lower() == "true"
+    INTEGRATION_TEST_ENABLED = _env_bool("INTEGRATION_TEST", True)
     """Whether to run integration tests."""
 
-    PERFORMANCE_TEST_ENABLED = os.getenv("PERFORMANCE_TEST", "true").lower() == "true"
+    PERFORMANCE_TEST_ENABLED = _env_bool("PERFORMANCE_TEST", True)
     """Whether to run performance tests."""
 
     # ============================================================================
     # TEST DATA SETTINGS
     # Defines the data and resources used for testing.
     # ============================================================================
-    TEST_URL = os.getenv("TEST_URL", "https://help.autodesk.com/view/OARX/2025/ENU/")
+    TEST_URL = _env_str("TEST_URL", "https://help.autodesk.com/view/OARX/2025/ENU/")
     """The URL to use for testing."""
 
-    TEST_OUTPUT_DIR = os.getenv("TEST_OUTPUT_DIR", "test_outputs")
+    TEST_OUTPUT_DIR = _env_str("TEST_OUTPUT_DIR", "test_outputs")
     """The directory for saving test outputs."""
 
     # ============================================================================
     # VALIDATION SETTINGS
     # Configures how test results are validated.
     # ============================================================================
-    VALIDATION_ENABLED = os.getenv("VALIDATION_ENABLED", "true").lower() == "true"
+    VALIDATION_ENABLED = _env_bool("VALIDATION_ENABLED", True)
     """Whether to enable validation of test results."""
 
-    STRICT_VALIDATION = os.getenv("STRICT_VALIDATION", "false").lower() == "true"
+    STRICT_VALIDATION = _env_bool("STRICT_VALIDATION", False)
     """Whether to use strict validation rules."""
 
 
 class AppConfig:
     """Root configuration object that consolidates all settings."""
 
+    __slots__ = (
+        "SCRAPER",
+        "OPTIMIZATION",
+        "TESTING",
+        "APP_NAME",
+        "APP_VERSION",
+        "DEBUG",
+        "ENVIRONMENT",
+        "REAL_TIME_MONITOR_ENABLED",
+        "REAL_TIME_MONITOR_INTERVAL",
+        "_summary_json",
+    )
+
     def __init__(self):
         self.SCRAPER = ScraperConfig()
         self.OPTIMIZATION = OptimizationConfig()
@@ -431,10 +502,10 @@ class AppConfig:
         # Global application settings
         self.APP_NAME = "Parallel Scraper with Optimization"
         self.APP_VERSION = "1.0.0"
-        self.DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+        self.DEBUG = _env_bool("DEBUG", False)
 
         # Environment detection
-        self.ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+        self.ENVIRONMENT = _env_str("ENVIRONMENT", "development")
 
         # Real-time monitoring configuration
         self.REAL_TIME_MONITOR_ENABLED = self.SCRAPER.REAL_TIME_MONITOR_ENABLED
@@ -448,8 +519,20 @@ class AppConfig:
         elif self.ENVIRONMENT == "testing":
             self.OPTIMIZATION = OptimizationConfig.create_minimal_config()
 
+        self._summary_json = None
+
     def get_config_summary(self) -> Dict[str, Any]:
         """Get a summary of current configuration settings."""
+        return self._build_config_summary()
+
+    def get_config_summary_json(self) -> bytes:
+        """Get the configuration summary as UTF-8 JSON bytes (serialized once)."""
+        if self._summary_json is None:
+            self._summary_json = _json_dumps()(self._build_config_summary())
+        return self._summary_json
+
+    def _build_config_summary(self) -> Dict[str, Any]:
+        """Build the summary dictionary for get_config_summary."""
         return {
             "app_name": self.APP_NAME,
             "app_version": self.APP_VERSION,
@@ -472,27 +555,28 @@ class AppConfig:
 
     def validate_config(self) -> bool:
         """Validate configuration settings for consistency."""
-        errors = []
-
-        # Validate scraper settings
-        if self.SCRAPER.MAX_WORKERS <= 0:
-            errors.append("MAX_WORKERS must be positive")
-
-        if self.SCRAPER.PAGE_LOAD_TIMEOUT <= 0:
-            errors.append("PAGE_LOAD_TIMEOUT must be positive")
-
-        # Validate optimization settings
-        if self.OPTIMIZATION.BROWSER_POOL_SIZE <= 0:
-            errors.append("BROWSER_POOL_SIZE must be positive")
-
-        if self.OPTIMIZATION.MAX_MEMORY_MB <= 0:
-            errors.append("MAX_MEMORY_MB must be positive")
-
-        if errors:
-            print(f"Configuration validation errors: {errors}")
-            return False
-
-        return True
+        # Happy path: short-circuit over the checks without building messages
+        return all(check(self) for _, check in _CONFIG_CHECKS) or self._report_errors()
+
+    def _report_errors(self) -> bool:
+        """Print every failed validation check and report the config invalid."""
+        errors = [message for message, check in _CONFIG_CHECKS if not check(self)]
+        print(f"Configuration validation errors: {errors}")
+        return False
+
+
+# Consistency checks run by AppConfig.validate_config, as (error, predicate)
+_CONFIG_CHECKS = (
+    # Scraper settings
+    ("MAX_WORKERS must be positive", lambda c: c.SCRAPER.MAX_WORKERS > 0),
+    ("PAGE_LOAD_TIMEOUT must be positive", lambda c: c.SCRAPER.PAGE_LOAD_TIMEOUT > 0),
+    # Optimization settings
+    (
+        "BROWSER_POOL_SIZE must be positive",
+        lambda c: c.OPTIMIZATION.BROWSER_POOL_SIZE > 0,
+    ),
+    ("MAX_MEMORY_MB must be positive", lambda c: c.OPTIMIZATION.MAX_MEMORY_MB > 0),
+)
 
 
 # ============================================================================
@@ -515,15 +599,20 @@ def get_config_value(
         Configuration value or default
     """
     try:
-        keys = path.split(".")
         value = config_dict
-        for key in keys:
+        for key in _split_config_path(path):
             value = value[key]
         return value
     except (KeyError, TypeError):
         return default
 
 
+@functools.lru_cache(maxsize=256)
+def _split_config_path(path: str) -> tuple:
+    """Split a dotted config path into its keys (cached per path)."""
+    return tuple(path.split("."))
+
+
 def merge_config_deep(
     base_config: Dict[str, Any], override_config: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -539,11 +628,20 @@ def merge_config_deep(
     """
     result = base_config.copy()
 
-    for key, value in override_config.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_config_deep(result[key], value)
-        else:
-            result[key] = value
+    # Walk (destination, override) pairs without recursion; only the dicts on
+    # an overridden path are copied, untouched subtrees stay shared
+    stack = [(result, override_config)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            # Leaf overrides (the common case) never look up the base value
+            if isinstance(value, dict):
+                current = target.get(key)
+                if isinstance(current, dict):
+                    current = target[key] = current.copy()
+                    stack.append((current, value))
+                    continue
+            target[key] = value
 
     return result
 
@@ -562,6 +660,7 @@ def load_unified_config(
     Returns:
         Dictionary containing unified configuration
     """
+    config = get_config()
     base_config = {
         "scraper": {
             "target": {
@@ -609,38 +708,35 @@ class EnhancedScraperConfig:
     """Enhanced scraper configuration with dynamic scaling support."""
 
     # Worker Scaling Configuration (NO CAPS - User Settings Respected)
-    MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", "500"))  # User wants 500
-    MIN_WORKERS = int(os.getenv("SCRAPER_MIN_WORKERS", "20"))
-    INITIAL_WORKERS = int(os.getenv("SCRAPER_INITIAL_WORKERS", "50"))
+    # Same SCRAPER_* variables as ScraperConfig, so reuse its parsed values
+    MAX_WORKERS = ScraperConfig.MAX_WORKERS  # User wants 500
+    MIN_WORKERS = ScraperConfig.MIN_WORKERS
+    INITIAL_WORKERS = ScraperConfig.INITIAL_WORKERS
 
     # Scaling Increments (NO CAPS - User Settings Respected)
-    WORKER_SCALE_INCREMENT = int(
-        os.getenv("SCRAPER_SCALE_INCREMENT", "20")
-    )  # User wants +20
-    WORKER_SCALE_DECREMENT = int(
-        os.getenv("SCRAPER_SCALE_DECREMENT", "10")
-    )  # User wants -10
+    WORKER_SCALE_INCREMENT = _env_int("SCRAPER_SCALE_INCREMENT", 20)  # User wants +20
+    WORKER_SCALE_DECREMENT = _env_int("SCRAPER_SCALE_DECREMENT", 10)  # User wants -10
 
     # Performance Thresholds
-    PERFORMANCE_THRESHOLD_HIGH = float(os.getenv("SCRAPER_PERF_HIGH", "0.95"))
-    PERFORMANCE_THRESHOLD_LOW = float(os.getenv("SCRAPER_PERF_LOW", "0.80"))
-    MEMORY_THRESHOLD_MB = int(os.getenv("SCRAPER_MEMORY_THRESHOLD", "500"))
-    CPU_THRESHOLD_PERCENT = int(os.getenv("SCRAPER_CPU_THRESHOLD", "85"))
+    PERFORMANCE_THRESHOLD_HIGH = _env_float("SCRAPER_PERF_HIGH", 0.95)
+    PERFORMANCE_THRESHOLD_LOW = _env_float("SCRAPER_PERF_LOW", 0.80)
+    MEMORY_THRESHOLD_MB = _env_int("SCRAPER_MEMORY_THRESHOLD", 500)
+    CPU_THRESHOLD_PERCENT = _env_int("SCRAPER_CPU_THRESHOLD", 85)
 
     # Browser Pool Configuration
     # Use simple configurable browser pool size (set via OPT_BROWSER_POOL_SIZE environment variable)
     BROWSER_POOL_SIZE = (
         OptimizationConfig.BROWSER_POOL_SIZE
     )  # Use simple configurable value
-    BROWSER_REUSE_THRESHOLD = int(os.getenv("SCRAPER_BROWSER_REUSE", "100"))
-    CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("SCRAPER_CIRCUIT_BREAKER", "5"))
-    BROWSER_LAUNCH_DELAY = float(os.getenv("SCRAPER_BROWSER_DELAY", "1.0"))
+    BROWSER_REUSE_THRESHOLD = _env_int("SCRAPER_BROWSER_REUSE", 100)
+    CIRCUIT_BREAKER_THRESHOLD = _env_int("SCRAPER_CIRCUIT_BREAKER", 5)
+    BROWSER_LAUNCH_DELAY = _env_float("SCRAPER_BROWSER_DELAY", 1.0)
 
     # Auto-tuning Configuration
-    AUTO_TUNING_ENABLED = os.getenv("SCRAPER_AUTO_TUNING", "true").lower() == "true"
-    TUNING_AGGRESSIVENESS = float(os.getenv("SCRAPER_TUNING_AGGRESSION", "0.5"))
-    TUNING_FREQUENCY_MINUTES = int(os.getenv("SCRAPER_TUNING_FREQ", "5"))
-    SAFETY_MODE_ENABLED = os.getenv("SCRAPER_SAFETY_MODE", "true").lower() == "true"
+    AUTO_TUNING_ENABLED = _env_bool("SCRAPER_AUTO_TUNING", True)
+    TUNING_AGGRESSIVENESS = _env_float("SCRAPER_TUNING_AGGRESSION", 0.5)
+    TUNING_FREQUENCY_MINUTES = _env_int("SCRAPER_TUNING_FREQ", 5)
+    SAFETY_MODE_ENABLED = _env_bool("SCRAPER_SAFETY_MODE", True)
 
 
 def get_enhanced_config() -> dict:
@@ -673,14 +769,42 @@ def get_enhanced_config() -> dict:
 # CONFIGURATION INSTANCES - IMPORT THESE
 # ============================================================================
 
-# Create configuration instances for easy importing
-config = AppConfig()
+# Validate the shared configuration when it is built; skipped under
+# ``python -O`` or with SCRAPER_VALIDATE_CONFIG=false
+VALIDATE_CONFIG = __debug__ and _env_bool("SCRAPER_VALIDATE_CONFIG", True)
 
-# Validate configuration on import
-if not config.validate_config():
-    raise ValueError("Invalid configuration detected. Please check settings.")
 
-# Also export individual config classes for backward compatibility
-scraper_config = config.SCRAPER
-optimization_config = config.OPTIMIZATION
-testing_config = config.TESTING
+@functools.lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """
+    Get the shared application configuration.
+
+    The configuration is built and validated (unless VALIDATE_CONFIG is off)
+    on first use rather than at import time, and the same instance is
+    returned on every later call.
+    """
+    app_config = AppConfig()
+    if VALIDATE_CONFIG and not app_config.validate_config():
+        raise ValueError("Invalid configuration detected. Please check settings.")
+    return app_config
+
+
+# Module attributes resolved lazily through get_config() (PEP 562); the
+# individual config objects are kept for backward compatibility
+_LAZY_CONFIG_ATTRIBUTES = {
+    "config": get_config,
+    "scraper_config": lambda: get_config().SCRAPER,
+    "optimization_config": lambda: get_config().OPTIMIZATION,
+    "testing_config": lambda: get_config().TESTING,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build the shared configuration on first access to it."""
+    try:
+        factory = _LAZY_CONFIG_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = factory()
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
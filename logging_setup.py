@@ -24,6 +24,10 @@ except ImportError:
     LOG_FORMAT = ScraperConfig.LOG_FORMAT
     LOG_DATE_FORMAT = ScraperConfig.LOG_DATE_FORMAT
 
+# One formatter shared by every handler setup_logging creates; the format
+# strings are fixed once config is imported
+LOG_FORMATTER = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
 
 def setup_logging(logger_name: str = None) -> logging.Logger:
     """
@@ -53,18 +57,15 @@ def setup_logging(logger_name: str = None) -> logging.Logger:
     # Set level
     logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
 
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-
     # File handler with UTF-8 encoding
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)  # File gets all debug info
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(LOG_FORMATTER)
 
     # Console handler with configurable level
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, LOG_LEVEL.upper()))
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(LOG_FORMATTER)
 
     # Add handlers
     logger.addHandler(file_handler)
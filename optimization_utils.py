@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import json
 import hashlib
+import re
 
 try:
     from playwright.async_api import Browser, BrowserContext, Page
@@ -47,14 +48,33 @@ except ImportError:
             BROWSER_POOL_SIZE = int(os.getenv("OPT_BROWSER_POOL_SIZE", "1"))
             RESOURCE_FILTERING_ENABLED = True
             MEMORY_MANAGEMENT_ENABLED = True
-            BLOCKED_RESOURCE_TYPES = ["image", "media", "font", "stylesheet", "other"]
-            ALLOWED_DOMAINS = ["help.autodesk.com"]
+            BLOCKED_RESOURCE_TYPES = frozenset(
+                {"image", "media", "font", "stylesheet", "other"}
+            )
+            ALLOWED_DOMAINS = frozenset({"help.autodesk.com"})
             MAX_MEMORY_MB = 512
             GARBAGE_COLLECTION_INTERVAL = 100
 
 
 logger = logging.getLogger(__name__)
 
+# Essential resource patterns for GUID/JavaScript sites, compiled once into a
+# single alternation that the resource filter runs per script request
+_ESSENTIAL_SCRIPT_PATTERNS = (
+    r".*/(jquery|react|angular|vue|ember).*\.js",
+    r".*/guid.*\.js",
+    r".*/auth.*\.js",
+    r".*/api.*\.js",
+    r".*/help\..*\.js",
+    r".*\.autodesk\.com.*\.js",
+    r".*/search.*\.js",
+    r".*/analytics.*\.js",
+)
+_ESSENTIAL_SCRIPT_MATCH = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _ESSENTIAL_SCRIPT_PATTERNS),
+    re.IGNORECASE,
+).match
+
 # Global browser pool for reuse
 _browser_pool: List[Browser] = []
 _browser_pool_lock = asyncio.Lock()
@@ -214,18 +234,6 @@ async def setup_resource_filtering(
 
     global _performance_metrics
 
-    # Essential resource patterns for GUID/JavaScript sites
-    essential_patterns = [
-        r".*/(jquery|react|angular|vue|ember).*\.js",
-        r".*/guid.*\.js",
-        r".*/auth.*\.js",
-        r".*/api.*\.js",
-        r".*/help\..*\.js",
-        r".*\.autodesk\.com.*\.js",
-        r".*/search.*\.js",
-        r".*/analytics.*\.js",
-    ]
-
     async def route_handler(route, request):
         """Handle resource requests with intelligent filtering."""
         global _performance_metrics
@@ -235,7 +243,7 @@ async def setup_resource_filtering(
             resource_type = request.resource_type
 
             # Always allow documents and scripts from allowed domains
-            if resource_type in ["document", "script"]:
+            if resource_type in {"document", "script"}:
                 if any(
                     allowed_domain in url
                     for allowed_domain in OptimizationConfig.ALLOWED_DOMAINS
@@ -245,14 +253,10 @@ async def setup_resource_filtering(
                     return
 
             # Check essential patterns for scripts
-            if resource_type == "script":
-                import re
-
-                for pattern in essential_patterns:
-                    if re.match(pattern, url, re.IGNORECASE):
-                        _performance_metrics["requests_allowed"] += 1
-                        await route.continue_()
-                        return
+            if resource_type == "script" and _ESSENTIAL_SCRIPT_MATCH(url):
+                _performance_metrics["requests_allowed"] += 1
+                await route.continue_()
+                return
 
             # Block unnecessary resource types
             if resource_type in OptimizationConfig.BLOCKED_RESOURCE_TYPES:
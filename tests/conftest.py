@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy_backend(request, monkeypatch, backend_module):
+    """
+    Run a test once per array backend of backend_module.
+
+    Test modules define a backend_module fixture returning the module whose
+    NUMPY_AVAILABLE flag selects the backend. The flag is set through
+    monkeypatch, so it is restored after every test.
+    """
+    if request.param and not backend_module.NUMPY_AVAILABLE:
+        pytest.skip("NumPy not installed")
+    monkeypatch.setattr(backend_module, "NUMPY_AVAILABLE", request.param)
+    return request.param
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test Advanced Optimization Utils
+Validates the metrics bookkeeping behind calculate_optimization_impact.
+"""
+
+import asyncio
+import threading
+
+import advanced_optimization_utils
+from advanced_optimization_utils import (
+    apply_orchestrated_optimization,
+    cache_extraction_pattern,
+    calculate_optimization_impact,
+    cleanup_optimization_state,
+    collect_advanced_metrics,
+    drain_metric_submissions,
+    get_cached_extraction_pattern,
+    setup_extraction_pattern_cache,
+)
+
+
+def mean(values):
+    return sum(values) / len(values)
+
+
+def test_optimization_impact_uses_session_baseline_and_recent_window():
+    """Baseline covers the first three samples, current the latest five."""
+    cleanup_optimization_state()
+
+    samples = []
+    for i in range(12):
+        stats = {
+            "pages_processed": 10 + i,
+            "successful_pages": 8 + (i % 3),
+            "failed_pages": 2 - (i % 3),
+            "avg_processing_time_ms": 0 if i in (9, 10) else 100.0 + 10 * i,
+        }
+        samples.append(collect_advanced_metrics(stats))
+
+    impact = calculate_optimization_impact()
+    assert impact["status"] == "calculated", impact
+
+    baseline = samples[:3]
+    recent = samples[-5:]
+    expected_baseline_time = mean([m.processing_time_ms for m in baseline])
+    expected_current_time = mean(
+        [m.processing_time_ms for m in recent if m.processing_time_ms > 0]
+    )
+    expected_success = mean([m.success_count / m.pages_processed for m in recent])
+
+    baseline_metrics = impact["baseline_metrics"]
+    assert baseline_metrics["avg_processing_time_ms"] == expected_baseline_time
+    current = impact["current_metrics"]
+    assert abs(current["avg_processing_time_ms"] - expected_current_time) < 1e-9
+    assert abs(current["avg_success_rate"] - expected_success) < 1e-9
+    assert (
+        abs(current["avg_memory_mb"] - mean([m.memory_usage_mb for m in recent])) < 1e-9
+    )
+    assert impact["total_pages_processed"] == samples[-1].pages_processed
+
+    cleanup_optimization_state()
+    assert advanced_optimization_utils._baseline_sample_count == 0
+    assert calculate_optimization_impact()["status"] == "insufficient_data"
+    print("✅ Optimization impact aggregates match full recomputation")
+
+
+def test_concurrent_collectors_lose_no_samples():
+    """Metrics from several threads all reach the history exactly once."""
+    cleanup_optimization_state()
+
+    def collect_many():
+        for _ in range(40):
+            collect_advanced_metrics({"pages_processed": 1, "successful_pages": 1})
+
+    threads = [threading.Thread(target=collect_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    drain_metric_submissions()
+
+    history = advanced_optimization_utils._metrics_history
+    assert len(history) == history.maxlen
+    assert not advanced_optimization_utils._metric_submissions
+    assert advanced_optimization_utils._baseline_sample_count == 3
+    assert advanced_optimization_utils._recent_sums[2] == 5.0
+
+    cleanup_optimization_state()
+    print("✅ Concurrent metric submissions are folded in without loss")
+
+
+def test_collected_metrics_are_not_reused():
+    """A returned sample keeps its values however many collections follow."""
+    cleanup_optimization_state()
+
+    first = collect_advanced_metrics({"pages_processed": 7, "successful_pages": 6})
+    kept = first.to_dict()
+    for i in range(300):
+        later = collect_advanced_metrics({"pages_processed": 100 + i})
+        assert later is not first
+
+    assert first.to_dict() == kept
+    cleanup_optimization_state()
+    print("✅ Collected metrics are independent objects")
+
+
+def test_pattern_cache_evicts_least_recently_used():
+    """A cache hit refreshes recency, so the oldest untouched pattern goes."""
+    cleanup_optimization_state()
+    setup_extraction_pattern_cache(max_patterns=3)
+
+    for domain in ("a.com", "b.com", "c.com"):
+        assert cache_extraction_pattern(domain, ["#content"])
+    assert get_cached_extraction_pattern("a.com") is not None
+
+    # Re-caching an existing pattern must not evict anything
+    assert cache_extraction_pattern("c.com", ["#main"])
+    assert cache_extraction_pattern("d.com", [".title"])
+
+    assert get_cached_extraction_pattern("b.com") is None
+    for domain in ("a.com", "c.com", "d.com"):
+        assert get_cached_extraction_pattern(domain) is not None
+    assert get_cached_extraction_pattern("c.com")["selectors"] == ["#main"]
+
+    cleanup_optimization_state()
+    print("✅ Pattern cache evicts the least recently used entry")
+
+
+def test_disabled_optimization_results_are_independent():
+    """With nothing enabled each call still returns its own mutable result."""
+    config = {"optimization_settings": {}}
+    first = asyncio.run(apply_orchestrated_optimization(None, {}, config))
+    first["optimizations_applied"].append("manual")
+    first["metrics"]["note"] = 1
+
+    second = asyncio.run(apply_orchestrated_optimization(None, {}, config))
+    assert second == {
+        "optimizations_applied": [],
+        "metrics": {},
+        "errors": [],
+        "fallback_used": False,
+    }
+    print("✅ Disabled optimization returns a fresh result")
+
+
+if __name__ == "__main__":
+    test_optimization_impact_uses_session_baseline_and_recent_window()
+    test_concurrent_collectors_lose_no_samples()
+    test_collected_metrics_are_not_reused()
+    test_pattern_cache_evicts_least_recently_used()
+    test_disabled_optimization_results_are_independent()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Test Auto-Tuning Engine
+Validates the columnar performance history and the pattern-detection math.
+"""
+
+import random
+import statistics
+
+import pytest
+
+import auto_tuning_engine
+from auto_tuning_engine import (
+    AutoTuningEngine,
+    _MetricRing,
+    _compute_window_stats,
+    _python_window_stats,
+    _trend_slope,
+)
+
+
+@pytest.fixture
+def backend_module():
+    """Module whose NUMPY_AVAILABLE flag numpy_backend toggles."""
+    return auto_tuning_engine
+
+
+def reference_slope(values):
+    """Straightforward least-squares slope over the sample index."""
+    n = len(values)
+    x_mean = (n - 1) / 2.0
+    y_mean = sum(values) / n
+    numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+def make_sample(i):
+    """Build a ring sample whose fields are all derived from i."""
+    return {
+        "timestamp": float(i),
+        "success_rate": 0.9,
+        "avg_response_time": i * 0.5,
+        "cpu_usage": 40.0 + i,
+        "memory_usage": 256.0,
+        "active_workers": i,
+        "queue_length": 2 * i,
+        "error_rate": 0.01,
+    }
+
+
+def append_sample(ring, sample):
+    """Append a sample dict to the ring in field order."""
+    ring.append(*(sample[name] for name in _MetricRing.FIELDS))
+
+
+def test_metric_ring_wraps_oldest_first(numpy_backend):
+    """The ring keeps the newest samples and windows them in order."""
+    ring = _MetricRing(capacity=5)
+    for i in range(8):
+        append_sample(ring, make_sample(i))
+
+    assert len(ring) == 5
+    window = ring.window(4)
+    assert list(window["timestamp"]) == [4.0, 5.0, 6.0, 7.0]
+    assert list(window["cpu_usage"]) == [44.0, 45.0, 46.0, 47.0]
+    assert list(ring.window(20)["timestamp"]) == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+    assert ring[-1] == make_sample(7)
+    assert [s["queue_length"] for s in ring[-3:]] == [10, 12, 14]
+    assert isinstance(ring[0]["active_workers"], int)
+
+    ring.clear()
+    assert len(ring) == 0
+    assert len(ring.window(20)["timestamp"]) == 0
+
+    print("✅ Metric ring wraps and windows correctly")
+
+
+@pytest.mark.skipif(
+    not auto_tuning_engine.NUMPY_AVAILABLE, reason="NumPy not installed"
+)
+def test_trend_slope_matches_reference():
+    """The closed-form slope should match the reference OLS slope."""
+    rng = random.Random(3)
+
+    for n in (2, 5, 20):
+        ring = _MetricRing(capacity=n)
+        for i in range(n):
+            sample = make_sample(i)
+            sample["avg_response_time"] = rng.uniform(0.5, 20.0)
+            append_sample(ring, sample)
+        values = ring.window(n)["avg_response_time"]
+        expected = reference_slope(list(values))
+        assert abs(_trend_slope(values) - expected) < 1e-9
+
+    print("✅ Trend slope matches reference implementation")
+
+
+def test_window_stats_kernel_matches_reference():
+    """The fused window-stats loop agrees with per-column statistics."""
+    rng = random.Random(5)
+
+    for n in (1, 2, 7, 20):
+        ring = _MetricRing(capacity=n)
+        for i in range(n):
+            sample = make_sample(i)
+            sample["avg_response_time"] = 3.0 + rng.random() * 0.01
+            sample["success_rate"] = rng.uniform(0.8, 1.0)
+            sample["cpu_usage"] = rng.uniform(0.0, 100.0)
+            append_sample(ring, sample)
+        window = {
+            name: [float(value) for value in column]
+            for name, column in ring.window(n).items()
+        }
+        stats = dict(
+            zip(
+                auto_tuning_engine._WINDOW_STAT_KEYS,
+                _python_window_stats(
+                    window["avg_response_time"],
+                    window["success_rate"],
+                    window["cpu_usage"],
+                    window["error_rate"],
+                    window["active_workers"],
+                    window["queue_length"],
+                ),
+            )
+        )
+
+        recent = slice(-5, None)
+        for key, name in (("cpu", "cpu_usage"), ("queue", "queue_length")):
+            expected = statistics.mean(window[name][recent])
+            assert abs(stats[f"recent_{key}_mean"] - expected) < 1e-9
+        for key, name in (
+            ("response", "avg_response_time"),
+            ("success", "success_rate"),
+        ):
+            values = window[name]
+            assert abs(stats[f"{key}_mean"] - statistics.mean(values)) < 1e-9
+            expected_std = statistics.stdev(values) if n > 1 else 0.0
+            assert abs(stats[f"{key}_std"] - expected_std) < 1e-9
+            expected_trend = reference_slope(values) if n > 1 else 0.0
+            assert abs(stats[f"{key}_trend"] - expected_trend) < 1e-9
+
+        # The default (NumPy or kernel) path agrees as well
+        for key, value in _compute_window_stats(ring.window(n)).items():
+            assert abs(value - stats.get(key, value)) < 1e-9, key
+
+    print("✅ Window-stats kernel matches reference statistics")
+
+
+def test_steady_state_uses_sample_statistics():
+    """Steady-state stability values are coefficients of variation."""
+    rng = random.Random(11)
+    engine = AutoTuningEngine()
+    response_times = [3.0 + rng.random() * 0.1 for _ in range(15)]
+    for value in response_times:
+        engine.collect_performance_sample(
+            {
+                "success_rate": 0.95,
+                "avg_processing_time": value,
+                "cpu_usage_percent": 50.0,
+                "active_workers": 10,
+                "queue_length": 5,
+            }
+        )
+
+    patterns = {p.pattern_type: p for p in engine.detect_performance_patterns()}
+    assert "steady_state" in patterns
+    expected = statistics.stdev(response_times) / statistics.mean(response_times)
+    got = patterns["steady_state"].characteristics["response_time_stability"]
+    assert abs(got - expected) < 1e-9
+    print("✅ Steady-state detection matches statistics module")
+
+
+def test_tuning_cycles_throttle_pattern_detection():
+    """Detection reruns every few samples; cycles in between reuse its result."""
+    engine = AutoTuningEngine()
+    peak_metrics = {
+        "success_rate": 0.6,
+        "avg_processing_time": 20.0,
+        "cpu_usage_percent": 95.0,
+        "active_workers": 20,
+        "queue_length": 20,
+        "error_rate": 0.3,
+    }
+
+    detected = []
+    for _ in range(2 * engine._detect_every):
+        result = engine.run_auto_tuning_cycle(peak_metrics, include_stats=False)
+        detected.append(result["patterns_detected"])
+        assert "tuning_statistics" not in result
+
+    every = engine._detect_every
+    assert all(not patterns for patterns in detected[: every - 1])
+    assert all("peak_load" in patterns for patterns in detected[every - 1 :])
+    assert detected[every : 2 * every - 1] == [detected[every - 1]] * (every - 1)
+
+    # Only the two detection runs add to the pattern history
+    runs = (detected[every - 1], detected[2 * every - 1])
+    assert len(engine.pattern_history) == sum(map(len, runs))
+    print("✅ Tuning cycles throttle pattern detection")
+
+
+def test_recommendations_are_recycled():
+    """Recommendations are pooled and reused after they are applied."""
+    engine = AutoTuningEngine()
+    pattern = auto_tuning_engine.PerformancePattern(
+        pattern_type="degrading",
+        confidence=0.9,
+        duration_minutes=10.0,
+        characteristics={},
+        recommended_action="cleanup",
+    )
+
+    first = engine.generate_tuning_recommendations([pattern])
+    assert [rec.parameter_name for rec in first] == [
+        "memory_cleanup_interval",
+        "gc_threshold",
+    ]
+    first_ids = sorted(map(id, first))
+    result = engine.apply_tuning_recommendations(first)
+    assert result["successful_changes"] == 2
+
+    second = engine.generate_tuning_recommendations([pattern])
+    assert sorted(map(id, second)) == first_ids
+    cleanup = next(r for r in second if r.parameter_name == "memory_cleanup_interval")
+    assert cleanup.current_value == engine.tuning_params.memory_cleanup_interval
+    assert len(engine._rec_pool) == 2
+    print("✅ Tuning recommendations are recycled between cycles")
+
+
+def test_unchanged_window_reuses_patterns(monkeypatch):
+    """Identical detection windows skip the detectors but still record history."""
+    engine = AutoTuningEngine()
+    plateau = {
+        "success_rate": 0.99,
+        "avg_processing_time": 0.8,
+        "cpu_usage_percent": 10.0,
+        "active_workers": 20,
+        "queue_length": 0,
+    }
+    for _ in range(25):
+        engine.collect_performance_sample(plateau)
+
+    calls = []
+
+    def counting_window_stats(window):
+        calls.append(len(window["timestamp"]))
+        return _compute_window_stats(window)
+
+    monkeypatch.setattr(
+        auto_tuning_engine, "_compute_window_stats", counting_window_stats
+    )
+
+    first = engine.detect_performance_patterns()
+    engine.collect_performance_sample(plateau)  # Window contents unchanged
+    second = engine.detect_performance_patterns()
+    assert calls == [20]
+    assert second == first and first
+    assert len(engine.pattern_history) == 2 * len(first)
+
+    engine.collect_performance_sample(dict(plateau, queue_length=1))
+    engine.detect_performance_patterns()
+    assert calls == [20, 20]
+
+    print("✅ Unchanged detection windows reuse their patterns")
+
+
+def test_current_parameters_follow_tuning_params():
+    """Direct edits to, or replacement of, tuning_params are always visible."""
+    engine = AutoTuningEngine()
+    assert engine.get_current_parameters()["max_workers"] == (
+        engine.tuning_params.max_workers
+    )
+
+    engine.tuning_params.max_workers = 7
+    assert engine.get_current_parameters()["max_workers"] == 7
+
+    engine.tuning_params = auto_tuning_engine.TuningParameters(max_workers=3)
+    params = engine.get_current_parameters()
+    assert params["max_workers"] == 3
+    params["max_workers"] = 99
+    assert engine.tuning_params.max_workers == 3
+    print("✅ Current parameters track tuning_params")
+
+
+def test_tuning_statistics_are_private_dicts():
+    """Statistics come back as plain dicts that callers may modify."""
+    engine = AutoTuningEngine()
+    stats = engine.get_tuning_statistics()
+    assert type(stats) is dict
+
+    stats["optimization_cycles"] = 42
+    again = engine.get_tuning_statistics()
+    assert again["optimization_cycles"] == 0
+    assert again is not stats
+    print("✅ Tuning statistics are returned as private dicts")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
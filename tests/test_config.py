@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Test Configuration
+Validates lazy construction and memoization of the shared configuration.
+"""
+
+import json
+
+import config
+from config import (
+    AppConfig,
+    OptimizationConfig,
+    ScraperConfig,
+    get_config,
+    get_config_value,
+    load_unified_config,
+    merge_config_deep,
+)
+
+
+def test_config_is_built_once():
+    """The module-level config resolves to the memoized get_config() result."""
+    app_config = get_config()
+
+    assert isinstance(app_config, AppConfig)
+    assert get_config() is app_config
+    assert config.config is app_config
+    assert config.scraper_config is app_config.SCRAPER
+    assert config.optimization_config is app_config.OPTIMIZATION
+    assert config.testing_config is app_config.TESTING
+    print("✅ Shared configuration is built once")
+
+
+def test_unknown_module_attribute_raises():
+    """Lazy module attributes don't hide genuinely missing names."""
+    try:
+        config.NOT_A_SETTING
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Expected AttributeError")
+    print("✅ Unknown module attributes raise AttributeError")
+
+
+def test_presets_are_memoized():
+    """Preset factories return the same instance on repeated calls."""
+    for factory in (
+        OptimizationConfig.create_minimal_config,
+        OptimizationConfig.create_development_config,
+        OptimizationConfig.create_production_config,
+    ):
+        assert factory() is factory()
+
+    minimal = OptimizationConfig.create_minimal_config()
+    assert isinstance(minimal, OptimizationConfig)
+    assert minimal.BROWSER_REUSE_ENABLED is True
+    assert minimal.MONITORING_ENABLED is False
+    assert minimal.MAX_MEMORY_MB == OptimizationConfig.MAX_MEMORY_MB
+
+    # Presets override launch options without touching the shared default
+    default_headless = OptimizationConfig.BROWSER_LAUNCH_OPTIONS["headless"]
+    development = OptimizationConfig.create_development_config()
+    production = OptimizationConfig.create_production_config()
+    assert development.BROWSER_LAUNCH_OPTIONS["headless"] is False
+    assert production.BROWSER_LAUNCH_OPTIONS["headless"] is True
+    assert OptimizationConfig.BROWSER_LAUNCH_OPTIONS["headless"] is default_headless
+    assert isinstance(OptimizationConfig.BROWSER_LAUNCH_OPTIONS["args"], tuple)
+    assert (
+        development.BROWSER_LAUNCH_OPTIONS["args"]
+        is OptimizationConfig.BROWSER_LAUNCH_OPTIONS["args"]
+    )
+    try:
+        OptimizationConfig.BROWSER_LAUNCH_OPTIONS["headless"] = False
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Expected read-only launch options")
+    print("✅ Optimization presets are memoized")
+
+
+def test_config_objects_have_no_instance_dict():
+    """Config objects are slotted; settings resolve to class attributes."""
+    app_config = get_config()
+    for obj in (
+        app_config,
+        app_config.SCRAPER,
+        app_config.OPTIMIZATION,
+        app_config.TESTING,
+        ScraperConfig(),
+    ):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    assert app_config.SCRAPER.MAX_WORKERS == ScraperConfig.MAX_WORKERS
+    print("✅ Config objects have no per-instance dict")
+
+
+def test_env_helpers_parse_snapshot():
+    """Typed helpers parse set values and return typed defaults otherwise."""
+    saved = dict(config._ENV)
+    try:
+        config._ENV.clear()
+        config._ENV.update({"X_INT": "7", "X_FLOAT": "2.5", "X_BOOL": "TRUE"})
+
+        assert config._env_int("X_INT", 1) == 7
+        assert config._env_float("X_FLOAT", 1.0) == 2.5
+        assert config._env_bool("X_BOOL", False) is True
+        assert config._env_str("X_INT", "default") == "7"
+
+        assert config._env_int("MISSING", 500) == 500
+        assert config._env_float("MISSING", 0.05) == 0.05
+        assert config._env_bool("MISSING", True) is True
+        assert config._env_str("MISSING", "INFO") == "INFO"
+    finally:
+        config._ENV.clear()
+        config._ENV.update(saved)
+
+    print("✅ Environment helpers parse the snapshot")
+
+
+def test_unified_config_applies_overrides():
+    """Overrides replace only the values they name."""
+    default = load_unified_config()
+    assert load_unified_config({}, None) == default
+    assert default["scraper"]["parallel"]["max_workers"] == ScraperConfig.MAX_WORKERS
+
+    unified = load_unified_config({"parallel": {"max_workers": 5}})
+    assert unified["scraper"]["parallel"]["max_workers"] == 5
+    assert unified["scraper"]["timing"] == default["scraper"]["timing"]
+    assert unified["optimization"] == default["optimization"]
+
+    listed = load_unified_config(None, {"extra": [1, 2]})
+    assert listed["optimization"]["extra"] == [1, 2]
+    print("✅ Unified configuration applies overrides")
+
+
+def test_unified_config_mutation_does_not_leak():
+    """Changing a returned config, or the overrides, never affects later calls."""
+    default = load_unified_config()
+    expected_default = load_unified_config()
+    default["scraper"]["parallel"]["max_workers"] = -1
+    default["scraper"]["timing"]["page_load_timeout"] = -1
+    default["new_section"] = {}
+    assert load_unified_config() == expected_default
+
+    overrides = {"parallel": {"max_workers": 5}, "extra": {"items": [1]}}
+    first = load_unified_config(overrides)
+    first["scraper"]["parallel"]["max_workers"] = -1
+    first["scraper"]["timing"]["dom_operation_timeout"] = -1
+    first["scraper"]["extra"]["items"].append(2)
+    overrides["extra"]["items"].append(3)
+
+    second = load_unified_config(
+        {"parallel": {"max_workers": 5}, "extra": {"items": [1]}}
+    )
+    assert second["scraper"]["parallel"]["max_workers"] == 5
+    assert second["scraper"]["extra"]["items"] == [1]
+    assert second["scraper"]["timing"] == expected_default["scraper"]["timing"]
+
+    listed = load_unified_config({"extra": [1, 2]})
+    listed["scraper"]["timing"]["page_load_timeout"] = -1
+    assert load_unified_config() == expected_default
+    print("✅ Mutating a returned unified config does not leak")
+
+
+def test_config_summary_returns_fresh_dicts():
+    """Each get_config_summary call builds its own dictionary."""
+    app_config = AppConfig()
+    summary = app_config.get_config_summary()
+    assert summary["scraper"]["max_workers"] == app_config.SCRAPER.MAX_WORKERS
+
+    summary["scraper"]["max_workers"] = -1
+    assert app_config.get_config_summary()["scraper"]["max_workers"] == (
+        app_config.SCRAPER.MAX_WORKERS
+    )
+    print("✅ Configuration summary is built fresh")
+
+
+def test_config_summary_json_matches_summary():
+    """The serialized summary is built once and decodes to the summary."""
+    app_config = AppConfig()
+    summary_json = app_config.get_config_summary_json()
+
+    assert isinstance(summary_json, bytes)
+    assert app_config.get_config_summary_json() is summary_json
+    assert json.loads(summary_json) == app_config.get_config_summary()
+    print("✅ Configuration summary JSON matches the summary")
+
+
+def test_get_config_value_walks_dotted_paths():
+    """Dotted paths resolve nested values and fall back to the default."""
+    unified = load_unified_config({"parallel": {"max_workers": 7}})
+
+    assert get_config_value(unified, "scraper.parallel.max_workers") == 7
+    parallel = unified["scraper"]["parallel"]
+    assert get_config_value(unified, "scraper.parallel") == parallel
+    assert get_config_value(unified, "version") == unified["version"]
+    assert get_config_value(unified, "scraper.missing", 42) == 42
+    assert get_config_value(unified, "version.major", "default") == "default"
+    print("✅ get_config_value walks dotted paths")
+
+
+def test_merge_config_deep_copies_only_overridden_paths():
+    """Deep merge leaves its inputs untouched and shares unchanged subtrees."""
+    base = {"a": {"b": {"c": 1, "d": 2}, "e": {"f": 3}}, "g": 4}
+    override = {"a": {"b": {"c": 10, "x": {"y": 1}}}, "g": {"h": 5}}
+
+    merged = merge_config_deep(base, override)
+
+    assert merged == {
+        "a": {"b": {"c": 10, "d": 2, "x": {"y": 1}}, "e": {"f": 3}},
+        "g": {"h": 5},
+    }
+    assert base == {"a": {"b": {"c": 1, "d": 2}, "e": {"f": 3}}, "g": 4}
+    assert merged["a"]["e"] is base["a"]["e"]
+    assert merged["a"]["b"] is not base["a"]["b"]
+    print("✅ Deep merge copies only overridden paths")
+
+
+def test_validate_config_reports_every_error(capsys):
+    """Valid configs pass silently; invalid ones list each failed check."""
+    app_config = AppConfig()
+    assert app_config.validate_config() is True
+    assert capsys.readouterr().out == ""
+
+    app_config.SCRAPER = type("BadScraper", (ScraperConfig,), {"MAX_WORKERS": 0})()
+    app_config.OPTIMIZATION = OptimizationConfig._preset(MAX_MEMORY_MB=0)
+    assert app_config.validate_config() is False
+
+    out = capsys.readouterr().out
+    assert "MAX_WORKERS must be positive" in out
+    assert "MAX_MEMORY_MB must be positive" in out
+    assert "PAGE_LOAD_TIMEOUT" not in out
+    print("✅ validate_config reports every error")
+
+
+if __name__ == "__main__":
+    test_config_is_built_once()
+    test_unknown_module_attribute_raises()
+    test_presets_are_memoized()
+    test_config_objects_have_no_instance_dict()
+    test_env_helpers_parse_snapshot()
+    test_unified_config_applies_overrides()
+    test_unified_config_mutation_does_not_leak()
+    test_config_summary_returns_fresh_dicts()
+    test_get_config_value_walks_dotted_paths()
+    test_config_summary_json_matches_summary()
+    test_merge_config_deep_copies_only_overridden_paths()
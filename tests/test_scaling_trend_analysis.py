@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Test Scaling Trend Analysis
+Validates the vectorized trend slopes used by the adaptive scaling engine.
+"""
+
+import json
+import random
+import statistics
+import time
+from collections import deque
+
+import pytest
+
+import adaptive_scaling_engine
+from adaptive_scaling_engine import (
+    PerformanceHistoryBuffer,
+    PerformanceMetrics,
+    ScalingDecision,
+    analyze_performance_trends_for_scaling,
+    calculate_trend_slopes,
+    get_scaling_config,
+    get_scaling_status,
+    make_scaling_decision_simple,
+    run_adaptive_scaling_cycle,
+    smoothed_trend_slope,
+)
+
+
+@pytest.fixture
+def backend_module():
+    """Module whose NUMPY_AVAILABLE flag numpy_backend toggles."""
+    return adaptive_scaling_engine
+
+
+@pytest.fixture
+def fresh_history(monkeypatch):
+    """Swap in empty module-level performance and scaling histories."""
+    history = PerformanceHistoryBuffer(capacity=100)
+    monkeypatch.setattr(adaptive_scaling_engine, "_performance_history", history)
+    monkeypatch.setattr(adaptive_scaling_engine, "_scaling_history", deque(maxlen=50))
+    return history
+
+
+def record_success_rates(history, timestamps, success_rates):
+    """Append one sample per (timestamp, success rate) pair."""
+    for timestamp, success_rate in zip(timestamps, success_rates):
+        history.append(
+            PerformanceMetrics(
+                timestamp=timestamp, success_rate=success_rate, avg_page_load_time=1.0
+            )
+        )
+
+
+def reference_slope(values):
+    """Straightforward least-squares slope over the sample index."""
+    n = len(values)
+    x_mean = (n - 1) / 2.0
+    y_mean = sum(values) / n
+    numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+def test_trend_slopes_match_reference(numpy_backend):
+    """Vectorized and scalar slopes should both match the reference OLS slope."""
+    rng = random.Random(42)
+
+    for n in (2, 3, 15, 100):
+        scores = [rng.random() for _ in range(n)]
+        success = [rng.uniform(0.8, 1.0) for _ in range(n)]
+        response = [rng.uniform(0.5, 6.0) for _ in range(n)]
+        expected = (
+            reference_slope(scores),
+            reference_slope(success),
+            reference_slope(response),
+            statistics.variance(scores),
+        )
+        result = calculate_trend_slopes(scores, success, response)
+        for got, want in zip(result, expected):
+            assert abs(got - want) < 1e-9, f"n={n}: {got} != {want}"
+
+    print("✅ Trend slopes match reference implementation")
+
+
+def test_trend_slopes_insufficient_data():
+    """A single sample has no trend."""
+    assert calculate_trend_slopes([0.5], [1.0], [2.0]) == (0.0, 0.0, 0.0, 0.0)
+    print("✅ Single-sample trend is flat")
+
+
+def test_smoothed_slope_is_exact_on_quadratics(numpy_backend):
+    """A polyorder-2 filter recovers the derivative of a quadratic exactly."""
+    n = 30
+    values = [0.3 + 0.02 * i - 0.001 * i * i for i in range(n)]
+    centres = range(5, n - 5)
+    expected = sum(0.02 - 0.002 * i for i in centres) / len(centres)
+
+    assert abs(smoothed_trend_slope(values) - expected) < 1e-9
+
+    print("✅ Smoothed slope matches the analytic derivative")
+
+
+def test_history_buffer_wraps_oldest_first(numpy_backend):
+    """The ring buffer keeps the newest rows and returns them in order."""
+    history = PerformanceHistoryBuffer(capacity=5)
+    for i in range(8):
+        history.append(
+            PerformanceMetrics(
+                timestamp=float(i), success_rate=0.9, avg_page_load_time=i
+            )
+        )
+
+    assert len(history) == 5
+    timestamps, scores, success, response = history.columns_since(-1.0)
+    assert list(timestamps) == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert list(response) == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert list(success) == [0.9] * 5
+
+    timestamps, _, _, _ = history.columns_since(5.0)
+    assert list(timestamps) == [6.0, 7.0]
+
+    print("✅ History buffer wraps and filters correctly")
+
+
+def test_history_buffer_running_variance():
+    """The running score variance tracks the buffer contents across evictions."""
+    rng = random.Random(7)
+    history = PerformanceHistoryBuffer(capacity=10)
+    assert history.score_variance() == 0.0
+
+    for i in range(25):
+        history.append(
+            PerformanceMetrics(
+                timestamp=float(i),
+                success_rate=rng.random(),
+                avg_page_load_time=rng.uniform(0.5, 6.0),
+            )
+        )
+        _, scores, _, _ = history.columns_since(-1.0)
+        if len(scores) >= 2:
+            expected = statistics.variance(list(scores))
+            assert abs(history.score_variance() - expected) < 1e-9
+
+    print("✅ Running score variance matches full recomputation")
+
+
+def test_two_point_trend_has_no_confidence(fresh_history):
+    """Two points always fit a line exactly, so they earn no confidence."""
+    now = 10_000.0
+    record_success_rates(fresh_history, (0.0, now - 10, now - 5), (0.9, 0.2, 0.9))
+
+    trend = analyze_performance_trends_for_scaling(lookback_minutes=1, tick_time=now)
+    assert trend["status"] == "analyzed"
+    assert trend["data_points"] == 2
+    assert trend["performance_trend"] > 0
+    assert trend["confidence"] == 0.0
+    print("✅ Two-point trends carry zero confidence")
+
+
+def test_flat_trend_has_no_confidence(fresh_history):
+    """A flat, noise-free series has no trend to be confident about."""
+    record_success_rates(fresh_history, [float(i) for i in range(6)], [0.9] * 6)
+
+    trend = analyze_performance_trends_for_scaling(tick_time=6.0)
+    assert trend["data_points"] == 6
+    assert trend["confidence"] == 0.0
+    print("✅ Flat trends carry zero confidence")
+
+
+def test_trend_confidence_weighs_rise_against_residuals(fresh_history):
+    """Confidence grows from the OLS rise relative to the residual spread."""
+    success_rates = (0.5, 0.6, 0.58, 0.75, 0.8)
+    record_success_rates(fresh_history, [float(i) for i in range(5)], success_rates)
+
+    trend = analyze_performance_trends_for_scaling(tick_time=5.0)
+    _, scores, _, _ = fresh_history.columns_since(-1.0)
+    scores = list(scores)
+    n = len(scores)
+    slope = reference_slope(scores)
+    x_mean = (n - 1) / 2.0
+    intercept = sum(scores) / n - slope * x_mean
+    residual_std = (
+        sum((y - (intercept + slope * i)) ** 2 for i, y in enumerate(scores)) / (n - 2)
+    ) ** 0.5
+    rise = abs(slope) * (n - 1)
+
+    assert abs(trend["confidence"] - rise / (rise + residual_std)) < 1e-9
+    assert 0.0 < trend["confidence"] < 1.0
+    print("✅ Trend confidence compares rise and residuals from one fit")
+
+
+def test_simple_decisions_record_history(fresh_history):
+    """Simple scaling decisions must feed the trend-analysis history."""
+    decision = make_scaling_decision_simple(
+        {"success_rate": 0.95, "avg_processing_time": 1.0, "active_workers": 50}
+    )
+
+    assert decision["action"] in ("scale_up", "scale_down", "no_change")
+    assert len(fresh_history) == 1
+    print("✅ Simple scaling decisions are recorded in performance history")
+
+
+def test_cooldown_cycles_still_record_history(fresh_history, monkeypatch):
+    """Cycles inside the cooldown skip the decision logic but keep sampling."""
+    action = ScalingDecision(
+        timestamp=time.time(),
+        action="scale_up",
+        current_workers=50,
+        target_workers=60,
+        reasoning="test action",
+        confidence=1.0,
+        performance_score=0.7,
+        resource_capacity=0.4,
+    )
+    adaptive_scaling_engine._scaling_history.append(action)
+    monkeypatch.setattr(adaptive_scaling_engine, "_last_scaling_time", action.timestamp)
+
+    def no_resource_collection(tick_time=None):
+        raise AssertionError("resources collected during the cooldown")
+
+    monkeypatch.setattr(
+        adaptive_scaling_engine, "collect_resource_availability", no_resource_collection
+    )
+
+    for cycle in range(1, 4):
+        decision = run_adaptive_scaling_cycle()
+        assert decision.action == "no_change"
+        assert decision.reasoning.startswith("Cooldown period active")
+        assert decision.resource_capacity == 0.4
+        assert len(fresh_history) == cycle
+
+    _, scores, _, _ = fresh_history.columns_since(-1.0)
+    assert decision.performance_score == scores[-1]
+    print("✅ Cooldown cycles keep recording performance history")
+
+
+def test_status_embeds_plain_config_dict():
+    """Status payloads carry the config as a plain, JSON-ready dict."""
+    status = get_scaling_status()
+
+    assert type(status["config"]) is dict
+    assert status["config"] == get_scaling_config().to_dict()
+    json.dumps(status["config"])
+    print("✅ Scaling status embeds a plain config dict")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
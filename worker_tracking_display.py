@@ -121,13 +121,11 @@ from data_structures import ParallelWorkerContext
 # This configuration dictionary controls what information is displayed during scraping operations
 # Each setting can be controlled via environment variables or programmatically via update_worker_tracking_config()
 #
-# Configuration Pattern Explanation:
-# os.getenv("ENV_VAR_NAME", "default_value").lower() == "true"
-# │         │                │                │        └─ Converts to boolean (only "true" becomes True)
-# │         │                │                └─ Converts to lowercase for case-insensitive comparison
-# │         │                └─ Default value if environment variable is not set
-# │         └─ Environment variable name to check
-# └─ Gets environment variable value
+# Configuration Pattern Explanation (config.py):
+# _env_bool("ENV_VAR_NAME", default)
+# │         │               └─ Typed default used when the variable is not set
+# │         └─ Environment variable name, looked up in a snapshot taken at import
+# └─ Returns True only for "true" in any case
 #
 # Environment Variable Settings (set these in your shell or .env file):
 # SCRAPER_SHOW_SCALING=true/false     - Show worker scaling decisions (scale up/down events)
@@ -1041,6 +1039,21 @@ _browser_pool_status: Dict[str, Any] = {}  # Legacy: Browser pool status info
 # They allow dynamic adjustment of tracking settings without restarting the application.
 
 
+# Mapping from worker tracking config keys to ScraperConfig attributes
+TRACKING_CONFIG_ATTRIBUTES = {
+    "SHOW_SCALING": "SHOW_SCALING",
+    "SHOW_CREATED": "SHOW_WORKER_CREATED",
+    "SHOW_STATE": "SHOW_WORKER_STATE",
+    "SHOW_COMPLETED": "SHOW_WORKER_COMPLETED",
+    "SHOW_ERRORS": "SHOW_WORKER_ERRORS",
+    "SHOW_STATUS": "SHOW_WORKER_STATUS",
+    "SHOW_HIERARCHY": "SHOW_WORKER_HIERARCHY",
+    "SHOW_BROWSER_POOL": "SHOW_BROWSER_POOL",
+    "SHOW_QUEUE_ANALYSIS": "SHOW_QUEUE_ANALYSIS",
+    "MAX_RECENT_COMPLETIONS": "MAX_RECENT_COMPLETIONS",
+}
+
+
 def get_worker_tracking_config() -> Dict[str, Any]:
     """
     Get current worker tracking configuration.
@@ -1082,23 +1095,9 @@ def update_worker_tracking_config(**kwargs) -> None:
             VERBOSITY_LEVEL="debug"
         )
     """
-    # Mapping from old config keys to ScraperConfig attributes
-    key_mapping = {
-        "SHOW_SCALING": "SHOW_SCALING",
-        "SHOW_CREATED": "SHOW_WORKER_CREATED",
-        "SHOW_STATE": "SHOW_WORKER_STATE",
-        "SHOW_COMPLETED": "SHOW_WORKER_COMPLETED",
-        "SHOW_ERRORS": "SHOW_WORKER_ERRORS",
-        "SHOW_STATUS": "SHOW_WORKER_STATUS",
-        "SHOW_HIERARCHY": "SHOW_WORKER_HIERARCHY",
-        "SHOW_BROWSER_POOL": "SHOW_BROWSER_POOL",
-        "SHOW_QUEUE_ANALYSIS": "SHOW_QUEUE_ANALYSIS",
-        "MAX_RECENT_COMPLETIONS": "MAX_RECENT_COMPLETIONS",
-    }
-
     for key, value in kwargs.items():
-        if key in key_mapping:
-            setattr(ScraperConfig, key_mapping[key], value)
+        if key in TRACKING_CONFIG_ATTRIBUTES:
+            setattr(ScraperConfig, TRACKING_CONFIG_ATTRIBUTES[key], value)
 
 
 def is_worker_tracking_enabled(feature: str) -> bool:
@@ -1111,8 +1110,9 @@ def is_worker_tracking_enabled(feature: str) -> bool:
     Returns:
         Boolean indicating if the feature is enabled
     """
-    config_dict = get_worker_tracking_config()
-    return config_dict.get(feature, False)
+    # Read the one setting directly instead of building the whole config dict
+    attribute = TRACKING_CONFIG_ATTRIBUTES.get(feature)
+    return getattr(ScraperConfig, attribute) if attribute else False
 
 
 # ============================================================================